@@ -5,7 +5,7 @@ from pandasdmx.api import Request, read_url, install_schemas
 from pandasdmx.reader import read_sdmx
 from pandasdmx.source import add_source, list_sources
 from pandasdmx.util import Resource
-from pandasdmx.writer import to_pandas, to_xml
+from pandasdmx.writer import to_arrow, to_pandas, to_parquet, to_xml
 import logging
 
 __all__ = [
@@ -16,7 +16,9 @@ __all__ = [
     "logger",
     "read_sdmx",
     "read_url",
+    "to_arrow",
     "to_pandas",
+    "to_parquet",
     "to_xml",
 ]
 
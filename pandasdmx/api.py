@@ -7,13 +7,14 @@ guidelines.
 """
 import logging
 from functools import partial
+from itertools import compress
 from typing import Dict
 from warnings import warn
 
 import requests
 
 from . import remote
-from .reader import get_reader_for_content_type
+from .reader import convert, convert_options, get_reader_for_content_type, sdmxjson
 from .message import Message
 from pandasdmx import model
 from .model import DataStructureDefinition, MaintainableArtefact, ValidationLevels
@@ -407,6 +408,10 @@ class Request:
             HTTP headers. Given headers will overwrite instance-wide headers
             passed to the constructor. Default: :obj:`None` to use the default
             headers of the :attr:`source`.
+        json_backend : str
+            For SDMX-JSON responses: name of the module used to decode the
+            response, e.g. "orjson". Ignored for SDMX-ML responses. See
+            :meth:`.sdmxjson.Reader.read_message`.
         key : str or dict
             For queries with `resource_type='data'`. :class:`str` values are
             not validated; :class:`dict` values are validated using
@@ -429,6 +434,11 @@ class Request:
         resource : :class:`~.MaintainableArtefact` subclass
             Object to retrieve. If given, `resource_type` and `resource_id` are
             ignored.
+        to : 'pandas'
+            Return the data as :mod:`pandas` objects instead of a
+            :class:`~.DataMessage`, as with :func:`.read_sdmx`. The keyword arguments
+            `attributes`, `constraint`, `datetime`, `dtype`, `dtypes_from_dsd`, and
+            `rtype` are passed to :func:`.to_pandas`.
         version : str
             :attr:`~.VersionableArtefact.version>` of a resource to retrieve.
             Default: the keyword 'latest'.
@@ -437,7 +447,7 @@ class Request:
         
         :class:`~.Message` or :class:`~requests.Request`
             The requested SDMX message or, if `dry_run` is :obj:`True`, the
-            prepared request object.
+            prepared request object. With `to`, :mod:`pandas` object(s).
 
         Raises:
         
@@ -447,6 +457,11 @@ class Request:
 
         """
         
+        # Options for the reader and writer, not the query
+        options = dict(json_backend=kwargs.pop("json_backend", None))
+        to = kwargs.pop("to", None)
+        write_options = convert_options(to, options, kwargs)
+
         kwargs.update(resource_type=resource_type, resource_id=resource_id)
         self._handle_get_kwargs(kwargs)
 
@@ -462,10 +477,15 @@ class Request:
         logger.info("Requesting resource from %s", req.url)
         logger.info("with headers %s" % req.headers)
 
+        # Key for the memory cache. Messages read with engine="columnar" for
+        # to="pandas" are stored apart from those returned without `to`.
+        engine = options.get("engine")
+        cache_key = req.url if engine is None else f"{req.url} engine={engine}"
+
         # Try to get resource from memory cache if specified
         if use_cache:
             try:
-                return self.cache[req.url]
+                return convert(self.cache[cache_key], to, **write_options)
             except KeyError:
                 logger.info("Not found in cache")
                 pass
@@ -474,7 +494,8 @@ class Request:
             return req
 
         try:
-            response = self.session.send(req, timeout=self.timeout)
+            # Stream the response so that it is parsed while being received
+            response = self.session.send(req, timeout=self.timeout, stream=True)
             response.raise_for_status()
         except requests.exceptions.ConnectionError as e:
             raise e from None
@@ -511,7 +532,13 @@ class Request:
         reader = Reader()
 
         # Parse the message, using any provided or auto-queried DSD
-        msg = reader.read_message(response_content, dsd=kwargs.get("dsd", None))
+        if not isinstance(reader, sdmxjson.Reader):
+            options.pop("json_backend")
+        msg = reader.read_message(
+            response_content,
+            dsd=kwargs.get("dsd", None),
+            **{name: value for name, value in options.items() if value is not None},
+        )
 
         # Store the HTTP response with the message
         msg.response = response
@@ -521,9 +548,9 @@ class Request:
 
         # store in memory cache if needed
         if use_cache:
-            self.cache[req.url] = msg
+            self.cache[cache_key] = msg
 
-        return msg
+        return convert(msg, to, **write_options)
 
 
     def _handle_get_kwargs(self, kwargs):
@@ -581,7 +608,7 @@ class Request:
             cc = dsd.make_constraint(key)
 
             # Filter the keys
-            return [k for k in all_keys if k in cc]
+            return list(compress(all_keys, cc.mask(all_keys)))
         else:
             # No key is provided
             return list(all_keys)
@@ -643,6 +670,7 @@ def install_schemas(schema_dir=None, **kwargs):
         
     Returns None on success.
     """
+    from io import BytesIO
     from zipfile import ZipFile
     from .reader.sdmxml import Reader
     from pathlib import Path
@@ -651,8 +679,7 @@ def install_schemas(schema_dir=None, **kwargs):
     url = "https://sdmx.org/wp-content/uploads/SDMX_2-1_SECTION_3B_SDMX_ML_Schemas_Samples_2020-07.zip"
     logger.info("Downloading SDMX 2.1 Standard, Section 3b from www.sdmx.org...")
     response = requests.get(url=url, **kwargs)
-    content = remote.ResponseIO(response)
-    zf = ZipFile(content.tee)
+    zf = ZipFile(BytesIO(response.content))
     logger.info("Done.")
     schema_dir = Path(schema_dir or Reader.get_schema_dir())
     # Create any non-existent dirs
@@ -29,8 +29,9 @@ from datetime import date, datetime, timedelta
 from enum import Enum
 from functools import lru_cache
 from inspect import isclass
-from itertools import product
-from operator import attrgetter, itemgetter
+from math import isnan
+from itertools import chain, combinations, product
+from operator import attrgetter, eq, is_, itemgetter
 from typing import (
     Any,
     Dict,
@@ -39,6 +40,7 @@ from typing import (
     Iterable,
     List,
     Mapping,
+    NamedTuple,
     Optional,
     Sequence,
     Set,
@@ -49,6 +51,9 @@ from typing import (
 )
 from warnings import warn
 
+import numpy as np
+from pydantic import PrivateAttr
+
 from pandasdmx.util import (
     BaseModel,
     DictLike,
@@ -859,6 +864,68 @@ class Component(IdentifiableArtefact):
 CT = TypeVar("CT", bound=Component)
 
 
+class _Components(list):
+    """List of components, with an index of the first component having each ID.
+
+    :meth:`append` and :meth:`extend` update the index; other methods that modify the
+    list rebuild it. Either way, :attr:`version` is incremented.
+    """
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.version = 0
+        self.reindex()
+
+    def reindex(self):
+        self.index_by_id = {}
+        for c in self:
+            self.index_by_id.setdefault(c.id, c)
+        self.version += 1
+
+    def append(self, value):
+        super().append(value)
+        self.index_by_id.setdefault(value.id, value)
+        self.version += 1
+
+    def extend(self, values):
+        for value in values:
+            self.append(value)
+
+    def __iadd__(self, values):
+        self.extend(values)
+        return self
+
+    def __reduce_ex__(self, protocol):
+        # Rebuild the index from the items when copied or unpickled
+        return self.__class__, (list(self),)
+
+
+def _reindexing(name):
+    method = getattr(list, name)
+
+    def wrapper(self, *args):
+        result = method(self, *args)
+        self.reindex()
+        return result
+
+    return wrapper
+
+
+for _name in (
+    "__delitem__",
+    "__imul__",
+    "__setitem__",
+    "clear",
+    "insert",
+    "pop",
+    "remove",
+    "reverse",
+    "sort",
+):
+    setattr(_Components, _name, _reindexing(_name))
+del _name
+
+
 class ComponentList(IdentifiableArtefact, Generic[CT]):
     #:
     components: List[CT] = []
@@ -869,18 +936,34 @@ class ComponentList(IdentifiableArtefact, Generic[CT]):
     # ItemScheme._Item
     _Component: Type = Component
 
+    @validator("components", always=True)
+    def _index_components(cls, v):
+        return _Components(v)
+
     # Convenience access to the components
     def append(self, value: CT):
         """Append *value* to :attr:`components`."""
         self.components.append(value)
 
+    def _index(self) -> Dict[str, CT]:
+        if not isinstance(self.components, _Components):
+            # Bypassed validation, e.g. with construct()
+            self.__dict__["components"] = _Components(self.components)
+        return self.components.index_by_id
+
     def get(self, id) -> CT:
         """Return the component with the given *id*."""
-        # Search for an existing Component
-        for c in self.components:
-            if c.id == id:
-                return c
-        raise KeyError(id)
+        try:
+            return self._index()[id]
+        except (KeyError, TypeError):  # TypeError: unhashable id
+            raise KeyError(id) from None
+
+    def __contains__(self, value) -> bool:
+        """Return :obj:`True` if `value` or a component with ID `value` is included."""
+        if isinstance(value, str):
+            return value in self._index()
+        c = self._index().get(getattr(value, "id", None))
+        return c is not None and (c is value or c == value)
 
     def getdefault(self, id, cls=None, **kwargs) -> CT:
         """Return or create the component with the given *id*.
@@ -1256,6 +1339,34 @@ class CubeRegion(BaseModel):
         # Return the correct sense
         return result is self.included
 
+    def mask(self, keys) -> np.ndarray:
+        """Return a boolean array: for each of `keys`, whether it is in the region.
+
+        The result is the same as ``[key in cr for key in keys]``, but membership is
+        determined for all keys at once, one dimension at a time.
+
+        Parameters
+        ----------
+        keys : pandas.MultiIndex or pandas.DataFrame or sequence of Key
+            For :mod:`pandas` objects, the index level names or column names are
+            dimension IDs.
+        """
+        n, columns = _key_columns(keys, self._ids())
+        return self._mask(n, columns)
+
+    def _ids(self) -> Set[str]:
+        return {ms.values_for.id for ms in self.member.values()}
+
+    def _mask(self, n, columns) -> np.ndarray:
+        result = np.ones(n, dtype=bool)
+        for ms in self.member.values():
+            values = [mv.value for mv in ms.values if isinstance(mv, MemberValue)]
+            isin = _isin(columns, ms.values_for.id, values)
+            result &= isin if ms.included else ~isin
+
+        # Return the correct sense
+        return result if self.included else ~result
+
     def to_query_string(self, structure):
         all_values = []
 
@@ -1276,6 +1387,34 @@ class CubeRegion(BaseModel):
         )
 
 
+def _key_columns(keys, ids: Set[str]) -> Tuple[int, Any]:
+    """Return the length of `keys`, and their values for dimensions with `ids`.
+
+    :mod:`pandas` objects are returned as-is; for a sequence of :class:`Key`, the
+    result is a :class:`dict` mapping each of `ids` to a list of values.
+    """
+    if hasattr(keys, "isin"):
+        return len(keys), keys
+
+    keys = list(keys)
+    return len(keys), {id: [key.values[id].value for key in keys] for id in ids}
+
+
+def _isin(columns, id: str, values: List[str]) -> np.ndarray:
+    """Return a boolean array: whether each value for dimension `id` is in `values`."""
+    if hasattr(columns, "columns"):
+        # pandas.DataFrame
+        return columns[id].isin(values).to_numpy()
+    elif hasattr(columns, "isin"):
+        # pandas.Index or pandas.MultiIndex; uses the codes of the level
+        return columns.isin(values, level=id)
+    else:
+        column = columns[id]
+        return np.fromiter(
+            map(set(values).__contains__, column), dtype=bool, count=len(column)
+        )
+
+
 # (continued from §10.3)
 class ContentConstraint(Constraint):
     #: :class:`CubeRegions <.CubeRegion>` included in the ContentConstraint.
@@ -1292,6 +1431,32 @@ class ContentConstraint(Constraint):
                 "ContentConstraint does not contain a CubeRegion."
             )
 
+    def mask(self, keys) -> np.ndarray:
+        """Return a boolean array: for each of `keys`, whether it is in the constraint.
+
+        The result is the same as ``[key in cc for key in keys]``. Each
+        :class:`MemberSelection` in the :attr:`data_content_region` is evaluated for
+        all keys at once, as set membership of the values for one dimension; see
+        :meth:`.CubeRegion.mask`.
+
+        Example
+        -------
+        >>> cc = dsd.make_constraint({"CURRENCY": "JPY+USD"})
+        >>> df[cc.mask(df.index)]  # Rows of a pandas.DataFrame with these currencies
+        """
+        if not self.data_content_region:
+            raise NotImplementedError(
+                "ContentConstraint does not contain a CubeRegion."
+            )
+
+        n, columns = _key_columns(
+            keys, set().union(*[cr._ids() for cr in self.data_content_region])
+        )
+        result = np.ones(n, dtype=bool)
+        for cr in self.data_content_region:
+            result &= cr._mask(n, columns)
+        return result
+
     def to_query_string(self, structure):
         cr_count = len(self.data_content_region)
         try:
@@ -1306,6 +1471,8 @@ class ContentConstraint(Constraint):
         self,
         obj: Union["DataStructureDefinition", "DataflowDefinition"],
         dims: List[str] = [],
+        start: int = 0,
+        stop: Optional[int] = None,
     ) -> Generator["Key", None, None]:
         """Iterate over keys.
 
@@ -1319,7 +1486,7 @@ class ContentConstraint(Constraint):
         if obj not in self.content:
             log.warning(f"{repr(obj)} is not in {repr(self)}.content")
 
-        yield from obj.iter_keys(constraint=self, dims=dims)
+        yield from obj.iter_keys(self, dims, start, stop)
 
 
 class TimeDimension(DimensionComponent):
@@ -1468,14 +1635,285 @@ DimensionRelationship.update_forward_refs()
 GroupRelationship.update_forward_refs()
 
 
-class _NullConstraintClass:
-    """Constraint that allows anything."""
+def _value_id(value) -> str:
+    """ID of a :class:`Code` value, or the value itself."""
+    return getattr(value, "id", value)
 
-    def __contains__(self, value):
-        return True
 
+class _KeySpace:
+    """Keys of a :class:`DataStructureDefinition` allowed by a :class:`Constraint`.
 
-_NullConstraint = _NullConstraintClass()
+    The values of each dimension are filtered by the parts of the constraint that
+    concern that dimension only. The Cartesian product of these values gives candidate
+    keys, addressed by position. The rest of the constraint—any excluded
+    :class:`CubeRegion` with members for more than one dimension, and any
+    :class:`DataKeySet`—is applied to each candidate.
+
+    See :meth:`.DataStructureDefinition.iter_keys`.
+    """
+
+    def __init__(self, dsd, constraint=None, dims: List[str] = []):
+        dims = dims or [dim.id for dim in dsd.dimensions.components]
+        regions = getattr(constraint, "data_content_region", None) or []
+
+        #: Excluded CubeRegions not applied to single dimensions.
+        self.residual = [
+            cr for cr in regions if not cr.included and len(cr.member) != 1
+        ]
+        #: DataKeySet, if any.
+        self.data_keys = getattr(constraint, "data_content_keys", None)
+
+        #: Dimension IDs, and the candidate KeyValues for each.
+        self.ids: List[str] = []
+        self.values: List[List["KeyValue"]] = []
+
+        for dim in dsd.dimensions.components:
+            if (
+                dim.id not in dims
+                or dim.local_representation is None
+                or dim.local_representation.enumerated is None
+            ):
+                # `dim` is not enumerated by an ItemScheme, or not included in the
+                # `dims` argument and not to be iterated over. Create a placeholder.
+                kvs = [KeyValue(id=dim.id, value=f"({dim.id})", value_for=dim)]
+            else:
+                # Create a KeyValue for each Item in the ItemScheme
+                kvs = [
+                    KeyValue.construct(id=dim.id, value=value, value_for=dim)
+                    for value in dim.local_representation.enumerated
+                ]
+
+            # Filter through the members of CubeRegions for this dimension
+            for cr in regions:
+                if cr.included or len(cr.member) == 1:
+                    for ms in self._selections([cr], dim.id):
+                        kvs = [kv for kv in kvs if (kv in ms) is cr.included]
+
+            self.ids.append(dim.id)
+            self.values.append(kvs)
+
+    @staticmethod
+    def _selections(regions, id: str) -> List[MemberSelection]:
+        return [
+            ms for cr in regions for ms in cr.member.values() if ms.values_for.id == id
+        ]
+
+    def positions(self) -> int:
+        """Number of candidate keys."""
+        result = 1
+        for kvs in self.values:
+            result *= len(kvs)
+        return result
+
+    def _count(self, values: List[List["KeyValue"]], regions) -> int:
+        """Number of keys from `values` inside all of `regions`."""
+        result = 1
+        for id, kvs in zip(self.ids, values):
+            selections = self._selections(regions, id)
+            result *= sum(1 for kv in kvs if all(kv in ms for ms in selections))
+            if result == 0:
+                break
+        return result
+
+    def _count_outside(self, values: List[List["KeyValue"]]) -> int:
+        """Number of keys from `values` outside all of :attr:`residual`.
+
+        Uses the inclusion–exclusion principle; the cost is exponential in the number
+        of :attr:`residual` regions, but not in the number of keys.
+        """
+        return sum(
+            (-1) ** n * self._count(values, regions)
+            for n in range(len(self.residual) + 1)
+            for regions in combinations(self.residual, n)
+        )
+
+    def _data_key_values(self) -> Set[Tuple[Tuple[str, str], ...]]:
+        """Distinct (dimension ID, value) of the :attr:`data_keys`."""
+        return {
+            tuple(
+                sorted((c.id, _value_id(cv.value)) for c, cv in dk.key_value.items())
+            )
+            for dk in self.data_keys.keys
+        }
+
+    def count(self) -> int:
+        """Exact number of keys allowed by the constraint."""
+        total = self._count_outside(self.values)
+        if self.data_keys is None:
+            return total
+
+        data_keys = self._data_key_values()
+        if len({tuple(id for id, _ in dk) for dk in data_keys}) > 1:
+            raise NotImplementedError(
+                "count keys for a DataKeySet with keys for different dimensions"
+            )
+
+        # Keys matching each data key are disjoint: count those outside `residual`
+        matched = 0
+        for dk in map(dict, data_keys):
+            if set(dk) - set(self.ids):
+                continue  # Refers to a dimension not in the DSD
+            matched += self._count_outside(
+                [
+                    [kv for kv in kvs if _value_id(kv.value) == dk[id]]
+                    if id in dk
+                    else kvs
+                    for id, kvs in zip(self.ids, self.values)
+                ]
+            )
+
+        return matched if self.data_keys.included else total - matched
+
+    def _iter_positions(
+        self, start: int, stop: int
+    ) -> Iterable[Tuple["KeyValue", ...]]:
+        """Iterate over candidate KeyValues at positions from `start` to `stop`."""
+        if start == 0 and stop == self.positions():
+            yield from product(*self.values)
+            return
+
+        # Digits of `start` in the mixed-radix number system; last dimension fastest
+        radix = list(map(len, self.values))
+        digits, rest = [], start
+        for r in reversed(radix):
+            rest, d = divmod(rest, r)
+            digits.insert(0, d)
+        current = [kvs[d] for kvs, d in zip(self.values, digits)]
+
+        for _ in range(stop - start):
+            yield tuple(current)
+            # Increment the last digit, carrying to preceding ones
+            for i in reversed(range(len(radix))):
+                digits[i] += 1
+                if digits[i] < radix[i]:
+                    current[i] = self.values[i][digits[i]]
+                    break
+                digits[i] = 0
+                current[i] = self.values[i][0]
+
+    def keys(self, start: int = 0, stop: Optional[int] = None) -> Iterable["Key"]:
+        """Iterate over allowed keys at candidate positions `start` to `stop`."""
+        n = self.positions()
+        stop = n if stop is None else min(stop, n)
+        if not 0 <= start:
+            raise ValueError(f"start={start}; must be ≥ 0")
+        elif start >= stop:
+            return
+
+        ids = self.ids
+        keys = map(
+            lambda kvs: Key._fast(zip(ids, kvs)), self._iter_positions(start, stop)
+        )
+
+        if self.residual:
+            # NB CubeRegion.__contains__() is True for keys outside excluded regions
+            keys = filter(lambda k: all(k in cr for cr in self.residual), keys)
+
+        if self.data_keys is not None:
+            data_keys = self._data_key_values()
+            dims = {tuple(id for id, _ in dk) for dk in data_keys}
+
+            def in_data_keys(key):
+                return any(
+                    tuple((id, _value_id(key.values[id].value)) for id in d)
+                    in data_keys
+                    for d in dims
+                    if all(id in key.values for id in d)
+                ) is bool(self.data_keys.included)
+
+            keys = filter(in_data_keys, keys)
+
+        yield from keys
+
+
+class _KeyFactory:
+    """Cache for :meth:`.DataStructureDefinition.make_key`.
+
+    Holds the DSD's dimensions and attributes by ID, the order of the dimensions, and
+    interned :class:`KeyValue` and :class:`AttributeValue` instances for each (ID,
+    value) pair seen, so that keys with the same values share these objects. The
+    interned instances are frozen.
+    """
+
+    #: Maximum number of entries in each cache of interned values. When this is
+    #: reached, the cache is cleared.
+    maxsize = 2**16
+
+    def __init__(self):
+        self.components: Tuple = (None, None)
+        self.signature = None
+        self.kv: Dict[Tuple[str, Any], KeyValue] = dict()
+        self.av: Dict[Tuple[str, Any], AttributeValue] = dict()
+
+    def __reduce__(self):
+        # Don't pickle or deep-copy the caches, which refer to the old DSD's contents
+        return self.__class__, ()
+
+    def refresh(self, dsd):
+        """Update for `dsd`, if its dimensions or attributes have changed."""
+        # Ensure the components are _Components, which count their changes
+        dsd.dimensions._index()
+        dsd.attributes._index()
+        components = (dsd.dimensions.components, dsd.attributes.components)
+        dims, attrs = components
+
+        signature = (dims.version, attrs.version, tuple(d.order for d in dims))
+        if (
+            components[0] is self.components[0]
+            and components[1] is self.components[1]
+            and signature == self.signature
+        ):
+            return
+
+        self.components = components
+        self.signature = signature
+        self.dims = {d.id: d for d in dims}
+        self.attrs = {a.id: a for a in attrs}
+        # Dimensions without an order, e.g. in a DSD being parsed, sort last
+        ordered = sorted(dims, key=lambda d: (d.order is None, d.order or 0))
+        self.rank = {d.id: i for i, d in enumerate(ordered)}
+        self.kv.clear()
+        self.av.clear()
+
+    def _intern(self, cache, cls, id, value, value_for):
+        try:
+            return cache[id, value]
+        except KeyError:
+            if len(cache) >= self.maxsize:
+                cache.clear()
+            result = cache[id, value] = cls(id=id, value=value, value_for=value_for)
+            result._frozen = True
+            return result
+        except TypeError:
+            # Unhashable `value`
+            return cls(id=id, value=value, value_for=value_for)
+
+    def make(self, dsd, key_cls, values: Mapping):
+        """Make a `key_cls` instance from `values`.
+
+        Raises
+        ------
+        KeyError
+            if any of the keys of `values` is not a Dimension or Attribute in `dsd`.
+        """
+        self.refresh(dsd)
+
+        kvs, attrib = [], DictLike()
+        for id, value in values.items():
+            if id in self.attrs:
+                attrib[id] = self._intern(
+                    self.av, AttributeValue, id, value, self.attrs[id]
+                )
+            else:
+                kvs.append(self._intern(self.kv, KeyValue, id, value, self.dims[id]))
+
+        kvs.sort(key=lambda kv: self.rank[kv.id])
+
+        return key_cls.construct(
+            attrib=attrib,
+            described_by=dsd.dimensions,
+            values=DictLike((kv.id, kv) for kv in kvs),
+        )
 
 
 @validate_dictlike
@@ -1494,70 +1932,75 @@ class DataStructureDefinition(Structure, ConstrainableArtefact):
     #: :class:`.GroupDimensionDescriptor`.
     group_dimensions: DictLike[str, GroupDimensionDescriptor] = dictlike_field()
 
+    # Cache for make_key()
+    _key_factory: _KeyFactory = PrivateAttr(default_factory=_KeyFactory)
+
     # Convenience methods
     def iter_keys(
-        self, constraint: Constraint = None, dims: List[str] = []
+        self,
+        constraint: Constraint = None,
+        dims: List[str] = [],
+        start: int = 0,
+        stop: Optional[int] = None,
     ) -> Generator["Key", None, None]:
         """Iterate over keys.
 
         Parameters
         ----------
         constraint : Constraint, optional
-            If given, only yield Keys that are within the constraint.
+            If given, only yield Keys that are within the constraint: its
+            :attr:`~.ContentConstraint.data_content_region`, and/or
+            :attr:`~.Constraint.data_content_keys`.
         dims : list of str, optional
             If given, only iterate over allowable values for the Dimensions with these
             IDs. Other dimensions have only a single value like "(DIM_ID)", where
             DIM_ID is the ID of the dimension.
+        start, stop : int, optional
+            If given, only yield keys from these positions (`stop` exclusive) in the
+            Cartesian product of values allowed for each dimension. Keys at any range
+            of positions are generated without iterating over preceding ones, so
+            ranges can be processed separately, e.g. in parallel. The number of
+            positions is given by :meth:`count_keys` with ``positions=True``.
+
+        Example
+        -------
+        >>> n = dsd.count_keys(cc, positions=True)
+        >>> chunks = [
+        ...     dsd.iter_keys(cc, start=i, stop=i + 1000) for i in range(0, n, 1000)
+        ... ]
         """
-        # NB for performance, the implementation tries to use iterators and avoid
-        #    constructing full-length tuples/lists at any point
-
-        _constraint = constraint or _NullConstraint
-        dims = dims or [dim.id for dim in self.dimensions.components]
-
-        # Utility to return an immutable function that produces KeyValues. The
-        # arguments are frozen so these can be set using loop variables and stored in a
-        # map() object that isn't modified on future loops
-        def make_factory(id=None, value_for=None):
-            return lambda value: KeyValue.construct(
-                id=id, value=value, value_for=value_for
-            )
+        yield from _KeySpace(self, constraint, dims).keys(start, stop)
 
-        # List of iterables of (dim.id, KeyValues) along each dimension
-        all_kvs: List[Iterable[Tuple[str, KeyValue]]] = []
+    def count_keys(
+        self, constraint: Constraint = None, dims: List[str] = [], positions=False
+    ) -> int:
+        """Return the number of keys from :meth:`iter_keys`, without iterating.
 
-        # Iterate over dimensions
-        for dim in self.dimensions.components:
-            if (
-                dim.id not in dims
-                or dim.local_representation is None
-                or dim.local_representation.enumerated is None
-            ):
-                # `dim` is not enumerated by an ItemScheme, or not included in the
-                # `dims` argument and not to be iterated over. Create a placeholder.
-                all_kvs.append(
-                    [(dim.id, KeyValue(id=dim.id, value=f"({dim.id})", value_for=dim))]
-                )
-            else:
-                # Create a KeyValue for each Item in the ItemScheme; filter through any
-                # constraint.
-                all_kvs.append(
-                    map(
-                        lambda kv: (kv.id, kv),
-                        filter(
-                            _constraint.__contains__,
-                            map(
-                                make_factory(id=dim.id, value_for=dim),
-                                dim.local_representation.enumerated,
-                            ),
-                        ),
-                    )
-                )
+        The count is exact. Its cost depends on the number of values of each dimension,
+        not on the number of keys, except that it is exponential in the number of
+        excluded :class:`CubeRegions <.CubeRegion>` of `constraint` that have members
+        for more than one dimension.
 
-        # Create Key objects from Cartesian product of KeyValues along each dimension
-        # NB this does not work with DataKeySet
-        # TODO improve to work with DataKeySet
-        yield from filter(_constraint.__contains__, map(Key._fast, product(*all_kvs)))
+        Parameters
+        ----------
+        constraint, dims
+            As for :meth:`iter_keys`.
+        positions : bool, optional
+            If :obj:`True`, return instead the number of positions addressed by the
+            `start` and `stop` arguments to :meth:`iter_keys`. This is the same as the
+            number of keys, unless `constraint` has a
+            :attr:`~.Constraint.data_content_keys`, or excluded CubeRegions with
+            members for more than one dimension; keys at positions outside these are
+            not yielded.
+
+        Raises
+        ------
+        NotImplementedError
+            if the :class:`.DataKeySet` of `constraint` contains keys with values for
+            different sets of dimensions.
+        """
+        ks = _KeySpace(self, constraint, dims)
+        return ks.positions() if positions else ks.count()
 
     def make_constraint(self, key):
         """Return a constraint for `key`.
@@ -1668,7 +2111,21 @@ class DataStructureDefinition(Structure, ConstrainableArtefact):
         ------
         KeyError
             If any of the keys of `values` is not a Dimension or Attribute in the DSD.
+
+        Notes
+        -----
+        The :class:`.KeyValue` and :class:`.AttributeValue` instances in the result are
+        cached and shared by all keys with the same values. They are frozen: setting
+        their fields raises :class:`TypeError`; use their :meth:`~pydantic.BaseModel.copy`
+        to obtain a value that can be modified.
         """
+        if key_cls is not GroupKey:
+            try:
+                return self._key_factory.make(self, key_cls, values)
+            except KeyError:
+                # Unknown dimension or attribute ID; extend the DSD or raise below
+                pass
+
         # Methods to get dimensions and attributes
         get_method = "getdefault" if extend else "get"
         dim = getattr(self.dimensions, get_method)
@@ -1756,7 +2213,11 @@ class DataflowDefinition(StructureUsage, ConstrainableArtefact):
     structure: DataStructureDefinition = DataStructureDefinition()
 
     def iter_keys(
-        self, constraint: Constraint = None, dims: List[str] = []
+        self,
+        constraint: Constraint = None,
+        dims: List[str] = [],
+        start: int = 0,
+        stop: Optional[int] = None,
     ) -> Generator["Key", None, None]:
         """Iterate over keys.
 
@@ -1764,7 +2225,18 @@ class DataflowDefinition(StructureUsage, ConstrainableArtefact):
         --------
         .DataStructureDefinition.iter_keys
         """
-        yield from self.structure.iter_keys(constraint=constraint, dims=dims)
+        yield from self.structure.iter_keys(constraint, dims, start, stop)
+
+    def count_keys(
+        self, constraint: Constraint = None, dims: List[str] = [], positions=False
+    ) -> int:
+        """Return the number of keys from :meth:`iter_keys`, without iterating.
+
+        See also
+        --------
+        .DataStructureDefinition.count_keys
+        """
+        return self.structure.count_keys(constraint, dims, positions)
 
 
 # §5.4: Data Set
@@ -1781,7 +2253,29 @@ def value_for_dsd_ref(kind, args, kwargs):
     return args, kwargs
 
 
-class KeyValue(BaseModel):
+class _FreezableModel(BaseModel):
+    """Model with fields that cannot be set once it is frozen.
+
+    Used for the values shared by keys from :meth:`.DataStructureDefinition.make_key`.
+    :meth:`copy` returns an instance that is not frozen.
+    """
+
+    _frozen: bool = PrivateAttr(default=False)
+
+    def __setattr__(self, name, value):
+        if self._frozen and name in self.__fields__:
+            raise TypeError(
+                f"{self!r} is frozen; use {self.__class__.__name__}.copy() to modify"
+            )
+        super().__setattr__(name, value)
+
+    def copy(self, *args, **kwargs):
+        result = super().copy(*args, **kwargs)
+        result._frozen = False
+        return result
+
+
+class KeyValue(_FreezableModel):
     """One value in a multi-dimensional :class:`Key`."""
 
     #:
@@ -1791,10 +2285,22 @@ class KeyValue(BaseModel):
     #:
     value_for: Optional[Dimension] = None
 
+    _hash: Optional[int] = PrivateAttr(default=None)
+
     def __init__(self, *args, **kwargs):
         args, kwargs = value_for_dsd_ref("dimension", args, kwargs)
         super().__init__(*args, **kwargs)
 
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name in ("id", "value"):
+            self._hash = None
+
+    def __setstate__(self, state):
+        super().__setstate__(state)
+        # Hashes of str differ between Python processes
+        self._hash = None
+
     def __eq__(self, other):
         """Compare the value to a simple Python built-in type or other key-like.
 
@@ -1818,13 +2324,15 @@ class KeyValue(BaseModel):
 
     def __hash__(self):
         # KeyValue instances with the same id & value hash identically
-        return hash(self.id + str(self.value))
+        if self._hash is None:
+            self._hash = hash(self.id + str(self.value))
+        return self._hash
 
 
 TimeKeyValue = KeyValue
 
 
-class AttributeValue(BaseModel):
+class AttributeValue(_FreezableModel):
     """SDMX-IM AttributeValue.
 
     In the spec, AttributeValue is an abstract class. Here, it serves as both the
@@ -1907,6 +2415,8 @@ class Key(BaseModel):
     #: Individual KeyValues that describe the key.
     values: DictLike[str, KeyValue] = dictlike_field()
 
+    _frozen: bool = PrivateAttr(default=False)
+
     def __init__(self, arg: Union[Mapping, Sequence[KeyValue]] = None, **kwargs):
         # DimensionDescriptor
         dd = kwargs.pop("described_by", None)
@@ -1971,11 +2481,23 @@ class Key(BaseModel):
         return self.values[name]
 
     def __setitem__(self, name, value):
+        self._check_frozen()
         # Convert a bare string or other Python object to a KeyValue instance
         if not isinstance(value, KeyValue):
             value = KeyValue(id=name, value=value)
         self.values[name] = value
 
+    def __setattr__(self, name, value):
+        if name in self.__fields__:
+            self._check_frozen()
+        super().__setattr__(name, value)
+
+    def _check_frozen(self):
+        if self._frozen:
+            raise TypeError(
+                f"{self!r} is frozen; use {self.__class__.__name__}.copy() to modify"
+            )
+
     # Convenience access to values by attribute
     def __getattr__(self, name):
         try:
@@ -2013,24 +2535,23 @@ class Key(BaseModel):
             raise NotImplementedError
 
     def __eq__(self, other):
-        if hasattr(other, "values"):
+        if other is self:
+            return True
+        elif hasattr(other, "values"):
             # Key
-            return all(
-                [a == b for a, b in zip(self.values.values(), other.values.values())]
-            )
+            return all(map(eq, self.values.values(), other.values.values()))
         elif hasattr(other, "key_value"):
             # DataKey
-            return all(
-                [a == b for a, b in zip(self.values.values(), other.key_value.values())]
-            )
+            return all(map(eq, self.values.values(), other.key_value.values()))
         elif isinstance(other, str) and len(self.values) == 1:
             return self.values[0] == other
         else:
             raise ValueError(other)
 
     def __hash__(self):
-        # Hash of the individual KeyValues, in order
-        return hash(tuple(hash(kv) for kv in self.values.values()))
+        # Hash of the individual KeyValues, in order. Not cached, because
+        # :attr:`values` can be modified directly; the KeyValues cache their hashes.
+        return hash(tuple(map(hash, self.values.values())))
 
     # Representations
 
@@ -2067,18 +2588,81 @@ class GroupKey(Key):
         self.id = id
 
 
+_MISSING = object()
+
+
+class AttributeView(Mapping):
+    """Read-only view of attributes attached at several levels.
+
+    Returned by :attr:`Observation.attrib` and :attr:`SeriesKey.group_attrib`. The
+    `maps` are not copied; if the same attribute ID appears in more than one, the value
+    from the last one is used. As with :class:`.DictLike`, values can be accessed by
+    attribute, or by integer index.
+
+    :mod:`sdmx` extension not in the IM.
+    """
+
+    __slots__ = ("_maps",)
+
+    def __init__(self, *maps: Mapping):
+        # Non-empty maps, highest precedence first
+        self._maps = tuple(m for m in reversed(maps) if m)
+
+    def __getitem__(self, key):
+        for m in self._maps:
+            value = m.get(key, _MISSING)
+            if value is not _MISSING:
+                return value
+        if isinstance(key, int):
+            # int() index access
+            return list(self.values())[key]
+        raise KeyError(key)
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        try:
+            return self[name]
+        except KeyError as e:
+            raise AttributeError(e) from None
+
+    def _merged(self) -> Mapping:
+        if len(self._maps) == 1:
+            return self._maps[0]
+        result: Dict = {}
+        for m in reversed(self._maps):
+            result.update(m)
+        return result
+
+    def __iter__(self):
+        return iter(self._merged())
+
+    def __len__(self):
+        return len(self._merged())
+
+    # Faster than the Mapping defaults, which call __getitem__ for each key
+    def items(self):
+        return self._merged().items()
+
+    def values(self):
+        return self._merged().values()
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__}: {dict(self._merged())!r}>"
+
+    def copy(self) -> DictLike:
+        """Return a :class:`.DictLike` with the same items."""
+        return DictLike(self.items())
+
+
 class SeriesKey(Key):
     #: :mod:`sdmx` extension not in the IM.
     group_keys: Set[GroupKey] = set()
 
     @property
-    def group_attrib(self):
+    def group_attrib(self) -> AttributeView:
         """Return a view of combined group attributes."""
-        # Needed to pass existing tests
-        view = DictLike()
-        for gk in self.group_keys:
-            view.update(gk.attrib)
-        return view
+        return AttributeView(*[gk.attrib for gk in self.group_keys])
 
 
 @validate_dictlike
@@ -2102,23 +2686,53 @@ class Observation(BaseModel):
     #: :mod:`sdmx` extension not in the IM.
     group_keys: Set[GroupKey] = set()
 
+    # Cached return value of key, with the KeyValues it combines
+    _key: Optional[Tuple[Tuple[KeyValue, ...], Key]] = PrivateAttr(default=None)
+
     @property
-    def attrib(self):
-        """Return a view of combined observation, series & group attributes."""
-        view = self.attached_attribute.copy()
-        view.update(getattr(self.series_key, "attrib", {}))
-        for gk in self.group_keys:
-            view.update(gk.attrib)
-        return view
+    def attrib(self) -> AttributeView:
+        """Return a view of combined observation, series & group attributes.
+
+        Attributes attached to a group take precedence over those attached to the
+        series, which take precedence over those attached to the observation. See
+        also :meth:`.DataSet.attrib_columns`.
+        """
+        return AttributeView(
+            self.attached_attribute,
+            getattr(self.series_key, "attrib", {}),
+            *[gk.attrib for gk in self.group_keys],
+        )
 
     @property
     def dim(self):
         return self.dimension
 
     @property
-    def key(self):
-        """Return the entire key, including KeyValues at the series level."""
-        return self.series_key + self.dimension
+    def key(self) -> Key:
+        """Return the entire key, including KeyValues at the series level.
+
+        The key is created on first access and then reused, until any of the
+        KeyValues of :attr:`series_key` or :attr:`dimension` is replaced, or either
+        key is replaced. It is frozen: use :meth:`.Key.copy` to obtain a key that can
+        be modified.
+        """
+        sk, dim = self.series_key, self.dimension
+        kvs = tuple(
+            chain(
+                sk.values.values() if sk is not None else (),
+                dim.values.values() if dim is not None else (),
+            )
+        )
+        cached = self._key
+        if (
+            cached is None
+            or len(cached[0]) != len(kvs)
+            or not all(map(is_, cached[0], kvs))
+        ):
+            key = sk + dim
+            key._frozen = True
+            cached = self._key = (kvs, key)
+        return cached[1]
 
     def __len__(self):
         # FIXME this is unintuitive; maybe deprecate/remove?
@@ -2152,6 +2766,52 @@ class Observation(BaseModel):
         )
 
 
+class _GroupIndex:
+    """Inverted index of the group keys in :attr:`DataSet.group`.
+
+    Maps the IDs of the dimensions in each :class:`GroupKey`, then the corresponding
+    values, to the group keys. Finding the group keys that apply to a key requires one
+    lookup per distinct set of IDs, rather than one comparison per group key.
+
+    :class:`DataSet` replaces the index when :attr:`DataSet.group` is assigned.
+    """
+
+    def __init__(self):
+        self.group = None
+        self.length = 0
+        self.index: Dict[Tuple[str, ...], Dict[Tuple, List[GroupKey]]] = dict()
+
+    def __reduce__(self):
+        # Don't pickle or deep-copy the index; it is rebuilt on first use
+        return self.__class__, ()
+
+    def refresh(self, group):
+        """Update for the keys of `group`, if keys have been added."""
+        if group is self.group and len(group) == self.length:
+            return
+
+        self.group, self.length = group, len(group)
+        self.index.clear()
+        for gk in group:
+            values = tuple(kv.value for kv in gk.values.values())
+            self.index.setdefault(tuple(gk.values), dict()).setdefault(
+                values, []
+            ).append(gk)
+
+    def matches(self, group, values: Mapping[str, KeyValue]) -> Iterable[GroupKey]:
+        """Iterate over group keys in `group` that are contained in `values`."""
+        self.refresh(group)
+        for ids, group_keys in self.index.items():
+            try:
+                candidates = group_keys.get(tuple(values[id].value for id in ids), ())
+            except KeyError:
+                continue  # `values` lacks some of `ids`
+            # Same as `gk in key`: also compare KeyValue.value_for
+            for gk in candidates:
+                if all(values[kv.id] == kv for kv in gk.values.values()):
+                    yield gk
+
+
 @validate_dictlike
 class DataSet(AnnotableArtefact):
     # SDMX-IM features
@@ -2176,19 +2836,106 @@ class DataSet(AnnotableArtefact):
     #: :mod:`sdmx` extension not in the IM.
     group: DictLike[GroupKey, List[Observation]] = dictlike_field()
 
+    # Index of `group` for _add_group_refs()
+    _group_index: _GroupIndex = PrivateAttr(default_factory=_GroupIndex)
+
     def __len__(self):
         return len(self.obs)
 
-    def _add_group_refs(self, target):
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name == "group":
+            self._group_index = _GroupIndex()
+
+    @staticmethod
+    def attrib_columns(
+        observations: Sequence[Observation],
+    ) -> Dict[str, List[Optional[AttributeValue]]]:
+        """Return the attributes of `observations`, by column.
+
+        The result maps each attribute ID to a list with one entry per observation:
+        the same value as ``observations[i].attrib[id]``, or :obj:`None` if the
+        observation has no such attribute. Attributes of a :class:`SeriesKey` or
+        :class:`GroupKey` shared by many observations, e.g. all those in one series,
+        are looked up once; no mapping is created per observation.
+
+        Example
+        -------
+        >>> columns = DataSet.attrib_columns(ds.series[key])
+        >>> columns["OBS_STATUS"]
+        [<AttributeValue: OBS_STATUS=A>, None, ...]
+        """
+        n = len(observations)
+        columns: Dict[str, List[Optional[AttributeValue]]] = {}
+
+        def _column(attr_id):
+            column = columns.get(attr_id)
+            if column is None:
+                column = columns[attr_id] = [None] * n
+            return column
+
+        # Series and group keys, with the positions of the observations attached
+        keys: Dict[int, Tuple[Key, List[int]]] = {}
+
+        def _positions(key):
+            try:
+                return keys[id(key)][1]
+            except KeyError:
+                return keys.setdefault(id(key), (key, []))[1]
+
+        series_key, series_positions = None, []
+        for i, obs in enumerate(observations):
+            for attr_id, value in obs.attached_attribute.items():
+                _column(attr_id)[i] = value
+
+            # Observations of the same series are usually adjacent
+            if obs.series_key is not series_key:
+                series_key = obs.series_key
+                series_positions = [] if series_key is None else _positions(series_key)
+            series_positions.append(i)
+
+            for gk in obs.group_keys:
+                _positions(gk).append(i)
+
+        # Series keys first, so that group attributes take precedence
+        for key, positions in sorted(
+            keys.values(), key=lambda kp: isinstance(kp[0], GroupKey)
+        ):
+            start, stop = positions[0], positions[-1] + 1
+            contiguous = stop - start == len(positions)
+            for attr_id, value in key.attrib.items():
+                column = _column(attr_id)
+                if contiguous:
+                    column[start:stop] = [value] * len(positions)
+                else:
+                    for i in positions:
+                        column[i] = value
+
+        return columns
+
+    def _add_group_refs(self, target, store=True):
         """Associate *target* with groups in this dataset.
 
-        *target* may be an instance of SeriesKey or Observation.
+        *target* may be an instance of SeriesKey or Observation. If *store* is
+        :obj:`False`, an Observation is not added to the lists in :attr:`group`. An
+        Observation is added at most once to each list.
         """
-        for group_key in self.group:
-            if group_key in (target if isinstance(target, SeriesKey) else target.key):
-                target.group_keys.add(group_key)
-                if isinstance(target, Observation):
-                    self.group[group_key].append(target)
+        if not self.group:
+            return
+        elif isinstance(target, SeriesKey):
+            values: Mapping = target.values
+        else:
+            # Same as target.key.values, without constructing a new Key
+            values = ChainMap(
+                *[k.values for k in (target.dimension, target.series_key) if k]
+            )
+
+        for group_key in self._group_index.matches(self.group, values):
+            if group_key in target.group_keys:
+                continue
+            target.group_keys.add(group_key)
+            if store and isinstance(target, Observation):
+                self.group[group_key].append(target)
 
     def add_obs(self, observations, series_key=None):
         """Add *observations* to a series with *series_key*.
@@ -2267,6 +3014,252 @@ class StructureSpecificTimeSeriesDataSet(DataSet):
     """SDMX-IM StructureSpecificTimeSeriesDataSet."""
 
 
+class CodedColumn(NamedTuple):
+    """Values of one dimension or attribute in a :class:`ColumnarDataSet`.
+
+    :mod:`sdmx` extension not in the IM.
+    """
+
+    #: Integer :class:`numpy.ndarray` with one entry per observation: the index of the
+    #: observation's value in :attr:`levels`, or -1 if the observation has no value.
+    codes: Any
+    #: Sorted list of the distinct values.
+    levels: List[str]
+
+
+class ColumnarDataSet(DataSet):
+    """DataSet with observations stored in columns.
+
+    Instead of one :class:`Observation` (with :class:`Key`, :class:`KeyValue`, and
+    :class:`AttributeValue` instances) per observation, the values of each dimension
+    and attribute are stored as one :class:`CodedColumn`, and the observation values
+    as one array. This uses much less time and memory for large data sets.
+
+    Instances are created by :meth:`.xml.Reader.read_message` and
+    :meth:`.sdmxjson.Reader.read_message` with ``engine="columnar"``. Convert to
+    :mod:`pandas` with :func:`.to_pandas`.
+
+    :attr:`obs` and :attr:`series` are read-only views: each :class:`Observation` is
+    created only when it is accessed, and not stored. :attr:`group` is empty; any
+    attributes attached to groups appear in :attr:`Observation.attached_attribute`.
+
+    :mod:`sdmx` extension not in the IM.
+    """
+
+    #: Mapping from dimension ID to :class:`CodedColumn`, in the order of the
+    #: dimensions in :attr:`structured_by`.
+    dimension_columns: Dict[str, Any] = {}
+    #: Mapping from attachment level—"o" (observation), "s" (series), or "g"
+    #: (group)—to a mapping from attribute ID to :class:`CodedColumn`.
+    attribute_columns: Dict[str, Dict[str, Any]] = {}
+    #: Observation values, as a :class:`numpy.ndarray`.
+    obs_value: Any = None
+    #: IDs of the dimensions in :attr:`dimension_columns` that form the key of each
+    #: series. Empty if the observations are not in series.
+    series_dimensions: List[str] = []
+
+    # Views of the columns. Not List[Observation] and DictLike: validating these would
+    # create every Observation.
+    #: All observations in the DataSet, as a read-only sequence.
+    obs: Any = None
+    #: Map of series key → observations, read-only.
+    series: Any = None
+
+    # Series keys, and the index of the series of each observation; see _series_index()
+    _series: Optional[Tuple[List[SeriesKey], Any]] = PrivateAttr(default=None)
+    # DSD used to create keys; see _dsd()
+    _key_dsd: Optional[DataStructureDefinition] = PrivateAttr(default=None)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.obs = _ColumnarObs(self)
+        self.series = _ColumnarSeries(self)
+
+    def __len__(self):
+        return 0 if self.obs_value is None else len(self.obs_value)
+
+    def _dsd(self) -> DataStructureDefinition:
+        """Return a DSD with every dimension and attribute in the columns.
+
+        This is :attr:`structured_by`, if it has all of them. Otherwise, a private DSD
+        with the same components, plus any missing ones. :attr:`structured_by` is never
+        modified or set.
+        """
+        if self._key_dsd is not None:
+            return self._key_dsd
+
+        dsd = self.structured_by
+        attributes = set(chain(*self.attribute_columns.values()))
+        if (
+            dsd is None
+            or any(id not in dsd.dimensions for id in self.dimension_columns)
+            or any(id not in dsd.attributes for id in attributes)
+        ):
+            private = DataStructureDefinition()
+            if dsd is not None:
+                for name in ("dimensions", "attributes", "measures"):
+                    getattr(private, name).components.extend(getattr(dsd, name))
+                private.dimensions.auto_order = dsd.dimensions.auto_order
+            for id in self.dimension_columns:
+                private.dimensions.getdefault(id)
+            for id in sorted(attributes):
+                private.attributes.getdefault(id)
+            dsd = private
+
+        self._key_dsd = dsd
+        return dsd
+
+    def _series_index(self) -> Tuple[List[SeriesKey], Any]:
+        """Return a list of :class:`SeriesKey`, and the index in it for each row.
+
+        Series are in order of their first observation. Observations not in any series
+        have index -1.
+        """
+        if self._series is not None:
+            return self._series
+
+        n = len(self)
+        keys: List[SeriesKey] = []
+        index = np.full(n, -1, dtype=np.intp)
+        if self.series_dimensions:
+            codes = np.column_stack(
+                [self.dimension_columns[id].codes for id in self.series_dimensions]
+            )
+            in_series = (codes >= 0).all(axis=1)
+            _, first, inverse = np.unique(
+                codes[in_series], axis=0, return_index=True, return_inverse=True
+            )
+            # Renumber the series by first appearance
+            order = np.argsort(first)
+            rank = np.empty_like(order)
+            rank[order] = np.arange(len(order))
+            index[in_series] = rank[inverse.ravel()]
+
+            rows = np.flatnonzero(in_series)[first[order]]
+            keys = [
+                self._make_key(SeriesKey, row, self.series_dimensions, "s")
+                for row in rows
+            ]
+
+        self._series = (keys, index)
+        return self._series
+
+    def _make_key(self, key_cls, row, dims, levels):
+        """Return a `key_cls` with the values in `row` of `dims` and attributes.
+
+        Attributes attached at any of `levels` are included in the key's
+        :attr:`~.Key.attrib`.
+        """
+        columns = [(id, self.dimension_columns[id]) for id in dims]
+        for level in levels:
+            columns.extend(self.attribute_columns.get(level, {}).items())
+
+        values = {}
+        for id, column in columns:
+            code = column.codes[row]
+            if code >= 0:
+                values[id] = column.levels[code]
+        return self._dsd().make_key(key_cls, values)
+
+    def _make_obs(self, row) -> Observation:
+        keys, index = self._series_index()
+        row = int(row)
+        series_key = keys[index[row]] if index[row] >= 0 else None
+
+        if series_key is None:
+            key = self._make_key(Key, row, self.dimension_columns, "osg")
+        else:
+            dims = [
+                id for id in self.dimension_columns if id not in self.series_dimensions
+            ]
+            key = self._make_key(Key, row, dims, "og")
+        # Remove attributes from the Key to be attached to the Observation
+        aa = key.attrib
+        key.attrib = {}
+
+        value = self.obs_value[row]
+        if isinstance(value, np.generic):
+            value = value.item()
+        if isinstance(value, float) and isnan(value):
+            value = None
+
+        dsd = self._dsd()
+        return Observation(
+            dimension=key,
+            series_key=series_key,
+            value=value,
+            value_for=dsd.measures[0] if len(dsd.measures) else None,
+            attached_attribute=aa,
+        )
+
+
+class _ColumnarObs(Sequence):
+    """Read-only view of the observations in `ds`, or those in `rows`."""
+
+    def __init__(self, ds: ColumnarDataSet, rows=None):
+        self._ds = ds
+        self._rows = rows
+
+    def _all_rows(self):
+        return range(len(self._ds)) if self._rows is None else self._rows
+
+    def __len__(self):
+        return len(self._all_rows())
+
+    def __getitem__(self, i):
+        rows = self._all_rows()
+        if isinstance(i, slice):
+            return [self._ds._make_obs(row) for row in rows[i]]
+        return self._ds._make_obs(rows[i])
+
+    def __iter__(self):
+        for row in self._all_rows():
+            yield self._ds._make_obs(row)
+
+    def __repr__(self):
+        return f"<{len(self)} observations>"
+
+
+class _ColumnarSeries(Mapping):
+    """Read-only view of the series in `ds`: map of series key → observations.
+
+    Like :class:`.DictLike`, values are also accessible by integer index.
+    """
+
+    def __init__(self, ds: ColumnarDataSet):
+        self._ds = ds
+        self._dict: Optional[Dict[SeriesKey, _ColumnarObs]] = None
+
+    def _get(self) -> Dict[SeriesKey, _ColumnarObs]:
+        if self._dict is None:
+            keys, index = self._ds._series_index()
+            # Rows of each series, in order
+            rows = np.argsort(index, kind="stable")
+            bounds = np.cumsum(np.bincount(index + 1, minlength=len(keys) + 1))
+            self._dict = {
+                key: _ColumnarObs(self._ds, rows[bounds[i] : bounds[i + 1]])
+                for i, key in enumerate(keys)
+            }
+        return self._dict
+
+    def __getitem__(self, key):
+        try:
+            return self._get()[key]
+        except KeyError:
+            if isinstance(key, int):
+                return list(self._get().values())[key]
+            raise
+
+    def __iter__(self):
+        return iter(self._get())
+
+    def __len__(self):
+        return len(self._get())
+
+    def __repr__(self):
+        return f"<{len(self)} series>"
+
+
 class _AllDimensions:
     pass
 
@@ -1,10 +1,35 @@
 from pathlib import Path
 
 from pandasdmx.reader import sdmxjson as json, sdmxml as xml
+from pandasdmx.writer import to_pandas
 
 #: Reader classes
 READERS = [json.Reader, xml.Reader]
 
+#: Keyword arguments to :func:`read_sdmx` passed to :meth:`.BaseReader.read_message`
+READ_OPTIONS = [
+    "dsd",
+    "engine",
+    "json_backend",
+    "lazy",
+    "profile",
+    "schema_dir",
+    "trusted",
+    "validate",
+    "workers",
+]
+
+#: Keyword arguments to :func:`read_sdmx` passed to :func:`.to_pandas` with
+#: ``to="pandas"``
+WRITE_OPTIONS = [
+    "attributes",
+    "constraint",
+    "datetime",
+    "dtype",
+    "dtypes_from_dsd",
+    "rtype",
+]
+
 
 def _readers():
     return ", ".join(map(lambda cls: cls.__name__, READERS))
@@ -48,6 +73,35 @@ def get_reader_for_content_type(ctype):
     raise ValueError(f"Content type {repr(ctype)} not supported by any of {_readers()}")
 
 
+def convert_options(to, options: dict, kwargs: dict) -> dict:
+    """Prepare to read a message and convert it `to` another format.
+
+    If `to` is "pandas", `options` for :meth:`.BaseReader.read_message` are updated to
+    read data sets as :class:`.ColumnarDataSet`, and the keyword arguments in
+    :data:`WRITE_OPTIONS` are removed from `kwargs` and returned, to be passed to
+    :func:`convert`.
+
+    Raises
+    ------
+    ValueError
+        If `to` is not "pandas", or `options` give a different `engine`.
+    """
+    if to is None:
+        return {}
+    elif to != "pandas":
+        raise ValueError(f"to={to!r}; expected 'pandas'")
+    elif options.get("engine") not in (None, "columnar"):
+        raise ValueError(f"to={to!r} with engine={options['engine']!r}")
+
+    options["engine"] = "columnar"
+    return {name: kwargs.pop(name) for name in WRITE_OPTIONS if name in kwargs}
+
+
+def convert(msg, to, **kwargs):
+    """Return `msg`; or, if `to` is "pandas", the result of :func:`.to_pandas`."""
+    return msg if to is None else to_pandas(msg, **kwargs)
+
+
 def get_reader_for_path(path):
     """Return a reader class for file `path`.
 
@@ -79,17 +133,49 @@ def read_sdmx(filename_or_obj, format=None, **kwargs):
         or open binary file. A file is not closed explicitly. So it should be passed
         from a with-context.
     format : 'XML' or 'JSON', optional
+    to : 'pandas', optional
+        If given, return the data as :mod:`pandas` objects, the same as from
+        :func:`.to_pandas` with the options below. The data sets are read as
+        :class:`~.ColumnarDataSet`, without creating any :class:`~.Observation`.
+        Attribute values are :class:`str`, rather than :class:`~.AttributeValue`.
 
     Other Parameters
     ----------------
     dsd : :class:`~.DataStructureDefinition`
         For “structure-specific” `format`=``XML`` messages only.
+    engine : str
+        ``"columnar"`` to store data as :class:`~.ColumnarDataSet`. See
+        :meth:`.xml.Reader.read_message` and :meth:`.sdmxjson.Reader.read_message`.
+    json_backend : str
+        For `format`=``JSON`` messages only: name of the module used to decode the
+        message, e.g. ``"orjson"``. See :meth:`.sdmxjson.Reader.read_message`.
+    lazy : bool
+        For `format`=``XML`` structure messages only: parse each maintainable
+        artefact only when it is first accessed. See :meth:`.xml.Reader.read_message`.
+    profile : :class:`~.sdmxml.ParseProfile`
+        For `format`=``XML`` messages only: record the time spent parsing each XML
+        element. See :meth:`.xml.Reader.read_message`.
+    validate : bool
+        For `format`=``XML`` messages only: validate the message against the installed
+        XML schemas while it is read. See :meth:`.xml.Reader.read_message`.
+    schema_dir : path-like or str
+        With `validate`, the directory containing the schemas.
+    trusted : bool
+        Create observations, keys, and attribute values without validation, which is
+        faster. See :meth:`.xml.Reader.read_message`.
+    workers : int
+        For `format`=``XML`` data messages only: number of processes used to parse
+        the message. Requires `dsd`. See :meth:`.xml.Reader.read_message`.
+    attributes, constraint, datetime, dtype, dtypes_from_dsd, rtype :
+        With `to`, passed to :func:`.to_pandas`.
     """
     reader = None
 
-    # pop any dsd from kwargs as these are passed to any FS backend
+    # pop any dsd and reader options from kwargs as these are passed to any FS backend
     kwargs = kwargs.copy()
-    dsd = kwargs.pop("dsd", None)
+    options = {name: kwargs.pop(name, None) for name in READ_OPTIONS}
+    to = kwargs.pop("to", None)
+    write_options = convert_options(to, options, kwargs)
 
     try:
         # Do we have a path/filename rather than file?
@@ -138,7 +224,7 @@ def read_sdmx(filename_or_obj, format=None, **kwargs):
             f"format={format}, or content '{first_line[:5].decode()}..'"
         )
 
-    if dsd:
-        return reader().read_message(obj, dsd=dsd)
-    else:
-        return reader().read_message(obj)
+    msg = reader().read_message(
+        obj, **{name: value for name, value in options.items() if value is not None}
+    )
+    return convert(msg, to, **write_options)
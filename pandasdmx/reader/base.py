@@ -22,6 +22,10 @@ class BaseReader(ABC):
     #: List of file name suffixes handled by the reader.
     suffixes: List[str] = []
 
+    #: If :obj:`True`, objects at the data level, e.g. :class:`.Observation`, are
+    #: created and modified without validation; see :meth:`construct`.
+    trusted = False
+
     @classmethod
     def detect(cls, content: bytes) -> bool:
         """Detect whether the reader can handle `content`.
@@ -70,6 +74,40 @@ class BaseReader(ABC):
         """
         pass  # pragma: no cover
 
+    def iter_series(self, source, dsd=None):
+        """Iterate over the series in a data message from `source`.
+
+        Parameters
+        ----------
+        source : file-like
+            Message content.
+        dsd : DataStructureDefinition, optional
+            DSD for aid in reading `source`.
+
+        Yields
+        ------
+        tuple of (.SeriesKey, list of .Observation)
+        """
+        raise NotImplementedError
+
+    def construct(self, cls, **kwargs):
+        """Return an instance of `cls` with field values `kwargs`.
+
+        If :attr:`trusted`, :meth:`pydantic.BaseModel.construct` is used. This is
+        several times faster, but `kwargs` are neither validated nor converted, e.g.
+        a :class:`.DictLike` must be given for a DictLike field.
+        """
+        return cls.construct(**kwargs) if self.trusted else cls(**kwargs)
+
+    def assign(self, obj, **values):
+        """Set fields of `obj` from `values`; without validation if :attr:`trusted`."""
+        if self.trusted:
+            obj.__dict__.update(values)
+            obj.__fields_set__.update(values)
+        else:
+            for name, value in values.items():
+                setattr(obj, name, value)
+
     @staticmethod
     def get_schema_dir():
         return Path(appdirs.user_data_dir(appname="pandasdmx", appauthor=False))
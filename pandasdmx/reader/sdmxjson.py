@@ -1,6 +1,14 @@
 """SDMX-JSON v2.1 reader"""
+import codecs
 import json
 import logging
+import re
+from itertools import zip_longest
+from math import nan
+from operator import attrgetter
+from typing import List
+
+import numpy as np
 
 from pandasdmx import model
 from pandasdmx.format.json import CONTENT_TYPES
@@ -17,9 +25,33 @@ from pandasdmx.model import (
     SeriesKey,
 )
 from pandasdmx.reader.base import BaseReader
+from pandasdmx.util import DictLike
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    HAS_ORJSON = False
+else:
+    HAS_ORJSON = True
+
+try:
+    import simdjson
+except ImportError:  # pragma: no cover
+    HAS_SIMDJSON = False
+else:
+    HAS_SIMDJSON = True
 
 log = logging.getLogger(__name__)
 
+#: Functions to decode JSON from :class:`bytes`, by name of the module providing them.
+#: The first of these, the standard library :mod:`json`, is the default for
+#: :meth:`.Reader.read_message`. Others are included if installed.
+JSON_BACKENDS = {"json": json.loads}
+if HAS_ORJSON:
+    JSON_BACKENDS["orjson"] = orjson.loads
+if HAS_SIMDJSON:  # pragma: no cover
+    JSON_BACKENDS["simdjson"] = simdjson.loads
+
 
 class Reader(BaseReader):
     """Read SDMX-JSON and expose it as instances from :mod:`sdmx.model`."""
@@ -27,11 +59,82 @@ class Reader(BaseReader):
     content_types = CONTENT_TYPES
     suffixes = [".json"]
 
+    #: Data sets read by :meth:`iter_series`, without observations.
+    data_sets: List[DataSet]
+
     @classmethod
     def detect(cls, content):
         return content.startswith(b"{")
 
-    def read_message(self, source, dsd=None):
+    def read_message(
+        self,
+        source,
+        dsd=None,
+        engine=None,
+        json_backend=None,
+        lazy=False,
+        profile=None,
+        schema_dir=None,
+        trusted=False,
+        validate=False,
+        workers=None,
+    ):
+        """Read a message from `source`.
+
+        Parameters
+        ----------
+        dsd : .DataStructureDefinition, optional
+            Ignored.
+        engine : str, optional
+            If "columnar", store each data set as a :class:`.ColumnarDataSet`, decoding
+            the observations in bulk. This is much faster for large data sets.
+        json_backend : str, optional
+            Name of the module used to decode `source`: one of the keys of
+            :data:`JSON_BACKENDS`, e.g. "orjson", which is faster than the default,
+            "json" for the standard library. The content of `source` is passed to the
+            backend as :class:`bytes`.
+        lazy : bool, optional
+            Not supported: SDMX-JSON messages contain no structures to defer.
+            :obj:`True` raises :class:`ValueError`; see
+            :meth:`.xml.Reader.read_message`.
+        profile : .ParseProfile, optional
+            Not supported: SDMX-JSON has no per-element parser functions to profile.
+            If given, raises :class:`ValueError`.
+        schema_dir : str or os.PathLike, optional
+            Not supported, as for `validate`.
+        trusted : bool, optional
+            If :obj:`True`, create observations, keys, and attribute values without
+            :mod:`pydantic` validation, which is faster. See
+            :attr:`.BaseReader.trusted`.
+        validate : bool, optional
+            Not supported: there are no XSD schemas for SDMX-JSON. :obj:`True` raises
+            :class:`ValueError`.
+        workers : int, optional
+            Not supported: SDMX-JSON is decoded in one process. Values greater than 1
+            raise :class:`ValueError`; see :meth:`.xml.Reader.read_message`.
+        """
+        self.trusted = trusted
+
+        if engine not in (None, "columnar"):
+            raise ValueError(f"engine={engine!r}; expected one of {{None, 'columnar'}}")
+        elif workers is not None and workers > 1:
+            raise ValueError(f"workers={workers} requires an SDMX-ML message")
+
+        # Options of read_sdmx() that apply only to SDMX-ML
+        options = dict(
+            lazy=lazy, profile=profile, schema_dir=schema_dir, validate=validate
+        )
+        for name, value in options.items():
+            if value:
+                raise ValueError(f"{name}={value!r} is not supported for SDMX-JSON")
+
+        try:
+            loads = JSON_BACKENDS[json_backend or next(iter(JSON_BACKENDS))]
+        except KeyError:
+            raise ValueError(
+                f"json_backend={json_backend!r}; expected one of {set(JSON_BACKENDS)}"
+            ) from None
+
         # Initialize message instance
         msg = DataMessage()
 
@@ -41,22 +144,118 @@ class Reader(BaseReader):
 
         # Read JSON
         source.default_size = -1
-        tree = json.load(source)
+        tree = loads(source.read())
+
+        self.msg = msg
+        self._read_header(tree["header"])
+        self._read_structure(tree["structure"], engine)
+
+        if engine == "columnar":
+            for ds in tree["dataSets"]:
+                msg.data.append(self.read_columnar_dataset(ds))
+            return msg
+
+        # Make a SeriesKey for Observations in this DataSet
+        ds_key = self._make_key("dataSet")
+
+        # Read DataSets
+        for ds in tree["dataSets"]:
+            msg.data.append(self.read_dataset(ds, ds_key))
+
+        return msg
+
+    def iter_series(self, source, dsd=None):
+        """Iterate over the series in a data message from `source`.
 
-        # Read the header
+        Unlike :meth:`read_message`, `source` is not decoded as a whole, but read
+        incrementally: the ``structure`` is decoded first, and then each series in
+        ``dataSets`` is yielded as soon as it is decoded. Memory use is bounded by the
+        size of one series, rather than the whole message.
+
+        If ``dataSets`` appears before ``structure`` in `source`, the data sets must be
+        decoded as a whole, as by :meth:`read_message`; their series are yielded once
+        the structure is read.
+
+        The attributes attached to each data set, its ``action`` and ``validFrom``,
+        are not in the yielded tuples. Once all its series are yielded, the
+        :class:`.DataSet`, without observations, is appended to :attr:`data_sets`.
+
+        Parameters
+        ----------
+        dsd : .DataStructureDefinition, optional
+            Ignored.
+
+        Yields
+        ------
+        tuple of (.SeriesKey, list of .Observation)
+            For observations not in any series, e.g. in a "flat" data set, the
+            SeriesKey is :obj:`None` and the list contains 1 Observation.
+        """
+        self.msg = DataMessage()
+        self.data_sets = []
+
+        tokens = _Tokenizer(source)
+        ds_key = None
+        data_sets = []
+        for name in tokens.members():
+            if name == "dataSets" and ds_key is not None:
+                for _ in tokens.elements():
+                    root = {}
+                    for ds_name in tokens.members():
+                        if ds_name not in ("series", "observations"):
+                            root[ds_name] = tokens.value()  # e.g. "action"
+                            continue
+                        # Decode each series or observation as it is reached
+                        items = ((key, tokens.value()) for key in tokens.members())
+                        yield from self._iter_items(ds_name, items, ds_key)
+                    self.data_sets.append(DataSet(**self._dataset_args(root)))
+                continue
+
+            value = tokens.value()
+            if name == "structure":
+                self._read_structure(value)
+                ds_key = self._make_key("dataSet")
+            elif name == "dataSets":
+                log.info("SDMX-JSON dataSets before structure; decode as a whole")
+                data_sets = value
+
+        if data_sets and ds_key is None:
+            raise ValueError("SDMX-JSON message without structure")
+
+        for ds in data_sets:
+            for ds_name in ("series", "observations"):
+                items = ds.get(ds_name, {}).items()
+                yield from self._iter_items(ds_name, items, ds_key)
+            self.data_sets.append(DataSet(**self._dataset_args(ds)))
+
+    def _iter_items(self, name, items, ds_key):
+        """Yield (SeriesKey, list of Observation) for `items` of a data set.
+
+        `name` is "series" or "observations"; `items` are (key, value) pairs of the
+        corresponding JSON object.
+        """
+        for key, elem in items:
+            if name == "series":
+                series_key = self._make_series_key(key, elem, ds_key)
+                yield series_key, list(self.read_obs(elem, series_key=series_key))
+            else:
+                yield None, [self._make_obs(key, elem, base_key=ds_key)]
+
+    def _read_header(self, elem):
         # TODO handle KeyError here
-        elem = tree["header"]
-        msg.header = Header(
+        self.msg.header = Header(
             id=elem["id"],
             prepared=elem["prepared"],
             sender=model.Agency(**elem["sender"]),
         )
 
-        # pre-fetch some structures for efficient use in series and obs
-        structure = tree["structure"]
+    def _read_structure(self, structure, engine=None):
+        """Read dimensions and attributes, and their values, from `structure`."""
+        msg = self.msg
 
         # Read dimensions and values
         self._dim_level = dict()
+        self._dim_ids = dict()
         self._dim_values = dict()
         for level_name, level in structure["dimensions"].items():
             for elem in level:
@@ -68,10 +267,13 @@ class Reader(BaseReader):
                 # Record the level it appears at
                 self._dim_level[d] = level_name
 
-                # Record values
-                self._dim_values[d] = list()
-                for value in elem.get("values", []):
-                    self._dim_values[d].append(KeyValue(id=d.id, value=value["id"]))
+                # Record values. KeyValues are not needed for ColumnarDataSet
+                self._dim_ids[d] = [value["id"] for value in elem.get("values", [])]
+                self._dim_values[d] = (
+                    []
+                    if engine == "columnar"
+                    else [KeyValue(id=d.id, value=v) for v in self._dim_ids[d]]
+                )
 
         # Assign an order to an implicit dimension
         for d in msg.structure.dimensions:
@@ -125,27 +327,41 @@ class Reader(BaseReader):
                 # Record the level it appears at
                 self._attr_level[da] = level_name
 
-        self.msg = msg
-
-        # Make a SeriesKey for Observations in this DataSet
-        ds_key = self._make_key("dataSet")
-
-        # Read DataSets
-        for ds in tree["dataSets"]:
-            msg.data.append(self.read_dataset(ds, ds_key))
-
-        return msg
-
-    def read_dataset(self, root, ds_key):
-        ds = DataSet(
+        # Position of each dimension in keys
+        self._dim_rank = {
+            d.id: i
+            for i, d in enumerate(
+                sorted(msg.structure.dimensions, key=attrgetter("order"))
+            )
+        }
+
+        # Dimensions and attributes at each level, in order
+        self._level_dims = {
+            level: [d for d in msg.structure.dimensions if self._dim_level[d] == level]
+            for level in ("dataSet", "series", "observation")
+        }
+        self._level_attrs = {
+            level: [a for a in msg.structure.attributes if self._attr_level[a] == level]
+            for level in ("dataSet", "series", "observation")
+        }
+
+    def _dataset_args(self, root):
+        """Return arguments for a DataSet from the members of `root`.
+
+        Only members other than "series" and "observations" are used.
+        """
+        return dict(
             action=ActionType[root["action"].lower()],
             valid_from=root.get("validFrom", None),
+            attrib=self._make_attrs("dataSet", root.get("attributes", [])),
         )
 
+    def read_dataset(self, root, ds_key):
+        ds = DataSet(**self._dataset_args(root))
+
         # Process series
         for key_values, elem in root.get("series", {}).items():
-            series_key = self._make_key("series", key_values, base=ds_key)
-            series_key.attrib = self._make_attrs("series", root.get("attributes", []))
+            series_key = self._make_series_key(key_values, elem, ds_key)
             ds.add_obs(self.read_obs(elem, series_key=series_key), series_key)
 
         # Process bare observations
@@ -153,16 +369,127 @@ class Reader(BaseReader):
 
         return ds
 
+    def read_columnar_dataset(self, root) -> model.ColumnarDataSet:
+        """Read a data set as a :class:`.ColumnarDataSet`.
+
+        The index strings of all observations, e.g. "0:3", are split at once into
+        integer arrays, and the values and attributes of all observations are
+        transposed into columns, without creating any :class:`.Observation`.
+        """
+        # Observation index strings and [value, attribute…] lists; and for each
+        # series, its index string, number of observations, and attribute indices
+        keys: List[str] = []
+        rows: List[list] = []
+        series = []
+        for key, elem in root.get("series", {}).items():
+            obs = elem.get("observations", {})
+            keys.extend(obs.keys())
+            rows.extend(obs.values())
+            series.append((key, len(obs), elem.get("attributes", [])))
+        obs = root.get("observations", {})
+        keys.extend(obs.keys())
+        rows.extend(obs.values())
+        n = len(keys)
+        # Number of observations in series; the remainder are not in any series
+        n_series = sum(s[1] for s in series)
+        counts = [s[1] for s in series] + [n - n_series]
+
+        codes = {}
+        for d in self._level_dims["dataSet"]:
+            codes[d] = np.zeros(n, dtype=np.intp)
+        codes.update(
+            self._split(
+                [s[0] for s in series], self._level_dims["series"], counts, n_series
+            )
+        )
+        codes.update(self._split(keys, self._level_dims["observation"]))
+
+        # Transpose rows into columns: values, then one per observation attribute
+        columns = list(zip_longest(*rows)) or [()]
+        try:
+            values = np.array(columns[0], dtype=float)
+        except ValueError:
+            values = np.array(columns[0], dtype=object)
+        if len(values) < n:
+            values = np.full(n, nan)  # No rows with values
+
+        attrs = {"o": {}, "s": {}, "g": {}}
+        for da, column in zip(self._level_attrs["observation"], columns[1:]):
+            attrs["o"][da.id] = self._attr_column(da, column)
+        series_attrs = list(zip_longest(*[s[2] for s in series]))
+        for da, column in zip(self._level_attrs["series"], series_attrs):
+            attrs["s"][da.id] = self._attr_column(
+                da, np.repeat(np.array(column + (None,), dtype=float), counts)
+            )
+
+        # Same order of dimensions as Observation.key from read_dataset(): the series
+        # key, then the observation dimensions
+        dims = sorted(codes, key=attrgetter("order"))
+        if series:
+            dims = [d for d in dims if d not in self._level_dims["observation"]] + [
+                d for d in dims if d in self._level_dims["observation"]
+            ]
+
+        return model.ColumnarDataSet(
+            **self._dataset_args(root),
+            structured_by=self.msg.structure,
+            dimension_columns={
+                d.id: _coded_column(codes[d], self._dim_ids[d]) for d in dims
+            },
+            attribute_columns=attrs,
+            obs_value=values,
+            series_dimensions=[
+                d.id
+                for d in dims
+                if series and d not in self._level_dims["observation"]
+            ],
+        )
+
+    def _split(self, keys, dims, counts=None, n=None):
+        """Return integer codes for `dims` from index strings `keys`.
+
+        If `counts` is given, the codes for each key are repeated that many times;
+        `counts` has one more element than `keys`, for observations without a key,
+        which receive code -1.
+        """
+        if not dims:
+            return {}
+
+        codes = np.array(":".join(keys).split(":") if keys else [], dtype=np.intp)
+        codes = codes.reshape(len(keys), len(dims))
+        if counts is not None:
+            codes = np.vstack([codes, np.full(len(dims), -1)])
+            codes = np.repeat(codes, counts, axis=0)
+
+        return {d: codes[:, i] for i, d in enumerate(dims)}
+
+    def _attr_column(self, da, indices) -> model.CodedColumn:
+        """Return a :class:`.CodedColumn` for `da` from attribute value `indices`."""
+        indices = np.array(indices, dtype=float)
+        codes = np.where(np.isnan(indices), -1, indices).astype(np.intp)
+        ids = [getattr(av.value, "id", av.value) for av in self._attr_values[da]]
+        return _coded_column(codes, ids)
+
     def read_obs(self, root, series_key=None, base_key=None):
         for key, elem in root.get("observations", {}).items():
-            value = elem.pop(0) if len(elem) else None
-            o = Observation(
-                series_key=series_key,
-                dimension=self._make_key("observation", key, base=base_key),
-                value=value,
-                attached_attribute=self._make_attrs("observation", elem),
-            )
-            yield o
+            yield self._make_obs(key, elem, series_key, base_key)
+
+    def _make_obs(self, key, elem, series_key=None, base_key=None):
+        value = elem.pop(0) if len(elem) else None
+        return self.construct(
+            Observation,
+            series_key=series_key,
+            dimension=self._make_key("observation", key, base=base_key),
+            value=value,
+            attached_attribute=self._make_attrs("observation", elem),
+        )
+
+    def _make_series_key(self, key_values, elem, ds_key):
+        series_key = self._make_key("series", key_values, base=ds_key)
+        self.assign(
+            series_key, attrib=self._make_attrs("series", elem.get("attributes", []))
+        )
+        return series_key
 
     def _make_key(self, level, value=None, base=None):
         """Convert a string observation key *value* to a Key or subclass.
@@ -174,19 +501,31 @@ class Reader(BaseReader):
         KeyValues from any *base* Key are copied, and the new values appended.
         *level* species whether a 'series' or 'observation' Key is returned.
         """
-        # Instance of the proper class
-        key = {"dataSet": Key, "series": SeriesKey, "observation": Key}[level]()
-
-        if base:
-            key.values.update(base.values)
+        # The proper class
+        cls = {"dataSet": Key, "series": SeriesKey, "observation": Key}[level]
 
         # Dimensions at the appropriate level
-        dims = [d for d in self.msg.structure.dimensions if self._dim_level[d] == level]
+        dims = self._level_dims[level]
 
         # Dimensions specified at the dataSet level have only one value, so
         # pre-fill this
         value = ":".join(["0"] * len(dims)) if value is None else value
 
+        if self.trusted:
+            # Values in order, without validation
+            values = dict(base.values) if base else {}
+            if len(value):
+                for index, dim in zip(map(int, value.split(":")), dims):
+                    values[dim.id] = self._dim_values[dim][index]
+            kvs = sorted(values.values(), key=lambda kv: self._dim_rank[kv.id])
+            return cls._fast((kv.id, kv) for kv in kvs)
+
+        # Instance of the proper class
+        key = cls()
+
+        if base:
+            key.values.update(base.values)
+
         if len(value):
             # Iterate over key indices and the corresponding dimensions
             for index, dim in zip(map(int, value.split(":")), dims):
@@ -201,13 +540,127 @@ class Reader(BaseReader):
 
         'level' must be one of 'dataSet', 'series', or 'observation'.
         """
-        attrs = [
-            a for a in self.msg.structure.attributes if self._attr_level[a] == level
-        ]
-        result = {}
+        attrs = self._level_attrs[level]
+        result = DictLike()
         for index, attr in zip(values, attrs):
             if index is None:
                 continue
             av = self._attr_values[attr][index]
             result[av.value_for.id] = av
         return result
+
+
+def _coded_column(codes, ids: List[str]) -> model.CodedColumn:
+    """Return a :class:`.CodedColumn` for `codes`, which are indices into `ids`.
+
+    As for :class:`.ColumnarDataSet` read from SDMX-ML, the levels are sorted.
+    """
+    order = sorted(range(len(ids)), key=ids.__getitem__)
+    # The last element of `remap` maps -1 to itself
+    remap = np.full(len(ids) + 1, -1, dtype=np.intp)
+    remap[order] = np.arange(len(ids))
+    return model.CodedColumn(remap[codes], [ids[i] for i in order])
+
+
+# Whitespace between JSON tokens
+_WS = re.compile(r"[ \t\n\r]*")
+
+_DECODER = json.JSONDecoder()
+
+
+class _Tokenizer:
+    """Incremental reader of JSON from a file-like `source`.
+
+    Objects and arrays are entered with :meth:`members` and :meth:`elements`; any
+    other value is decoded as a whole with :meth:`value`. Only the part of `source` not
+    yet decoded is held in memory, read in chunks of `size` bytes.
+    """
+
+    def __init__(self, source, size=2**16):
+        self.source = source
+        self.size = size
+        self.decoder = codecs.getincrementaldecoder("utf-8")()
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    def _read(self, size):
+        """Read up to `size` more bytes from the source."""
+        chunk = self.source.read(size)
+        self.eof = not len(chunk)
+        if not isinstance(chunk, str):
+            chunk = self.decoder.decode(chunk, final=self.eof)
+        # Discard the part of the buffer already decoded
+        self.buffer = self.buffer[self.pos :] + chunk
+        self.pos = 0
+
+    def _error(self, msg):
+        return json.JSONDecodeError(msg, self.buffer, self.pos)
+
+    def peek(self) -> str:
+        """Return the next character that is not whitespace, without consuming it."""
+        while True:
+            self.pos = _WS.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            elif self.eof:
+                raise self._error("Unexpected end of data")
+            self._read(self.size)
+
+    def expect(self, chars: str) -> str:
+        """Consume and return the next character, which must be one of `chars`."""
+        char = self.peek()
+        if char not in chars:
+            raise self._error(f"Expecting one of {chars!r}")
+        self.pos += 1
+        return char
+
+    def value(self):
+        """Decode and return the next complete value."""
+        self.peek()
+        size = self.size
+        while True:
+            try:
+                result, end = _DECODER.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            else:
+                # A number at the end of the buffer may continue in the next chunk
+                if end < len(self.buffer) or self.eof:
+                    self.pos = end
+                    return result
+            # Read larger chunks, so that a large value is decoded in few attempts
+            self._read(size)
+            size *= 2
+
+    def members(self):
+        """Iterate over the keys of an object.
+
+        After each key is yielded, the caller must consume the corresponding value,
+        e.g. with :meth:`value`.
+        """
+        self.expect("{")
+        if self.peek() == "}":
+            self.pos += 1
+            return
+        while True:
+            key = self.value()
+            self.expect(":")
+            yield key
+            if self.expect(",}") == "}":
+                return
+
+    def elements(self):
+        """Iterate over the elements of an array.
+
+        After each iteration, the caller must consume the element.
+        """
+        self.expect("[")
+        if self.peek() == "]":
+            self.pos += 1
+            return
+        while True:
+            yield
+            if self.expect(",]") == "]":
+                return
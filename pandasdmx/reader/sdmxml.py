@@ -6,14 +6,40 @@
 # - Parser functions for sdmx.message classes, in the same order as message.py
 # - Parser functions for sdmx.model classes, in the same order as model.py
 
+import copyreg
 import logging
+import pickle
 import re
-from collections import ChainMap, defaultdict
+from array import array
+from collections import ChainMap
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager, nullcontext
 from copy import copy
-from itertools import chain, count, product
+from functools import lru_cache
+from io import BytesIO
+from itertools import chain, count, product, repeat
+from math import nan
+from pathlib import Path
 from sys import maxsize
-from typing import Any, Dict, Iterable, Mapping, Optional, Type, Union, cast
+from time import perf_counter
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
 
+import numpy as np
 from dateutil.parser import isoparse
 from lxml import etree
 from lxml.etree import QName
@@ -21,8 +47,12 @@ from lxml.etree import QName
 import pandasdmx.urn
 from pandasdmx import message, model
 from pandasdmx.exceptions import XMLParseError  # noqa: F401
-from pandasdmx.format.xml import CONTENT_TYPES, class_for_tag, qname
+from pandasdmx.format.xml import CONTENT_TYPES, NS, class_for_tag, qname
 from pandasdmx.reader.base import BaseReader
+from pandasdmx.util import DictLike
+
+if TYPE_CHECKING:
+    import pandas
 
 log = logging.getLogger(__name__)
 log.setLevel(logging.DEBUG)
@@ -30,6 +60,12 @@ log.setLevel(logging.DEBUG)
 
 PARSE = {}
 
+# Parsers that replace those in PARSE when reading with engine="columnar"
+COLUMNAR: Dict[Any, Any] = {}
+
+# Parsers that replace those in PARSE for Reader.iter_series()
+STREAM: Dict[Any, Any] = {}
+
 SKIP = (
     "com:Annotations com:Footer footer:Message "
     # Key and observation values
@@ -51,11 +87,89 @@ def add_localizations(target: model.InternationalString, values: list) -> None:
     target.localizations.update({locale: label for locale, label in values})
 
 
+def discard_preceding(elem):
+    """Remove the already-parsed siblings preceding `elem` from the XML tree."""
+    if elem.getprevious() is not None:
+        del elem.getparent()[0]
+
+
+def iter_events(source, schema: etree.XMLSchema = None):
+    """Return an iterator over ("start" or "end", element) tuples parsed from `source`.
+
+    If `source` has a method ``iter_chunks()``, like :class:`.ResponseIO`, each chunk is
+    fed to an :class:`lxml.etree.XMLPullParser` as soon as it is received. Otherwise,
+    :func:`lxml.etree.iterparse` reads `source`. If `schema` is given, `source` is
+    validated against it while parsing.
+    """
+    events = ("start", "end")
+    try:
+        chunks = source.iter_chunks()
+    except AttributeError:
+        return etree.iterparse(source, events=events, schema=schema)
+
+    def _feed(parser):
+        for chunk in chunks:
+            parser.feed(chunk)
+            yield from parser.read_events()
+        parser.close()
+        yield from parser.read_events()
+
+    return _feed(etree.XMLPullParser(events=events, schema=schema))
+
+
 def matching_class(cls):
     """Filter condition; see :meth:`.get_single` and :meth:`.pop_all`."""
     return lambda item: isinstance(item, type) and issubclass(item, cls)
 
 
+@lru_cache(maxsize=None)
+def localname(tag: str) -> str:
+    """Return the local name of `tag`, e.g. "Series" for "{…/generic}Series".
+
+    Like ``QName(tag).localname``, but cached: the number of distinct tags in SDMX-ML
+    is small.
+    """
+    return QName(tag).localname
+
+
+class _Stacks(dict):
+    """Parser stacks: a mapping from class or name to a dict of objects.
+
+    Behaves like ``defaultdict(dict)``, but also maintains an index from any class
+    queried with ``subclass=True`` to the stacks for that class and its subclasses.
+    This avoids checking every stack on each call to :meth:`.Reader.get_single` or
+    :meth:`.Reader.pop_all`.
+    """
+
+    def __init__(self):
+        super().__init__()
+        # Keys of the index are classes; values are ordered sets of stack keys
+        self._index: Dict[type, Dict[type, None]] = dict()
+
+    def __missing__(self, key):
+        result = self[key] = dict()
+
+        if isinstance(key, type):
+            # Add a new class stack to the entries for any of its parents
+            for cls, keys in self._index.items():
+                if issubclass(key, cls):
+                    keys[key] = None
+
+        return result
+
+    def matching(self, cls: type) -> List[type]:
+        """Return keys of the non-empty stacks for `cls` and any of its subclasses."""
+        try:
+            keys = self._index[cls]
+        except KeyError:
+            keys = self._index[cls] = dict.fromkeys(
+                filter(matching_class(cls), self.keys())
+            )
+
+        # Stacks may have been popped, or emptied
+        return [k for k in keys if self.get(k)]
+
+
 def setdefault_attrib(target, elem, *names):
     try:
         for name in names:
@@ -72,27 +186,27 @@ def to_snake(value):
     return TO_SNAKE_RE.sub(r"_\1", value).lower()
 
 
-def start(*args, only=True):
+def start(*args, only=True, table=PARSE):
     """Decorator for a function that parses "start" events for XML elements."""
 
     def decorator(func):
         for tag in to_tags(*args):
-            PARSE[tag, "start"] = func
+            table[tag, "start"] = func
             if only:
-                PARSE[tag, "end"] = None
+                table[tag, "end"] = None
         return func
 
     return decorator
 
 
-def end(*args, only=True):
+def end(*args, only=True, table=PARSE):
     """Decorator for a function that parses "end" events for XML elements."""
 
     def decorator(func):
         for tag in to_tags(*args):
-            PARSE[tag, "end"] = func
+            table[tag, "end"] = func
             if only:
-                PARSE[tag, "start"] = None
+                table[tag, "start"] = None
         return func
 
     return decorator
@@ -218,6 +332,726 @@ class XSDResolver(etree.Resolver):
         return self.resolve_filename(str(fn), context)
 
 
+@lru_cache(maxsize=16)
+def _compile_schema(schema_dir: Path, filename: str, mtime: int) -> etree.XMLSchema:
+    """Parse and compile the XML Schema `filename` in `schema_dir`.
+
+    `mtime` is the modification time of the file. The result is cached for each
+    combination of the arguments; see :meth:`Reader.get_schema`.
+    """
+    parser = etree.XMLParser()
+    # Add filename resolver to enable recursive schema imports
+    parser.resolvers.add(XSDResolver(schema_dir=schema_dir))
+    return etree.XMLSchema(etree.parse(str(schema_dir.joinpath(filename)), parser))
+
+
+def read_schema_filename(source, size=2**12) -> Tuple[Optional[str], bytes]:
+    """Return the schema file name from the root element of `source`, if any.
+
+    `source` is read in chunks of `size` bytes until the root element's start tag is
+    complete, however long it is. The file name is the last part of the
+    ``xsi:schemaLocation`` attribute, e.g. "SDMXMessage.xsd".
+
+    Returns
+    -------
+    tuple
+        The file name, or :obj:`None`; and the bytes read from `source`.
+    """
+    parser = etree.XMLPullParser(events=("start",))
+    chunks = []
+    for chunk in iter(lambda: source.read(size), b""):
+        chunks.append(chunk)
+        try:
+            parser.feed(chunk)
+            for _, root in parser.read_events():
+                location = root.get(qname("xsi", "schemaLocation"))
+                filename = location.split("/")[-1] if location else None
+                return filename, b"".join(chunks)
+        except etree.XMLSyntaxError:
+            break  # Reported when `source` is parsed
+    return None, b"".join(chunks)
+
+
+class _Unread:
+    """File-like `source`, preceded by `head` bytes that were already read from it."""
+
+    def __init__(self, head: bytes, source):
+        self.head, self.source = head, source
+
+    def read(self, size=-1):
+        head, self.head = self.head, b""
+        if size is None or size < 0:
+            return head + self.source.read()
+        elif len(head) >= size:
+            self.head = head[size:]
+            return head[:size]
+        return head + self.source.read(size - len(head))
+
+    def iter_chunks(self):
+        # Raises AttributeError if `source` cannot be read in chunks
+        chunks = self.source.iter_chunks()
+        head, self.head = self.head, b""
+        return chain([head], chunks)
+
+
+class _Column:
+    """Integer codes for the values of one dimension or attribute.
+
+    Used by :class:`_ColumnBuilder`.
+    """
+
+    __slots__ = ("codes", "index")
+
+    def __init__(self):
+        # One code per observation; -1 for no value
+        self.codes = array("l")
+        # Mapping from value to code, in order of first appearance
+        self.index: Dict[str, int] = {}
+
+    def code(self, value: str) -> int:
+        """Return the code for `value`, assigning a new code if needed."""
+        try:
+            return self.index[value]
+        except KeyError:
+            return self.index.setdefault(value, len(self.index))
+
+    def pad(self, n: int) -> None:
+        """Extend :attr:`codes` with -1 to length `n`."""
+        if len(self.codes) < n:
+            self.codes.extend(repeat(-1, n - len(self.codes)))
+
+    def set(self, row: int, value: str) -> None:
+        """Store `value` for observation `row`."""
+        self.pad(row)
+        self.codes.append(self.code(value))
+
+    def fill(self, row: int, n: int, code: int) -> None:
+        """Store `code` for `n` observations, starting at `row`."""
+        self.pad(row)
+        self.codes.extend(repeat(code, n))
+
+    def finish(self, n: int, codes=None) -> model.CodedColumn:
+        """Return a :class:`.CodedColumn` with sorted levels.
+
+        `codes`, if given, are used instead of :attr:`codes`.
+        """
+        if codes is None:
+            self.pad(n)
+            codes = np.asarray(self.codes)
+
+        # Sort the distinct values; map codes in order of appearance to sorted codes.
+        # The last element of `remap` maps -1 to itself.
+        levels = list(self.index)
+        order = sorted(range(len(levels)), key=levels.__getitem__)
+        remap = np.full(len(levels) + 1, -1, dtype=codes.dtype)
+        remap[order] = np.arange(len(levels))
+
+        return model.CodedColumn(remap[codes], [levels[i] for i in order])
+
+
+class _ColumnBuilder:
+    """Collect the contents of a data set as columns.
+
+    Used by :meth:`Reader.read_message` with ``engine="columnar"``. Instead of
+    creating :class:`.Observation` and :class:`.Key` objects, the key values and
+    attributes of each <Series>, <Obs>, and <Group> are stored as integer codes in one
+    :class:`_Column` per dimension or attribute.
+
+    If `extend` is :obj:`True`, IDs that are not a dimension or attribute of `dsd` are
+    added to it as dimensions, like :meth:`.DataStructureDefinition.make_key` with
+    ``extend=True``.
+    """
+
+    def __init__(self, dsd: model.DataStructureDefinition, extend: bool = False):
+        self.dsd = dsd
+        self.extend = extend
+        # Number of observations
+        self.n = 0
+        # Observation values; becomes a list if any value is not a number
+        self.values: Union[array, list] = array("d")
+        # ID of the PrimaryMeasure, giving the observation value
+        self.measure = dsd.measures[0].id if len(dsd.measures) else "OBS_VALUE"
+
+        # Columns for dimensions, in order
+        self.dims = {
+            dim.id: _Column()
+            for dim in sorted(dsd.dimensions.components, key=lambda d: d.order or 0)
+        }
+        # Columns for attributes, by attachment level
+        self.attr_ids = {da.id for da in dsd.attributes.components}
+        self.attrs: Dict[str, Dict[str, _Column]] = {"o": {}, "s": {}, "g": {}}
+
+        # Codes for the current series, and index of its first observation
+        self.series: list = []
+        self.series_start = 0
+        # IDs of dimensions in any series key
+        self.series_dims: Set[str] = set()
+
+        # (key, attributes) for each group
+        self.groups: list = []
+
+    def column(self, id: str, level: str) -> _Column:
+        """Return the column for the dimension or attribute `id`.
+
+        Like :meth:`.DataStructureDefinition.make_key`, raises :class:`KeyError` if
+        `id` is neither.
+        """
+        if id in self.attr_ids:
+            try:
+                return self.attrs[level][id]
+            except KeyError:
+                return self.attrs[level].setdefault(id, _Column())
+        try:
+            return self.dims[id]
+        except KeyError:
+            if not self.extend:
+                raise
+        self.dsd.dimensions.getdefault(id)
+        return self.dims.setdefault(id, _Column())
+
+    def add_attributes(self, ids: Iterable[str]) -> None:
+        """Treat `ids` as attributes, adding them to the DSD if needed."""
+        for id in ids:
+            self.attr_ids.add(self.dsd.attributes.getdefault(id).id)
+
+    def start_series(self, attrib: Mapping[str, str]) -> None:
+        self.series_start = self.n
+        self.series = []
+        self.update_series(attrib)
+
+    def update_series(self, attrib: Mapping[str, str]) -> None:
+        """Add key values or attributes in `attrib` to the current series."""
+        for id, value in attrib.items():
+            column = self.column(id, "s")
+            self.series.append((column, column.code(value)))
+            if id in self.dims:
+                self.series_dims.add(id)
+
+    def end_series(self) -> None:
+        # Store the series key and attributes for all of its observations
+        n = self.n - self.series_start
+        for column, code in self.series:
+            column.fill(self.series_start, n, code)
+        self.series = []
+
+    def add_obs(self, attrib: Mapping[str, str]) -> None:
+        row = self.n
+        for id, value in attrib.items():
+            if id == self.measure:
+                try:
+                    self.values.append(float(value))
+                except ValueError:
+                    # Not a number; store Python objects from here on
+                    self.values = list(self.values)
+                    self.values.append(value)
+            else:
+                self.column(id, "o").set(row, value)
+
+        if len(self.values) == row:
+            # No observation value
+            self.values.append(nan)
+
+        self.n = row + 1
+
+    def add_group(self, attrib: Mapping[str, str]) -> None:
+        key, values = {}, {}
+        for id, value in attrib.items():
+            if id in self.attr_ids:
+                values[id] = value
+            else:
+                self.column(id, "g")  # Raise KeyError for an unknown dimension
+                key[id] = value
+        self.groups.append((key, values))
+
+    def finish(self, ds: model.DataSet) -> model.ColumnarDataSet:
+        """Return a :class:`.ColumnarDataSet` with the same metadata as `ds`."""
+        n = self.n
+
+        # Dimensions added while reading are ordered with the others
+        order = {d.id: d.order or 0 for d in self.dsd.dimensions.components}
+        self.dims = {id: self.dims[id] for id in sorted(self.dims, key=order.get)}
+
+        dim_codes = {}
+        for id, column in self.dims.items():
+            column.pad(n)
+            dim_codes[id] = np.asarray(column.codes)
+
+        # Attach group attributes to the observations with matching key values
+        group_codes: Dict[str, Any] = {}
+        for key, values in self.groups:
+            mask = np.ones(n, dtype=bool)
+            for id, value in key.items():
+                mask &= dim_codes[id] == self.dims[id].index.get(value, -2)
+            for id, value in values.items():
+                codes = group_codes.setdefault(id, np.full(n, -1, dtype=np.int_))
+                codes[mask] = self.column(id, "g").code(value)
+
+        attrs = {
+            level: {id: column.finish(n) for id, column in self.attrs[level].items()}
+            for level in "os"
+        }
+        attrs["g"] = {
+            id: self.attrs["g"][id].finish(n, codes)
+            for id, codes in group_codes.items()
+        }
+
+        return model.ColumnarDataSet(
+            # Metadata, e.g. structured_by
+            **{name: getattr(ds, name) for name in ds.__fields_set__},
+            dimension_columns={
+                id: column.finish(n, dim_codes[id])
+                for id, column in self.dims.items()
+                if len(column.index)
+            },
+            attribute_columns=attrs,
+            obs_value=np.array(
+                self.values, dtype=float if isinstance(self.values, array) else object
+            ),
+            series_dimensions=[id for id in self.dims if id in self.series_dims],
+        )
+
+
+# Parallel parsing; see Reader.read_message(…, workers=…)
+
+# Start and end tags of data sets and series
+_SPLIT_TAG = re.compile(rb"<(/?)(?:\w+:)?(DataSet|Series)\b")
+
+# DSD for each worker process; set by _init_worker()
+_WORKER_DSD: Optional[model.DataStructureDefinition] = None
+
+
+def split_series(data: bytes, n: int) -> Optional[List[bytes]]:
+    """Split the SDMX-ML data message `data` into up to `n` messages.
+
+    Each message has the same header and data set, but a contiguous subset of the
+    <Series> elements. Any <Group> elements, which precede the series, appear in every
+    message. Returns :obj:`None` if `data` does not contain exactly one data set with at
+    least one series.
+    """
+    datasets, ds_end, starts = 0, None, []
+    for match in _SPLIT_TAG.finditer(data):
+        if match.group(2) == b"Series":
+            if not match.group(1):
+                starts.append(match.start())
+        elif match.group(1):
+            ds_end = match.start()
+        else:
+            datasets += 1
+
+    if datasets != 1 or ds_end is None or not starts:
+        return None
+
+    # Boundaries between chunks of ≈ equal numbers of series
+    n = min(n, len(starts))
+    bounds = [starts[len(starts) * i // n] for i in range(n)] + [ds_end]
+    head, tail = data[: starts[0]], data[ds_end:]
+    return [head + data[a:b] + tail for a, b in zip(bounds, bounds[1:])]
+
+
+def _dsd_objects(dsd):
+    """Iterate over (key, object) for `dsd` and the objects it contains.
+
+    Used to keep references to these objects, rather than copies, when messages are
+    pickled between processes.
+    """
+    yield "dsd", dsd
+    for name in ("attributes", "dimensions", "measures"):
+        cl = getattr(dsd, name)
+        yield name, cl
+        yield from (((name, i), c) for i, c in enumerate(cl.components))
+    yield from ((("group", id), gdd) for id, gdd in dsd.group_dimensions.items())
+
+
+def _init_worker(dsd):
+    global _WORKER_DSD
+    _WORKER_DSD = dsd
+
+
+def _dsd_object(key):  # pragma: no cover
+    """Placeholder for the DSD object for `key`; see :func:`_load_chunk`."""
+    raise RuntimeError(key)
+
+
+def _read_chunk(data: bytes, trusted: bool = False) -> bytes:
+    """Parse `data` in a worker process; return the pickled message."""
+    msg = Reader().read_message(BytesIO(data), dsd=_WORKER_DSD, trusted=trusted)
+
+    # Pickle references to the DSD and its contents, instead of copies
+    objects = dict(_dsd_objects(_WORKER_DSD))
+    keys = {id(obj): key for key, obj in objects.items()}
+
+    def reduce(obj):
+        try:
+            return _dsd_object, (keys[id(obj)],)
+        except KeyError:
+            return obj.__reduce_ex__(pickle.HIGHEST_PROTOCOL)
+
+    buf = BytesIO()
+    pickler = pickle.Pickler(buf, pickle.HIGHEST_PROTOCOL)
+    # Use reduce() only for objects of the same classes as in `objects`
+    pickler.dispatch_table = copyreg.dispatch_table.copy()
+    pickler.dispatch_table.update((obj.__class__, reduce) for obj in objects.values())
+    pickler.dump(msg)
+    return buf.getvalue()
+
+
+def _load_chunk(data: bytes, dsd) -> message.DataMessage:
+    """Unpickle a message from :func:`_read_chunk`, referring to `dsd`."""
+    objects = dict(_dsd_objects(dsd))
+
+    class Unpickler(pickle.Unpickler):
+        def find_class(self, module, name):
+            if (module, name) == (__name__, "_dsd_object"):
+                return objects.__getitem__
+            return super().find_class(module, name)
+
+    return Unpickler(BytesIO(data)).load()
+
+
+def merge_data(messages: List[message.DataMessage]) -> message.DataMessage:
+    """Merge the data sets of `messages` into the first message, and return it.
+
+    Each message must contain one data set, with the same groups. Observations and
+    series are appended in order, and associated with the groups of the first
+    message.
+    """
+    ds = messages[0].data[0]
+    for other in map(lambda msg: msg.data[0], messages[1:]):
+        # Equivalent group keys in `other` and `ds`
+        groups = {id(o): gk for o, gk in zip(other.group, ds.group)}
+        for gk_other, gk in zip(other.group, ds.group):
+            ds.group[gk].extend(other.group[gk_other])
+
+        for target in chain(other.series, other.obs):
+            if target.group_keys:
+                new = {groups[id(gk)] for gk in target.group_keys}
+                target.group_keys.clear()
+                target.group_keys.update(new)
+
+        ds.obs.extend(other.obs)
+        for key, obs in other.series.items():
+            ds.series.setdefault(key, []).extend(obs)
+
+    return messages[0]
+
+
+# Lazy parsing of structure messages; see Reader.read_message(…, lazy=True)
+
+#: Attributes of :class:`.StructureMessage`, and the classes of maintainable
+#: artefacts stored in each.
+STRUCTURES = (
+    ("categorisation", model.Categorisation),
+    ("category_scheme", model.CategoryScheme),
+    ("codelist", model.Codelist),
+    ("concept_scheme", model.ConceptScheme),
+    ("constraint", model.ContentConstraint),
+    ("dataflow", model.DataflowDefinition),
+    ("organisation_scheme", model.OrganisationScheme),
+    ("provisionagreement", model.ProvisionAgreement),
+    ("structure", model.DataStructureDefinition),
+)
+
+_STRUCTURES_TAG = re.compile(rb"<((?:\w+:)?Structures)[\s/>]")
+# Any comment, processing instruction, or start/end tag; attribute values may contain
+# ">"
+_ANY_TAG = re.compile(
+    rb"<!--.*?-->|<!\[CDATA\[.*?\]\]>|<\?.*?\?>"
+    rb"|<(/?)([\w:.-]+)((?:\"[^\"]*\"|'[^']*'|[^'\">])*)>",
+    re.DOTALL,
+)
+# Attribute values in either single or double quotes; the value is group 2
+_ID = re.compile(rb"(?:^|\s)id\s*=\s*([\"'])(.*?)\1")
+_PARENT_ID = re.compile(rb"\smaintainableParentID\s*=\s*([\"'])(.*?)\1")
+# Attributes of <Ref> elements, and maintainable IDs in <URN> elements
+_REF = re.compile(
+    rb"<(?:\w+:)?Ref(\s[^>]*)>|<(?:\w+:)?URN>[^<]*?=[\w.@-]+:([\w.@-]+)\("
+)
+
+
+def _ref_ids(data: bytes) -> Generator[str, None, None]:
+    """Generate the IDs of maintainable artefacts referenced in `data`."""
+    for match in _REF.finditer(data):
+        if match.group(2):
+            yield match.group(2).decode()
+        else:
+            # Reference to an item, or to a maintainable artefact
+            id = _PARENT_ID.search(match.group(1)) or _ID.search(match.group(1))
+            if id:
+                yield id.group(2).decode()
+
+
+class _Unloaded:
+    """Placeholder for an artefact in a lazily-parsed :class:`.StructureMessage`."""
+
+    __slots__ = ("loader", "field", "id")
+
+    def __init__(self, loader, field, id):
+        self.loader, self.field, self.id = loader, field, id
+
+    def load(self):
+        return self.loader.load(self.field, self.id)
+
+    def __repr__(self):
+        return f"<unloaded {self.field}[{self.id!r}]>"
+
+
+def _load(value):
+    return value.load() if type(value) is _Unloaded else value
+
+
+class _LazyDictLike(DictLike):
+    """:class:`.DictLike` that parses each artefact the first time it is accessed."""
+
+    __slots__ = ()
+
+    def __getitem__(self, key):
+        return _load(super().__getitem__(key))
+
+    def __getattribute__(self, name):
+        return _load(super().__getattribute__(name))
+
+    def get(self, key, default=None):
+        return _load(super().get(key, default))
+
+    def pop(self, key, *args):
+        return _load(super().pop(key, *args))
+
+    def values(self):
+        return [self[key] for key in self.keys()]
+
+    def items(self):
+        return [(key, self[key]) for key in self.keys()]
+
+    def __copy__(self):
+        return DictLike(self.items())
+
+
+class _LazyStructures:
+    """Index of the maintainable artefacts in a structure message.
+
+    The bytes of each artefact are parsed on first access, together with the message
+    header and any other artefacts it references, so the result is identical to
+    parsing the entire message.
+    """
+
+    def __init__(self, data: bytes, profile: Optional["ParseProfile"] = None):
+        self.data = data
+        self.profile = profile
+        #: (field, id) → (container start tag, container end tag, start, end)
+        self.index: Dict[Tuple[str, str], Tuple[bytes, bytes, int, int]] = {}
+        #: id → keys of :attr:`index`
+        self.by_id: Dict[str, List[Tuple[str, str]]] = {}
+        self.loading: set = set()
+        self.msg = None
+
+    @classmethod
+    def create(cls, data: bytes, profile=None) -> Optional["_LazyStructures"]:
+        """Index `data`.
+
+        Return :obj:`None` if it is not a structure message, or any artefact has no
+        ID, so that `data` is parsed eagerly.
+        """
+        match = _STRUCTURES_TAG.search(data)
+        if match is None:
+            return None
+
+        self = cls(data, profile)
+        start = _ANY_TAG.match(data, match.start())
+        if start.group(3).endswith(b"/"):
+            # Empty <mes:Structures/>
+            self.head, self.tail = data[: start.start()], data[start.end() :]
+            return self
+
+        end = data.rindex(b"</" + match.group(1) + b">")
+        # Header, footer, and the tags enclosing the artefacts
+        self.head = data[: start.end()]
+        self.tail = data[end:]
+
+        pos, container = start.end(), None
+        while True:
+            m = _ANY_TAG.search(data, pos, end)
+            if m is None:
+                break
+            pos = m.end()
+            closing, tag, attrs = m.groups()
+            if tag is None:
+                continue  # Comment etc.
+            elif container is None:
+                # e.g. <str:Codelists>
+                if not attrs.endswith(b"/"):
+                    container = (m.group(0), b"</" + tag + b">")
+            elif closing:
+                container = None
+            else:
+                # A maintainable artefact; skip to its end tag
+                if not attrs.endswith(b"/"):
+                    pos = data.index(b"</" + tag + b">", pos) + len(tag) + 3
+                if not self._add(tag, attrs, container, m.start(), pos):
+                    return None
+
+        return self
+
+    def _add(self, tag, attrs, container, start, end):
+        cls = class_for_tag(qname("str", tag.split(b":")[-1].decode()))
+        field = None
+        for field, base in STRUCTURES:
+            if cls is not None and issubclass(cls, base):
+                break
+        else:
+            log.info(f"Ignore unsupported <{tag.decode()}> with lazy=True")
+            return True
+
+        match = _ID.search(attrs)
+        if match is None:
+            log.info(f"<{tag.decode()}> without id; ignore lazy=True")
+            return False
+
+        id = match.group(2).decode()
+        self.index[(field, id)] = container + (start, end)
+        self.by_id.setdefault(id, []).append((field, id))
+        return True
+
+    def install(self, msg: message.StructureMessage):
+        """Fill `msg` with placeholders for every indexed artefact."""
+        self.msg = msg
+        fields = {field: _LazyDictLike() for field, _ in STRUCTURES}
+        for field, id in self.index:
+            dict.__setitem__(fields[field], id, _Unloaded(self, field, id))
+        for field, value in fields.items():
+            object.__setattr__(msg, field, value)
+
+    def load(self, field: str, id: str):
+        """Parse and return the artefact with `id` in :attr:`msg` `field`."""
+        target = getattr(self.msg, field)
+        value = dict.__getitem__(target, id)
+        if type(value) is not _Unloaded:
+            return value  # Already loaded
+
+        key = (field, id)
+        self.loading.add(key)
+        open_tag, close_tag, start, end = self.index[key]
+        artefact = self.data[start:end]
+
+        # Load other artefacts referenced by this one, so that the references resolve
+        # to the same objects. Skip any that are being loaded, i.e. a cycle.
+        deps = []
+        for dep in chain(*[self.by_id.get(i, ()) for i in set(_ref_ids(artefact))]):
+            if dep not in self.loading:
+                deps.append(self.load(*dep))
+
+        # Parse the artefact alone with the header
+        doc = b"".join([self.head, open_tag, artefact, close_tag, self.tail])
+        reader = Reader()
+        with _profiled(self.profile, reader, PARSE) as parse:
+            for _ in reader._parse(BytesIO(doc), None, parse, deps):
+                pass
+        msg = reader.get_single(message.StructureMessage)
+        result = dict.__getitem__(getattr(msg, field), id)
+        dict.__setitem__(target, id, result)
+
+        # Add external references to artefacts not in the message, as when parsing
+        # the entire message
+        for name, _ in STRUCTURES:
+            lazy = getattr(self.msg, name)
+            for other_id, obj in dict.items(getattr(msg, name)):
+                if other_id not in lazy:
+                    dict.__setitem__(lazy, other_id, obj)
+
+        self.loading.discard(key)
+        return result
+
+
+class ParseProfile:
+    """Calls, time, and objects created by each parser function of :class:`Reader`.
+
+    Pass an instance as the `profile` argument to :func:`.read_sdmx` or
+    :meth:`.Reader.read_message`. It is updated while the message is parsed, and may
+    be reused to accumulate statistics across several messages::
+
+        >>> profile = ParseProfile()
+        >>> msg = read_sdmx("data.xml", profile=profile)
+        >>> print(profile)  # Table of the slowest (XML tag, event) first
+
+    Objects created are those the parser function pushed onto the reader's stacks,
+    including its return value.
+    """
+
+    # Namespace URI → prefix, for display
+    _prefix = {uri: prefix for prefix, uri in NS.items() if uri}
+
+    def __init__(self):
+        #: (tag, event) → [calls, time in seconds, objects created]
+        self.stats: Dict[Tuple[str, str], List] = {}
+
+    @contextmanager
+    def wrap(self, reader: "Reader", parse: Mapping) -> Iterator[Dict]:
+        """Context manager for a copy of the parse table `parse` with timed functions.
+
+        Within the context, `reader`'s :meth:`~.Reader.push` is replaced by one that
+        counts objects. The original is restored on exit.
+        """
+        pushed = [0]
+        push = reader.push
+        shadowed = "push" in vars(reader)
+
+        def counting_push(stack_or_obj, obj=None):
+            if stack_or_obj is not None:
+                pushed[0] += 1
+            push(stack_or_obj, obj)
+
+        reader.push = counting_push  # type: ignore [assignment]
+        try:
+            yield {
+                key: None if func is None else self._wrap(key, func, pushed)
+                for key, func in parse.items()
+            }
+        finally:
+            if shadowed:
+                reader.push = push  # type: ignore [assignment]
+            else:
+                del reader.push
+
+    def _wrap(self, key, func, pushed):
+        tag = QName(key[0])
+        stats = self.stats.setdefault(
+            (f"{self._prefix.get(tag.namespace, '')}:{tag.localname}", key[1]),
+            [0, 0.0, 0],
+        )
+
+        def timed(reader, elem):
+            n = pushed[0]
+            start = perf_counter()
+            result = func(reader, elem)
+            stats[1] += perf_counter() - start
+            stats[0] += 1
+            stats[2] += pushed[0] - n + (result is not None)
+            return result
+
+        return timed
+
+    def to_frame(self) -> "pandas.DataFrame":
+        """Return the statistics for parser functions that were called.
+
+        The result is indexed by (tag, event) and sorted by descending time.
+        """
+        import pandas as pd
+
+        stats = {key: value for key, value in self.stats.items() if value[0]}
+        return pd.DataFrame(
+            list(stats.values()),
+            index=pd.MultiIndex.from_tuples(stats.keys(), names=["tag", "event"]),
+            columns=["calls", "time", "objects"],
+        ).sort_values("time", ascending=False)
+
+    def __str__(self):
+        return self.to_frame().to_string(float_format="{:.3f}".format)
+
+
+def _profiled(profile: Optional[ParseProfile], reader: "Reader", parse: Mapping):
+    """Return :meth:`ParseProfile.wrap`, or a context giving `parse` unchanged."""
+    return nullcontext(parse) if profile is None else profile.wrap(reader, parse)
+
+
 class Reader(BaseReader):
     content_types = CONTENT_TYPES
     suffixes = [".xml"]
@@ -225,6 +1059,9 @@ class Reader(BaseReader):
     # One-way counter for use in stacks
     _count = None
 
+    #: Data sets read by :meth:`iter_series`, without observations.
+    data_sets: List[model.DataSet]
+
     def __init__(self):
         # Initialize counter
         self._count = count()
@@ -242,6 +1079,25 @@ class Reader(BaseReader):
         base_dir = BaseReader.get_schema_dir()
         return base_dir.joinpath("sdmx_2_1/xml")
 
+    @staticmethod
+    def get_schema(filename="SDMXMessage.xsd", schema_dir=None) -> etree.XMLSchema:
+        """Return the compiled XML Schema `filename` in `schema_dir`.
+
+        Compiling the SDMX-ML schemas takes some seconds. The result is cached for each
+        `filename` and `schema_dir`, so this happens once per process, unless the file
+        is modified.
+
+        Parameters
+        ----------
+        filename : str, optional
+            Name of the schema file.
+        schema_dir : path-like or str, optional
+            Directory with the schemas. Default: :meth:`get_schema_dir`.
+        """
+        schema_dir = Path(schema_dir or Reader.get_schema_dir()).resolve()
+        mtime = schema_dir.joinpath(filename).stat().st_mtime_ns
+        return _compile_schema(schema_dir, filename, mtime)
+
     @staticmethod
     def validate_message(msg, schema_dir=None):
         """
@@ -249,6 +1105,9 @@ class Reader(BaseReader):
         must be installed first. See the docs on
         :func:`pandasdmx.api.install_schemas` and
         :meth:`pandasdmx.api.Request.validate`.
+
+        The schemas are compiled once, and then reused; see :meth:`get_schema`. To
+        validate while reading a message, use ``read_message(..., validate=True)``.
         
         Returns whatever lxml.etree.XMLSchema.validate returns
         """
@@ -259,37 +1118,197 @@ class Reader(BaseReader):
             .attrib["{http://www.w3.org/2001/XMLSchema-instance}schemaLocation"]
             .split("/")[-1]
         )
-        # Get default schema_dir if not given
-        schema_dir = schema_dir or Reader.get_schema_dir()
-        schema_path = str(schema_dir.joinpath(schema_fn))
-        p = etree.XMLParser()
-        # Add filename resolver to enable   recursive schema imports
-        p.resolvers.add(XSDResolver(schema_dir=schema_dir))
-        schema_doc = etree.parse(schema_path, parser=p)
-        return etree.XMLSchema(schema_doc).validate(msg_doc)
+        return Reader.get_schema(schema_fn, schema_dir).validate(msg_doc)
 
     def read_message(
-        self, source, dsd: model.DataStructureDefinition = None
+        self,
+        source,
+        dsd: model.DataStructureDefinition = None,
+        engine: str = None,
+        workers: int = None,
+        lazy: bool = False,
+        profile: "ParseProfile" = None,
+        validate: bool = False,
+        schema_dir=None,
+        trusted: bool = False,
     ) -> message.Message:
+        """Read a message from `source`.
+
+        Parameters
+        ----------
+        dsd : .DataStructureDefinition, optional
+            For structure-specific messages, the DSD that structures the data.
+        engine : str, optional
+            If "columnar", store the data in data messages as
+            :class:`.ColumnarDataSet`, which is much faster for large data sets. For
+            structure-specific messages, give `dsd`; otherwise, as when reading
+            without `engine`, every XML attribute is taken to be a dimension.
+        workers : int, optional
+            If given and greater than 1, split a data message with one data set at the
+            boundaries between its series, and parse the parts in this many processes.
+            The data sets from each part are merged into one, identical to the result
+            of parsing in a single process. This requires `dsd`, which is sent once to
+            each process. Messages that cannot be split, e.g. with observations not in
+            series, are parsed in the current process.
+        lazy : bool, optional
+            If :obj:`True`, do not parse the maintainable artefacts in a structure
+            message, only locate them. Each artefact is parsed the first time it is
+            accessed through the :class:`.StructureMessage` attributes, e.g.
+            ``msg.codelist["CL_FREQ"]``, along with any other artefacts that it
+            references. Other messages are parsed as usual.
+        profile : .ParseProfile, optional
+            If given, record the calls, time, and objects created for each parser
+            function, e.g. to find which XML elements are slow to parse.
+        validate : bool, optional
+            If :obj:`True`, validate `source` against the schema given by the
+            ``xsi:schemaLocation`` attribute of its root element, or
+            "SDMXMessage.xsd", while it is parsed. This is faster than calling
+            :meth:`validate_message` and then :meth:`read_message`. Raises
+            :class:`.XMLParseError` if `source` is not valid. See :meth:`get_schema`.
+        schema_dir : path-like or str, optional
+            With `validate`, the directory containing the schemas.
+        trusted : bool, optional
+            If :obj:`True`, create observations, keys, and attribute values without
+            :mod:`pydantic` validation, which is faster. Use only for `source` from a
+            trusted provider, e.g. if also validating against the schemas. See
+            :attr:`.BaseReader.trusted`.
+        """
+        self.trusted = trusted
+
+        try:
+            parse = _TABLES[engine]
+        except KeyError:
+            raise ValueError(f"engine={engine!r}; expected one of {set(_TABLES)}")
+
+        if workers is not None and workers > 1:
+            if dsd is None:
+                raise ValueError(f"workers={workers} requires dsd=…")
+            elif engine is not None:
+                raise NotImplementedError(f"workers={workers} with engine={engine!r}")
+            elif profile is not None:
+                raise NotImplementedError(f"workers={workers} with profile=…")
+            elif validate:
+                raise NotImplementedError(f"workers={workers} with validate=True")
+
+            data = source.read()
+            chunks = split_series(data, workers)
+            if chunks is None or len(chunks) == 1:
+                log.info("Cannot split message at <Series>; parse in 1 process")
+                source = BytesIO(data)
+            else:
+                with ProcessPoolExecutor(
+                    len(chunks), initializer=_init_worker, initargs=(dsd,)
+                ) as pool:
+                    messages = [
+                        _load_chunk(result, dsd)
+                        for result in pool.map(_read_chunk, chunks, repeat(trusted))
+                    ]
+                return merge_data(messages)
+
+        schema = None
+        if validate:
+            # Read the root element to identify the schema
+            filename, head = read_schema_filename(source)
+            schema = self.get_schema(filename or "SDMXMessage.xsd", schema_dir)
+            source = _Unread(head, source)
+
+        if lazy:
+            data = source.read()
+            if schema is not None:
+                try:
+                    etree.fromstring(data, etree.XMLParser(schema=schema))
+                except etree.XMLSyntaxError as exc:
+                    raise XMLParseError from exc
+            loader = _LazyStructures.create(data, profile)
+            if loader is None:
+                source = BytesIO(data)
+            else:
+                # Parse only the header and footer
+                msg = self.read_message(
+                    BytesIO(loader.head + loader.tail), profile=profile, trusted=trusted
+                )
+                loader.install(cast(message.StructureMessage, msg))
+                return msg
+
+        with _profiled(profile, self, parse) as parse:
+            for _ in self._parse(source, dsd, parse, schema=schema):
+                pass  # Nothing streamed
+
+        # Parsing complete; count uncollected items from the stacks, which represent
+        # parsing errors
+
+        # Remove some internal items
+        self.pop_single("SS without DSD")
+        self.pop_single("DataSetClass")
+
+        # Count only non-ignored items
+        uncollected = -1
+        for key, objects in self.stack.items():
+            uncollected += sum(
+                [1 if id(o) not in self.ignore else 0 for o in objects.values()]
+            )
+
+        if uncollected > 0:  # pragma: no cover
+            self._dump()
+            raise RuntimeError(f"{uncollected} uncollected items")
+
+        return cast(message.Message, self.get_single(message.Message, subclass=True))
+
+    def iter_series(
+        self, source, dsd: model.DataStructureDefinition = None
+    ) -> Generator[
+        Tuple[Optional[model.SeriesKey], List[model.Observation]], None, None
+    ]:
+        """Iterate over the series in a data message from `source`.
+
+        Unlike :meth:`read_message`, the data are not collected in a
+        :class:`.DataMessage`: each series is yielded as soon as its end tag is parsed,
+        and its XML elements are then discarded. Memory use is bounded by the size of
+        one series, rather than the whole message.
+
+        The SeriesKeys and Observations are the same as those from
+        :meth:`read_message`, including references to any :class:`.GroupKey`, except
+        that :attr:`.DataSet.group` does not list the observations in each group.
+
+        Attributes attached to each data set are not in the yielded tuples. Once all
+        its series are yielded, the :class:`.DataSet`, without observations but with
+        its :attr:`~.DataSet.attrib`, is appended to :attr:`data_sets`.
+
+        Yields
+        ------
+        tuple of (.SeriesKey, list of .Observation)
+            For observations not in any series, e.g. in a "flat" data set, the
+            SeriesKey is :obj:`None` and the list contains 1 Observation.
+        """
+        self.data_sets = []
+        yield from self._parse(source, dsd, _STREAM_TABLE)
+
+    def _parse(self, source, dsd, parse, objects=(), schema=None):
+        """Parse `source` using the functions in `parse`.
+
+        Yields any objects on the "Stream" stack, as soon as they are pushed. `dsd` and
+        any other `objects` are available to be referenced from `source`. If `schema`
+        is given, `source` is validated against it.
+        """
         # Initialize stacks
-        self.stack: Dict[Union[Type, str], Dict[Union[str, int], Any]] = defaultdict(
-            dict
-        )
+        self.stack: Dict[Union[Type, str], Dict[Union[str, int], Any]]
+        self.stack = _Stacks()
 
         # Elements to ignore when parsing finishes
         self.ignore = set()
 
         # If calling code provided a DSD, add it to a stack, and let it be ignored when
         # parsing finishes
-        self.push(dsd)
-        self.ignore.add(id(dsd))
+        for obj in chain([dsd], objects):
+            self.push(obj)
+            self.ignore.add(id(obj))
 
         try:
             # Use the etree event-driven parser
-            for event, element in etree.iterparse(source, events=("start", "end")):
+            for event, element in iter_events(source, schema):
                 try:
                     # Retrieve the parsing function for this element & event
-                    func = PARSE[element.tag, event]
+                    func = parse[element.tag, event]
                 except KeyError:  # pragma: no cover
                     # Don't know what to do for this (element, event)
                     raise NotImplementedError(element.tag, event) from None
@@ -309,32 +1328,15 @@ class Reader(BaseReader):
                     if event == "end":
                         element.clear()  # Free memory
 
+                        if self.stack.get("Stream"):
+                            yield from self.pop_all("Stream")
+
         except Exception as exc:
             # Parsing failed; display some diagnostic information
             self._dump()
             print(etree.tostring(element, pretty_print=True).decode())
             raise XMLParseError from exc
 
-        # Parsing complete; count uncollected items from the stacks, which represent
-        # parsing errors
-
-        # Remove some internal items
-        self.pop_single("SS without DSD")
-        self.pop_single("DataSetClass")
-
-        # Count only non-ignored items
-        uncollected = -1
-        for key, objects in self.stack.items():
-            uncollected += sum(
-                [1 if id(o) not in self.ignore else 0 for o in objects.values()]
-            )
-
-        if uncollected > 0:  # pragma: no cover
-            self._dump()
-            raise RuntimeError(f"{uncollected} uncollected items")
-
-        return cast(message.Message, self.get_single(message.Message, subclass=True))
-
     def _clean(self):  # pragma: no cover
         """Remove empty stacks."""
         for key in list(self.stack.keys()):
@@ -361,21 +1363,22 @@ class Reader(BaseReader):
             s = stack_or_obj
         else:
             # Element; use its local name
-            s = QName(stack_or_obj).localname
+            s = localname(stack_or_obj.tag)
 
         # Get the ID for the element in the stack: its .id attribute, if any, else a
         # unique number
-        id = getattr(obj, "id", next(self._count)) or next(self._count)
+        id = getattr(obj, "id", None) or next(self._count)
 
-        if id in self.stack[s]:
+        stack = self.stack[s]
+        if id in stack:
             # Avoid a collision for two distinct objects with the same ID, e.g. with
             # different maintainers (ECB:AGENCIES vs. SDMX:AGENCIES). Re-insert with
             # numerical keys. This means the objects cannot be retrieved by their ID,
             # but the code does not rely on this.
-            self.stack[s][next(self._count)] = self.stack[s].pop(id)
+            stack[next(self._count)] = stack.pop(id)
             id = next(self._count)
 
-        self.stack[s][id] = obj
+        stack[id] = obj
 
     def stash(self, *stacks):
         """Temporarily hide all objects in the given `stacks`."""
@@ -404,10 +1407,9 @@ class Reader(BaseReader):
         the stack `cls_or_name` *or any stack for a subclass of this class*.
         """
         if subclass:
-            keys: Iterable[Union[Type, str]] = filter(
-                matching_class(cls_or_name), self.stack.keys()
-            )
-            results: Mapping = ChainMap(*[self.stack[k] for k in keys])
+            keys = self.stack.matching(cast(type, cls_or_name))
+            stacks = [self.stack[k] for k in keys]
+            results: Mapping = stacks[0] if len(stacks) == 1 else ChainMap(*stacks)
         else:
             results = self.stack.get(cls_or_name, dict())
 
@@ -426,9 +1428,7 @@ class Reader(BaseReader):
         the stack `cls_or_name` *or any stack for a subclass of this class*.
         """
         if subclass:
-            keys: Iterable[Union[Type, str]] = list(
-                filter(matching_class(cls_or_name), self.stack.keys())
-            )
+            keys = self.stack.matching(cast(type, cls_or_name))
             result: Iterable = chain(*[self.stack.pop(k).values() for k in keys])
         else:
             result = self.stack.pop(cls_or_name, dict()).values()
@@ -438,17 +1438,15 @@ class Reader(BaseReader):
     def pop_single(self, cls_or_name: Union[Type, str]):
         """Pop a single object from the stack for `cls_or_name` and return."""
         try:
-            return self.stack[cls_or_name].popitem()[1]
+            return self.stack.get(cls_or_name, {}).popitem()[1]
         except KeyError:
             return None
 
     def peek(self, cls_or_name: Union[Type, str]):
         """Get the object at the top of stack `cls_or_name` without removing it."""
         try:
-            key, value = self.stack[cls_or_name].popitem()
-            self.stack[cls_or_name][key] = value
-            return value
-        except KeyError:  # pragma: no cover
+            return next(reversed(self.stack.get(cls_or_name, {}).values()))
+        except StopIteration:  # pragma: no cover
             return None
 
     def pop_resolved_ref(self, cls_or_name: Union[Type, str]):
@@ -766,17 +1764,7 @@ def _structures(reader, elem):
     msg = reader.get_single(message.StructureMessage)
 
     # Populate dictionaries by ID
-    for attr, name in (
-        ("categorisation", model.Categorisation),
-        ("category_scheme", model.CategoryScheme),
-        ("codelist", model.Codelist),
-        ("concept_scheme", model.ConceptScheme),
-        ("constraint", model.ContentConstraint),
-        ("dataflow", model.DataflowDefinition),
-        ("organisation_scheme", model.OrganisationScheme),
-        ("provisionagreement", model.ProvisionAgreement),
-        ("structure", model.DataStructureDefinition),
-    ):
+    for attr, name in STRUCTURES:
         for obj in reader.pop_all(name, subclass=True):
             getattr(msg, attr)[obj.id] = obj
 
@@ -1029,8 +2017,7 @@ def _cl(reader, elem):
     args = dict(components=reader.pop_all(model.Component, subclass=True))
 
     # Determine the class
-    localname = QName(elem).localname
-    if localname == "Group":
+    if localname(elem.tag) == "Group":
         cls = model.GroupDimensionDescriptor
 
         # Replace components with references
@@ -1325,10 +2312,12 @@ def _dfd(reader, elem):
 def _avs(reader, elem):
     ad = reader.get_single("DataSet").structured_by.attributes
 
-    result = {}
+    result = DictLike()
     for e in elem.iterchildren():
         da = ad.getdefault(e.attrib["id"])
-        result[da.id] = model.AttributeValue(value=e.attrib["value"], value_for=da)
+        result[da.id] = reader.construct(
+            model.AttributeValue, value=e.attrib["value"], value_for=da
+        )
 
     reader.push("Attributes", result)
 
@@ -1408,21 +2397,21 @@ def _obs(reader, elem):
     args = dict()
 
     for e in elem.iterchildren():
-        localname = QName(e).localname
-        if localname == "Attributes":
+        name = localname(e.tag)
+        if name == "Attributes":
             args["attached_attribute"] = reader.pop_single("Attributes")
-        elif localname == "ObsDimension":
+        elif name == "ObsDimension":
             # Mutually exclusive with ObsKey
             args["dimension"] = dsd.make_key(
                 model.Key, {dim_at_obs.id: e.attrib["value"]}
             )
-        elif localname == "ObsKey":
+        elif name == "ObsKey":
             # Mutually exclusive with ObsDimension
             args["dimension"] = reader.pop_single(model.Key)
-        elif localname == "ObsValue":
+        elif name == "ObsValue":
             args["value"] = e.attrib["value"]
 
-    return model.Observation(**args)
+    return reader.construct(model.Observation, **args)
 
 
 @end(":Obs")
@@ -1459,10 +2448,14 @@ def _obs_ss(reader, elem):
 
     # Remove attributes from the Key to be attached to the Observation
     aa = key.attrib
-    key.attrib = {}
-
-    return model.Observation(
-        dimension=key, value=value, value_for=pm, attached_attribute=aa
+    reader.assign(key, attrib=DictLike())
+
+    return reader.construct(
+        model.Observation,
+        dimension=key,
+        value=value,
+        value_for=pm,
+        attached_attribute=aa,
     )
 
 
@@ -1501,6 +2494,172 @@ def _ds_end(reader, elem):
     reader.get_single(message.DataMessage).data.append(ds)
 
 
+# §5.4: Data Set with engine="columnar"
+
+
+@start("mes:DataSet", only=False, table=COLUMNAR)
+def _ds_start_columnar(reader, elem):
+    _ds_start(reader, elem)
+
+    ds = reader.peek("DataSet")
+    # Like _key() and _obs_ss(), extend the DSD with dimensions from generic messages,
+    # or from structure-specific messages without a DSD
+    extend = reader.peek("SS without DSD") or isinstance(
+        ds, (model.GenericDataSet, model.GenericTimeSeriesDataSet)
+    )
+
+    reader.push("Columns", _ColumnBuilder(ds.structured_by, extend))
+
+
+@end("mes:DataSet", only=False, table=COLUMNAR)
+def _ds_end_columnar(reader, elem):
+    ds = reader.pop_single("DataSet")
+    result = reader.pop_single("Columns").finish(ds)
+
+    # Collect attributes attached to the data set
+    for id, value in (reader.pop_single("Attributes") or {}).items():
+        result.attrib[id] = model.AttributeValue(
+            value=value, value_for=ds.structured_by.attributes.get(id)
+        )
+
+    reader.get_single(message.DataMessage).data.append(result)
+
+
+@start(":Series", only=False, table=COLUMNAR)
+def _series_start_columnar(reader, elem):
+    reader.peek("Columns").start_series(elem.attrib)
+
+
+@end(":Series", only=False, table=COLUMNAR)
+def _series_end_columnar(reader, elem):
+    reader.peek("Columns").end_series()
+    discard_preceding(elem)
+
+
+@end(":Group", table=COLUMNAR)
+def _group_columnar(reader, elem):
+    attrib = copy(elem.attrib)
+    attrib.pop(qname("xsi", "type"), None)
+    reader.peek("Columns").add_group(attrib)
+
+
+@end(":Obs", table=COLUMNAR)
+def _obs_columnar(reader, elem):
+    reader.peek("Columns").add_obs(elem.attrib)
+    discard_preceding(elem)
+
+
+@end("gen:Attributes", table=COLUMNAR)
+def _avs_columnar(reader, elem):
+    columns = reader.peek("Columns")
+
+    values = {e.attrib["id"]: e.attrib["value"] for e in elem.iterchildren()}
+    columns.add_attributes(values)
+
+    if elem.getparent().tag == qname("gen:Series"):
+        # Precedes the <gen:Obs> of the series
+        columns.update_series(values)
+    else:
+        reader.push("Attributes", values)
+
+
+@end("gen:ObsKey gen:GroupKey gen:SeriesKey", table=COLUMNAR)
+def _key_columnar(reader, elem):
+    values = {e.attrib["id"]: e.attrib["value"] for e in elem.iterchildren()}
+
+    if elem.tag == qname("gen:SeriesKey"):
+        reader.peek("Columns").update_series(values)
+    else:
+        reader.push(localname(elem.tag), values)
+
+
+@start("gen:Series", only=False, table=COLUMNAR)
+def _series_start_generic_columnar(reader, elem):
+    # Key values and attributes are added by _key_columnar() and _avs_columnar()
+    reader.peek("Columns").start_series({})
+
+
+@end("gen:Series", only=False, table=COLUMNAR)
+def _series_end_generic_columnar(reader, elem):
+    _series_end_columnar(reader, elem)
+
+
+@end("gen:Group", table=COLUMNAR)
+def _group_generic_columnar(reader, elem):
+    values = reader.pop_single("GroupKey")
+    values.update(reader.pop_single("Attributes") or {})
+    reader.peek("Columns").add_group(values)
+
+
+@end("gen:Obs", table=COLUMNAR)
+def _obs_generic_columnar(reader, elem):
+    columns = reader.peek("Columns")
+
+    values = {}
+    for e in elem.iterchildren():
+        name = localname(e.tag)
+        if name == "Attributes":
+            values.update(reader.pop_single("Attributes"))
+        elif name == "ObsDimension":
+            # Mutually exclusive with ObsKey
+            dim_at_obs = reader.get_single(message.DataMessage).observation_dimension
+            values[dim_at_obs.id] = e.attrib["value"]
+        elif name == "ObsKey":
+            # Mutually exclusive with ObsDimension
+            values.update(reader.pop_single("ObsKey"))
+        elif name == "ObsValue":
+            values[columns.measure] = e.attrib["value"]
+
+    columns.add_obs(values)
+    discard_preceding(elem)
+
+
+# §5.4: Data Set with Reader.iter_series()
+
+
+@end("gen:Series :Series", table=STREAM)
+def _series_stream(reader, elem):
+    ds = reader.get_single("DataSet")
+
+    if elem.tag == qname("gen:Series"):
+        sk = reader.pop_single(model.SeriesKey)
+        sk.attrib.update(reader.pop_single("Attributes") or {})
+    else:
+        sk = ds.structured_by.make_key(
+            model.SeriesKey, elem.attrib, extend=reader.peek("SS without DSD")
+        )
+    ds._add_group_refs(sk)
+
+    observations = reader.pop_all(model.Observation)
+    for obs in observations:
+        obs.series_key = sk
+        ds._add_group_refs(obs, store=False)
+
+    reader.push("Stream", (sk, observations))
+    discard_preceding(elem)
+
+
+@end("gen:Obs :Obs", table=STREAM)
+def _obs_stream(reader, elem):
+    obs = (_obs if elem.tag == qname("gen:Obs") else _obs_ss)(reader, elem)
+
+    if elem.getparent().tag != qname("mes:DataSet"):
+        return obs  # Collected by _series_stream()
+
+    # Observation not in any series
+    reader.get_single("DataSet")._add_group_refs(obs, store=False)
+    reader.push("Stream", (None, [obs]))
+    discard_preceding(elem)
+
+
+@end("mes:DataSet", only=False, table=STREAM)
+def _ds_end_stream(reader, elem):
+    # All observations were already yielded; keep the data set for its attributes
+    ds = reader.pop_single("DataSet")
+    ds.attrib.update(reader.pop_single("Attributes") or {})
+    reader.data_sets.append(ds)
+
+
 # §11: Data Provisioning
 
 
@@ -1512,3 +2671,13 @@ def _pa(reader, elem):
         structure_usage=reader.pop_resolved_ref("StructureUsage"),
         data_provider=reader.pop_resolved_ref(Reference),
     )
+
+
+# Parsing tables for the `engine` argument to Reader.read_message()
+_TABLES = {
+    None: PARSE,
+    "columnar": {**PARSE, **COLUMNAR},
+}
+
+# Parsing table for Reader.iter_series()
+_STREAM_TABLE = {**PARSE, **STREAM}
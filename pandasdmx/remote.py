@@ -1,6 +1,6 @@
 import logging
 import os
-from io import BufferedIOBase, BytesIO
+from io import BufferedIOBase
 from warnings import warn
 
 import requests
@@ -65,49 +65,100 @@ class Session(MaybeCachedSession):
 class ResponseIO(BufferedIOBase):
     """Buffered wrapper for :class:`requests.Response` with optional file output.
 
-    :class:`ResponseIO` wraps a :class:`requests.Response` object's 'content'
-    attribute, providing a file-like object from which bytes can be :meth:`read`
-    incrementally.
+    :class:`ResponseIO` wraps a :class:`requests.Response` object's content, providing a
+    file-like object from which bytes can be :meth:`read` incrementally.
+
+    The content is retrieved in chunks using :meth:`requests.Response.iter_content`
+    only as it is read. If the response was requested with ``stream=True``, downloading
+    and parsing the content thus overlap, and the content is never held in memory as
+    a whole.
 
     Parameters
     ----------
     response : :class:`requests.Response`
         HTTP response to wrap.
     tee : binary, writable :py:class:`io.BufferedIOBase`, or :class:`fsspec.core.OpenFile` 
-        or :class:`io.PathLike`, defaults to io.BytesIO.
+        or :class:`io.PathLike`, optional
         If *tee* is an open binary file, it is used to store the received data.
         If *tee* is a PathLike, it is passed to  :func:`open`, .  
-        *tee* is exposed as *self.tee* and not closed, so this class may be instantiated
-        in a with-context. The latter is also 
-        recommended if a :class:`fsspec.core.OpenFile` is passed.
+        *tee* is exposed as *self.tee*. It is flushed when the content is exhausted, and
+        closed by :meth:`close`, so this class may be instantiated in a with-context.
+        The latter is also recommended if a :class:`fsspec.core.OpenFile` is passed.
+        Each chunk of content is written to *tee* as it is received.
+    chunk_size : int, optional
+        Size of chunks to retrieve from `response`.
+
+    Notes
+    -----
+    If `response` was requested with ``stream=True``, its content is consumed by
+    reading; :attr:`requests.Response.content` then raises :class:`RuntimeError`. Use
+    `tee` to keep a copy of the content.
     """
 
-    def __init__(self, response, tee=None):
+    def __init__(self, response, tee=None, chunk_size=2**16):
         self.response = response
         # Open a new file in various scenarios, or assume that tee is an open file
-        if tee is None:
-            tee = BytesIO()
-        elif isinstance(tee, (str, os.PathLike)):
+        if isinstance(tee, (str, os.PathLike)):
             tee = open(tee, mode="w+b")
         # Handle the special case of a fsspec.OpenFile
         if isinstance(tee, list):
             assert len(tee) == 1, ValueError(f"Only 1 file allowed, {len(tee)} given.")
             tee = tee[0]
-        # Now tee must be an open file, including when passed as such
-        #   use tee as instance cache
+        # Now tee must be an open file, including when passed as such, or None
         self.tee = tee
 
+        # Chunks of content not yet received
+        self._chunks = response.iter_content(chunk_size=chunk_size)
+        # Content received, but not yet returned by read()
+        self._buffer = bytearray()
+
+    def _next_chunk(self) -> bytes:
+        """Receive the next chunk of content and write it to :attr:`tee`.
+
+        Returns an empty :class:`bytes` when the content is exhausted.
+        """
+        for chunk in self._chunks:
+            if chunk:
+                if self.tee is not None:
+                    self.tee.write(chunk)
+                return chunk
+
         # write content, but do not close the file.
-        tee.write(response.content)
-        tee.flush()
-        tee.seek(0)
+        if self.tee is not None:
+            self.tee.flush()
+        return b""
+
+    def iter_chunks(self):
+        """Iterate over chunks of the content as they are received."""
+        if self._buffer:
+            yield bytes(self._buffer)
+            self._buffer.clear()
+
+        while True:
+            chunk = self._next_chunk()
+            if not chunk:
+                break
+            yield chunk
 
     def readable(self):
         return True
 
     def read(self, size=-1):
-        """Read and return up to `size` bytes by calling ``self.tee.read()``."""
-        return self.tee.read(size)
+        """Read and return up to `size` bytes of content."""
+        if size is None or size < 0:
+            return b"".join(self.iter_chunks())
+
+        while len(self._buffer) < size:
+            chunk = self._next_chunk()
+            if not chunk:
+                break
+            self._buffer += chunk
+
+        result = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        return result
 
     def close(self):
-        self.tee.close()
+        self.response.close()
+        if self.tee is not None:
+            self.tee.close()
@@ -1,4 +1,7 @@
 import importlib
+import json
+import re
+from io import BytesIO
 from setuptools import distutils
 from distutils import version
 from pathlib import Path
@@ -33,6 +36,70 @@ class MessageTest:
         return pandasdmx.read_sdmx(self.path / self.filename)
 
 
+def scaled_message(filename, factor, groups=False):
+    """Return a file-like of the ECB_EXR data message `filename`, scaled up.
+
+    Each <Series> in the specimen is repeated `factor` times, with a distinct value for
+    the TIME_PERIOD of each observation. If `groups` is :obj:`True`, each <Group> is
+    also repeated, and each copy of the groups and series has a distinct CURRENCY.
+    """
+    text = (BASE_PATH / "ECB_EXR" / filename).read_text()
+
+    series = re.findall(r"<(?:\w+:)?Series[ >].*?</(?:\w+:)?Series>", text, re.DOTALL)
+    group = re.findall(
+        r"<(?:\w+:)?Group[ >](?:[^>]*/>|.*?</(?:\w+:)?Group>)", text, re.DOTALL
+    )
+    group = group if groups else []
+    head = text[: text.index((group or series)[0])]
+    tail = text[text.rindex(series[-1]) + len(series[-1]) :]
+
+    def currency(s, i):
+        if groups:
+            # Structure-specific and generic messages, respectively
+            s = re.sub(r'(CURRENCY=")(\w+)', rf"\g<1>\g<2>{i:06d}", s)
+            s = re.sub(r'(value=")(\w+)(" id="CURRENCY")', rf"\g<1>\g<2>{i:06d}\3", s)
+        return s
+
+    parts = [head]
+    for i in range(factor):
+        parts.extend(currency(g, i) for g in group)
+    for i in range(factor):
+        for s in series:
+            parts.append(
+                re.sub(
+                    r'((?:TIME_PERIOD|ObsDimension value)=")(\d{4})',
+                    rf"\g<1>\g<2>{i:06d}",
+                    currency(s, i),
+                )
+            )
+    parts.append(tail)
+
+    return BytesIO("".join(parts).encode())
+
+
+def scaled_json(factor):
+    """Return a file-like of the ECB_EXR SDMX-JSON message "ts.json", scaled up.
+
+    Each series is repeated `factor` times, with a distinct CURRENCY.
+    """
+    tree = json.loads((BASE_PATH / "ECB_EXR" / "ts.json").read_text())
+
+    (currency,) = tree["structure"]["dimensions"]["series"]
+    values = currency["values"]
+    currency["values"] = [
+        dict(v, id=f"{v['id']}{i:06d}") for i in range(factor) for v in values
+    ]
+
+    ds = tree["dataSets"][0]
+    ds["series"] = {
+        str(i * len(values) + int(key)): s
+        for i in range(factor)
+        for key, s in ds["series"].items()
+    }
+
+    return BytesIO(json.dumps(tree).encode())
+
+
 # thanks to xarray
 def _importorskip(modname, minversion=None):
     try:
@@ -1,6 +1,14 @@
+import json
+from io import BytesIO
+from itertools import chain
+
 import pytest
 
 import pandasdmx
+from pandasdmx.model import ColumnarDataSet
+from pandasdmx.reader.sdmxjson import JSON_BACKENDS, Reader
+from pandasdmx.reader.sdmxml import ParseProfile
+from pandasdmx.tests import assert_pd_equal
 from pandasdmx.tests.data import specimen 
 from pandasdmx.tests.data import test_files as _test_files
 
@@ -15,3 +23,173 @@ def test_header():
     with specimen("flat.json") as f:
         resp = pandasdmx.read_sdmx(f)
     assert resp.header.id == "62b5f19d-f1c9-495d-8446-a3661ed24753"
+
+
+@pytest.mark.parametrize("path", **_test_files(format="json"))
+def test_json_read_columnar(path):
+    msg = pandasdmx.read_sdmx(path)
+    msg_c = pandasdmx.read_sdmx(path, engine="columnar")
+    assert all(isinstance(ds, ColumnarDataSet) for ds in msg_c.data)
+    assert list(map(len, msg_c.data)) == [len(ds.obs) for ds in msg.data]
+    for ds, ds_c in zip(msg.data, msg_c.data):
+        assert list(ds_c.series.keys()) == list(ds.series.keys())
+        assert [o.key for o in ds_c.obs] == [o.key for o in ds.obs]
+
+    def value(v):
+        # Code or str from an AttributeValue
+        v = getattr(v, "value", v)
+        return getattr(v, "id", v)
+
+    for attributes in "", "osgd":
+        expected = pandasdmx.to_pandas(msg, attributes=attributes)
+        result = pandasdmx.to_pandas(msg_c, attributes=attributes)
+        if not isinstance(expected, list):
+            expected, result = [expected], [result]
+        for e, r in zip(expected, result):
+            if attributes:
+                e = e.applymap(value)
+            assert_pd_equal(e, r, check_like=True)
+
+
+def test_json_read_series_attributes():
+    with specimen("ts.json") as f:
+        msg = pandasdmx.read_sdmx(f)
+    # Series attributes are read from each series
+    s = list(msg.data[0].series)[0]
+    assert s.attrib["TITLE"].value == "New Zealand dollar (NZD)"
+
+    with pytest.raises(ValueError, match="engine='foo'"):
+        with specimen("ts.json") as f:
+            pandasdmx.read_sdmx(f, engine="foo")
+
+
+@pytest.mark.parametrize("path", **_test_files(format="json"))
+def test_json_read_trusted(path):
+    msg = pandasdmx.read_sdmx(path)
+    msg_t = pandasdmx.read_sdmx(path, trusted=True)
+
+    # Same data sets, observations, and attributes as with validation
+    assert msg.compare(msg_t)
+    for ds, ds_t in zip(msg.data, msg_t.data):
+        assert list(ds.series) == list(ds_t.series)
+        for obs, obs_t in zip(ds.obs, ds_t.obs):
+            assert {k: v.value for k, v in obs.attrib.items()} == {
+                k: v.value for k, v in obs_t.attrib.items()
+            }
+
+
+@pytest.mark.parametrize("json_backend", JSON_BACKENDS)
+def test_json_backend(json_backend):
+    with specimen("ts.json") as f:
+        expected = pandasdmx.read_sdmx(f, json_backend="json")
+    with specimen("ts.json") as f:
+        msg = pandasdmx.read_sdmx(f, json_backend=json_backend)
+
+    assert_pd_equal(pandasdmx.to_pandas(expected), pandasdmx.to_pandas(msg))
+
+    with pytest.raises(ValueError, match="json_backend='foo'"):
+        with specimen("ts.json") as f:
+            pandasdmx.read_sdmx(f, json_backend="foo")
+
+
+def test_json_workers():
+    with specimen("ts.json") as f:
+        assert len(pandasdmx.read_sdmx(f, workers=1).data[0]) == 4
+    with pytest.raises(ValueError, match="workers=2 requires an SDMX-ML message"):
+        with specimen("ts.json") as f:
+            pandasdmx.read_sdmx(f, workers=2)
+
+
+def test_json_lazy():
+    # lazy=False, as passed through read_sdmx(), is accepted and ignored
+    with specimen("ts.json") as f:
+        assert len(pandasdmx.read_sdmx(f, lazy=False).data[0]) == 4
+    with pytest.raises(ValueError, match="lazy=True is not supported for SDMX-JSON"):
+        with specimen("ts.json") as f:
+            pandasdmx.read_sdmx(f, lazy=True)
+
+
+@pytest.mark.parametrize(
+    "name, value", [("validate", True), ("schema_dir", "/tmp/xsd")]
+)
+def test_json_validate(name, value):
+    # validate=False is accepted and ignored
+    with specimen("ts.json") as f:
+        assert len(pandasdmx.read_sdmx(f, validate=False).data[0]) == 4
+    with pytest.raises(ValueError, match=f"{name}=.* is not supported for SDMX-JSON"):
+        with specimen("ts.json") as f:
+            pandasdmx.read_sdmx(f, **{name: value})
+
+
+def test_json_profile():
+    with pytest.raises(ValueError, match="profile=.* is not supported for SDMX-JSON"):
+        with specimen("ts.json") as f:
+            pandasdmx.read_sdmx(f, profile=ParseProfile())
+
+
+def test_json_backend_default(monkeypatch):
+    # The standard library is used unless another backend is selected
+    calls = []
+    monkeypatch.setitem(
+        JSON_BACKENDS, "json", lambda s: calls.append(s) or json.loads(s)
+    )
+    with specimen("ts.json") as f:
+        pandasdmx.read_sdmx(f)
+    assert len(calls) == 1
+
+
+class ChunkedIO(BytesIO):
+    """BytesIO that returns at most 7 bytes from each read()."""
+
+    def read(self, size=-1):
+        return super().read(7)
+
+
+@pytest.mark.parametrize("path", **_test_files(format="json"))
+def test_json_iter_series(path):
+    msg = pandasdmx.read_sdmx(path)
+    tree = json.loads(path.read_text())
+    # The same message, with dataSets before structure
+    reordered = json.dumps(dict(reversed(tree.items()))).encode()
+
+    for source in ChunkedIO(path.read_bytes()), BytesIO(reordered):
+        reader = Reader()
+        result = list(reader.iter_series(source))
+
+        # Same series and observations as read_message(), for all data sets
+        expected = list(chain(*[ds.obs for ds in msg.data]))
+        observations = list(chain(*[obs for _, obs in result]))
+        assert len(observations) == len(expected)
+        for obs, exp in zip(observations, expected):
+            assert obs.key == exp.key and obs.value == exp.value
+            assert {k: str(v) for k, v in obs.attrib.items()} == {
+                k: str(v) for k, v in exp.attrib.items()
+            }
+
+        n_series = sum(len(ds.series) for ds in msg.data)
+        assert len([sk for sk, _ in result if sk is not None]) == n_series
+
+        # Data sets, without observations
+        assert [(ds.action, ds.valid_from, len(ds)) for ds in reader.data_sets] == [
+            (ds.action, ds.valid_from, 0) for ds in msg.data
+        ]
+
+
+def test_json_dataset_attributes():
+    with specimen("ts.json", opened=False) as path:
+        tree = json.loads(path.read_text())
+    tree["structure"]["attributes"]["dataSet"] = [
+        dict(id="FOO", name="Foo", values=[dict(name="a"), dict(name="b")])
+    ]
+    tree["dataSets"][0]["attributes"] = [1]
+    source = json.dumps(tree).encode()
+
+    msg = pandasdmx.read_sdmx(BytesIO(source))
+    assert msg.data[0].attrib["FOO"].value == "b"
+    msg = pandasdmx.read_sdmx(BytesIO(source), engine="columnar")
+    assert msg.data[0].attrib["FOO"].value == "b"
+
+    reader = Reader()
+    for _ in reader.iter_series(ChunkedIO(source)):
+        pass
+    assert reader.data_sets[0].attrib["FOO"].value == "b"
@@ -1,3 +1,4 @@
+import os
 import re
 from io import BytesIO
 from itertools import chain
@@ -7,9 +8,10 @@ from lxml import etree
 
 import pandasdmx
 from pandasdmx.format.xml import qname
-from pandasdmx.model import Facet, FacetType, FacetValueType
-from pandasdmx.reader.sdmxml import Reader, XMLParseError
-from pandasdmx.tests.data import specimen 
+from pandasdmx.model import Codelist, Facet, FacetType, FacetValueType
+from pandasdmx.reader.sdmxml import ParseProfile, Reader, XMLParseError, _Unloaded
+from pandasdmx.tests import assert_pd_equal
+from pandasdmx.tests.data import BASE_PATH, specimen
 from pandasdmx.tests.data import test_files as _test_files
 
 
@@ -19,6 +21,21 @@ def test_read_xml(path):
     pandasdmx.read_sdmx(path)
 
 
+@pytest.mark.parametrize("path", **_test_files(format="xml", kind="data"))
+def test_read_xml_trusted(path):
+    msg = pandasdmx.read_sdmx(path)
+    msg_t = pandasdmx.read_sdmx(path, trusted=True)
+
+    # Same data sets, observations, and attributes as with validation
+    assert msg.compare(msg_t)
+    for ds, ds_t in zip(msg.data, msg_t.data):
+        assert list(ds.series) == list(ds_t.series)
+        for obs, obs_t in zip(ds.obs, ds_t.obs):
+            assert {k: v.value for k, v in obs.attrib.items()} == {
+                k: v.value for k, v in obs_t.attrib.items()
+            }
+
+
 # Read example structure files
 @pytest.mark.parametrize("path", **_test_files(format="xml", kind="structure"))
 def test_read_xml_structure(path):
@@ -77,6 +94,278 @@ def test_read_ss_xml():
     assert len(TIME_FORMAT.related_to.dimensions) == 5
 
 
+@pytest.mark.parametrize(
+    "filename, dsd_filename",
+    [
+        ("ng-flat.xml", None),
+        ("ng-ts.xml", None),
+        ("ng-ts-gf.xml", None),
+        ("ng-flat-ss.xml", "ng-structure-full.xml"),
+        ("sg-ts-gf-ss.xml", "sg-structure.xml"),
+    ],
+)
+def test_iter_series(filename, dsd_filename):
+    path = BASE_PATH / "ECB_EXR"
+    dsd = (
+        pandasdmx.read_sdmx(path / dsd_filename).structure[0] if dsd_filename else None
+    )
+    ds = pandasdmx.read_sdmx(path / filename, dsd=dsd).data[0]
+
+    with open(path / filename, "rb") as f:
+        result = list(Reader().iter_series(f, dsd=dsd))
+
+    # Same series and observations as read_message()
+    if len(ds.series):
+        assert [sk for sk, _ in result] == list(ds.series.keys())
+        assert [len(obs) for _, obs in result] == list(map(len, ds.series.values()))
+    else:
+        assert all(sk is None and len(obs) == 1 for sk, obs in result)
+
+    observations = list(chain(*[obs for _, obs in result]))
+    assert len(observations) == len(ds.obs)
+    for obs, expected in zip(observations, ds.obs):
+        assert obs.key == expected.key and obs.value == expected.value
+        assert obs.attrib == expected.attrib
+
+
+def test_iter_series_dataset_attributes():
+    text = (BASE_PATH / "ECB_EXR" / "ng-ts.xml").read_text()
+    text = text.replace(
+        '<message:DataSet structureRef="STR1">',
+        '<message:DataSet structureRef="STR1"><generic:Attributes>'
+        '<generic:Value id="FOO" value="bar"/></generic:Attributes>',
+    )
+    reader = Reader()
+    assert len(list(reader.iter_series(BytesIO(text.encode())))) == 4
+
+    # The data set, without observations, has the attributes from read_message()
+    (ds,) = reader.data_sets
+    assert len(ds) == 0
+    expected = pandasdmx.read_sdmx(BytesIO(text.encode())).data[0]
+    assert ds.attrib == expected.attrib and ds.attrib["FOO"].value == "bar"
+
+
+@pytest.mark.parametrize(
+    "filename, dsd_filename",
+    [
+        ("ng-ts.xml", "ng-structure-full.xml"),
+        ("ng-ts-gf-ss.xml", "ng-structure-full.xml"),
+        ("rg-ts-ss.xml", "rg-structure.xml"),
+        ("sg-ts-gf.xml", "sg-structure.xml"),
+        ("sg-ts-gf-ss.xml", "sg-structure.xml"),
+        # Cannot be split; parsed in 1 process
+        ("ng-flat-ss.xml", "ng-structure-full.xml"),
+    ],
+)
+def test_read_workers(filename, dsd_filename):
+    path = BASE_PATH / "ECB_EXR"
+    dsd = pandasdmx.read_sdmx(path / dsd_filename).structure[0]
+
+    msg = pandasdmx.read_sdmx(path / filename, dsd=dsd)
+    msg_w = pandasdmx.read_sdmx(path / filename, dsd=dsd, workers=3)
+
+    ds, ds_w = msg.data[0], msg_w.data[0]
+    assert ds_w.structured_by is dsd
+    assert ds_w.obs[-1].key.values[0].value_for is dsd.dimensions[0]
+
+    # Same series, groups, and observations as with 1 process
+    assert list(ds_w.series) == list(ds.series)
+    assert list(map(len, ds_w.series.values())) == list(map(len, ds.series.values()))
+    assert list(ds_w.group) == list(ds.group)
+    assert list(map(len, ds_w.group.values())) == list(map(len, ds.group.values()))
+    for s_w, s in zip(ds_w.series, ds.series):
+        assert s_w.group_keys == s.group_keys
+        assert all(gk in ds_w.group for gk in s_w.group_keys)
+    assert ds_w.compare(ds)
+
+    # Order of columns for group attributes differs between runs
+    assert_pd_equal(
+        pandasdmx.to_pandas(msg, attributes="osgd"),
+        pandasdmx.to_pandas(msg_w, attributes="osgd"),
+        check_like=True,
+    )
+
+
+def test_read_workers_invalid():
+    path = BASE_PATH / "ECB_EXR" / "ng-ts.xml"
+    with pytest.raises(ValueError, match="requires dsd"):
+        pandasdmx.read_sdmx(path, workers=2)
+
+
+@pytest.mark.parametrize(
+    "filename",
+    [
+        "ECB/orgscheme.xml",
+        "ECB_EXR/ng-structure-full.xml",
+        "ECB_EXR/sg-structure-full.xml",
+        "ESTAT/apro_mk_cola-structure.xml",
+        "INSEE/CNA-2010-CONSO-SI-A17-structure.xml",
+        "INSEE/IPI-2010-A21-structure.xml",
+        "INSEE/dataflow.xml",
+        "SGR/common-structure.xml",
+    ],
+)
+def test_read_lazy(filename):
+    msg = pandasdmx.read_sdmx(BASE_PATH / filename)
+    msg_l = pandasdmx.read_sdmx(BASE_PATH / filename, lazy=True)
+    assert msg_l.header.id == msg.header.id
+
+    # Accessing one artefact parses it, but not unrelated artefacts
+    field = next(
+        f for f in ("codelist", "dataflow", "organisation_scheme") if getattr(msg, f)
+    )
+    id = next(iter(getattr(msg, field)))
+    assert getattr(msg_l, field)[id].compare(getattr(msg, field)[id])
+    assert sum(type(obj) is Codelist for obj in dict.values(msg_l.codelist)) <= 1
+
+    # Entire message is identical
+    assert msg_l.compare(msg)
+    for field in ("codelist", "dataflow", "structure"):
+        assert set(getattr(msg_l, field)) == set(getattr(msg, field))
+
+    # References among artefacts are to the same objects
+    for dsd in msg_l.structure.values():
+        for dim in dsd.dimensions:
+            cl = dim.local_representation and dim.local_representation.enumerated
+            if cl is not None and not cl.is_external_reference:
+                assert cl is msg_l.codelist[cl.id]
+    for dfd in msg_l.dataflow.values():
+        if dfd.structure.id in msg_l.structure:
+            assert dfd.structure is msg_l.structure[dfd.structure.id]
+
+
+def test_read_lazy_quotes(tmp_path):
+    # Same message with attribute values in single quotes
+    data = (BASE_PATH / "ECB_EXR" / "ng-structure-full.xml").read_bytes()
+    path = tmp_path / "structure.xml"
+    path.write_bytes(re.sub(rb'(\s[\w:]+\s*=\s*)"([^"\']*)"', rb"\1'\2'", data))
+    assert b' id="' not in path.read_bytes()
+
+    msg = pandasdmx.read_sdmx(path)
+    msg_l = pandasdmx.read_sdmx(path, lazy=True)
+    assert isinstance(dict.__getitem__(msg_l.codelist, "CL_FREQ"), _Unloaded)
+    assert msg_l.compare(msg)
+
+    # An artefact without an ID is parsed eagerly, giving the same error
+    tag = b"<structure:Codelist"
+    path.write_bytes(data.replace(tag + b' id="CL_FREQ"', tag))
+    for lazy in False, True:
+        with pytest.raises(XMLParseError):
+            pandasdmx.read_sdmx(path, lazy=lazy)
+
+
+def test_read_lazy_data():
+    # Other messages are parsed as usual
+    msg = pandasdmx.read_sdmx(BASE_PATH / "ECB_EXR" / "ng-ts.xml", lazy=True)
+    assert len(msg.data[0].obs) == 12
+
+
+def test_read_profile():
+    path = BASE_PATH / "ECB_EXR" / "ng-ts.xml"
+    profile = ParseProfile()
+    msg = pandasdmx.read_sdmx(path, profile=profile)
+
+    # Message is identical to one read without profiling
+    assert msg.compare(pandasdmx.read_sdmx(path))
+
+    df = profile.to_frame()
+    assert df.loc[("gen:Obs", "end"), "calls"] == 12
+    assert df.loc[("gen:Series", "end"), "calls"] == 4
+    assert df.loc[("mes:Header", "end"), "objects"] == 0
+    assert (df["time"] > 0).all() and df["time"].is_monotonic_decreasing
+    assert "gen:Obs" in str(profile)
+
+    # Statistics accumulate across messages
+    pandasdmx.read_sdmx(path, profile=profile)
+    assert profile.to_frame().loc[("gen:Obs", "end"), "calls"] == 24
+
+    # A reused Reader is restored after each message, and not profiled twice
+    reader, profile = Reader(), ParseProfile()
+    for _ in range(2):
+        with open(path, "rb") as f:
+            reader.read_message(f, profile=profile)
+        assert "push" not in vars(reader)
+    assert profile.to_frame().loc[("gen:Obs", "end"), "objects"] == 24
+
+    # Lazily-parsed artefacts are included when they are accessed
+    profile = ParseProfile()
+    msg = pandasdmx.read_sdmx(
+        BASE_PATH / "ECB_EXR" / "ng-structure-full.xml", lazy=True, profile=profile
+    )
+    assert ("str:Code", "end") not in profile.to_frame().index
+    msg.codelist["CL_FREQ"]
+    assert profile.to_frame().loc[("str:Code", "end"), "calls"] == 8
+
+    with pytest.raises(NotImplementedError):
+        pandasdmx.read_sdmx(path, dsd=msg.structure[0], workers=2, profile=profile)
+
+
+# Minimal schema with one root element in the message namespace, of any content
+SCHEMA = """<?xml version="1.0" encoding="UTF-8"?>
+<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema"
+  targetNamespace="http://www.sdmx.org/resources/sdmxml/schemas/v2_1/message"
+  elementFormDefault="qualified">
+  <xs:element name="{}">
+    <xs:complexType>
+      <xs:sequence>
+        <xs:any processContents="skip" minOccurs="0" maxOccurs="unbounded"/>
+      </xs:sequence>
+    </xs:complexType>
+  </xs:element>
+</xs:schema>
+"""
+
+
+def test_read_validate(tmp_path):
+    for root in "Structure", "GenericData":
+        (tmp_path / root).mkdir()
+        (tmp_path / root / "SDMXMessage.xsd").write_text(SCHEMA.format(root))
+
+    path = BASE_PATH / "ECB_EXR" / "ng-structure-full.xml"
+
+    # Schemas are compiled once per file and directory
+    schema = Reader.get_schema(schema_dir=tmp_path / "Structure")
+    assert schema is Reader.get_schema("SDMXMessage.xsd", str(tmp_path / "Structure"))
+    assert schema is not Reader.get_schema(schema_dir=tmp_path / "GenericData")
+    assert Reader.validate_message(path, schema_dir=tmp_path / "Structure")
+
+    # Validated while reading
+    msg = pandasdmx.read_sdmx(
+        path, validate=True, schema_dir=tmp_path / "Structure"
+    )
+    assert msg.compare(pandasdmx.read_sdmx(path))
+    with open(path, "rb") as f:
+        msg = pandasdmx.read_sdmx(
+            BytesIO(f.read()), validate=True, schema_dir=tmp_path / "Structure"
+        )
+    assert len(msg.codelist) == 8
+
+    for lazy in False, True:
+        with pytest.raises(XMLParseError):
+            pandasdmx.read_sdmx(
+                path, validate=True, schema_dir=tmp_path / "GenericData", lazy=lazy
+            )
+
+    # The schema is identified from a root start tag longer than one read
+    text = path.read_text()
+    i = text.index(" xsi:schemaLocation")
+    text = text[:i] + f' xmlns:foo="{"x" * 2**13}"' + text[i:]
+    text = text.replace("SDMXMessage.xsd", "Other.xsd", 1)
+    (tmp_path / "Structure" / "Other.xsd").write_text(SCHEMA.format("GenericData"))
+    with pytest.raises(XMLParseError):
+        pandasdmx.read_sdmx(
+            BytesIO(text.encode()), validate=True, schema_dir=tmp_path / "Structure"
+        )
+
+    # A modified schema file is compiled again
+    (tmp_path / "Structure" / "Other.xsd").write_text(SCHEMA.format("Structure"))
+    os.utime(tmp_path / "Structure" / "Other.xsd", ns=(0, 0))
+    msg = pandasdmx.read_sdmx(
+        BytesIO(text.encode()), validate=True, schema_dir=tmp_path / "Structure"
+    )
+    assert len(msg.codelist) == 8
+
+
 E = etree.Element
 
 # Each entry is a tuple with 2 elements:
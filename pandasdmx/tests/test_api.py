@@ -4,7 +4,9 @@ from io import BytesIO
 import pandas as pd
 import pytest
 import pandasdmx
+from pandasdmx.model import ColumnarDataSet
 
+from . import assert_pd_equal
 from .data import specimen
 
 
@@ -66,6 +68,92 @@ def test_request_get_exceptions():
         pandasdmx.read_url("https://example.com", foo="bar")
 
 
+def test_request_get_json_backend():
+    import requests_mock
+
+    req = pandasdmx.Request("ECB")
+    args = dict(resource_id="EXR", key="D.NZD+RUB.EUR.SP00.A")
+    url = req.data(**args, dry_run=True).url
+
+    with specimen("ts.json", opened=False) as path:
+        content = path.read_bytes()
+
+    with requests_mock.Mocker() as m:
+        m.get(url, content=content, headers={"Content-Type": "text/json"})
+
+        # The option is passed to the SDMX-JSON reader, not used in the query
+        msg = req.data(**args, json_backend="json")
+        assert len(msg.data[0].obs) == 4
+        assert m.last_request.url == url
+
+        with pytest.raises(ValueError, match="json_backend='foo'"):
+            req.data(**args, json_backend="foo")
+
+
+def test_request_get_to_pandas():
+    import requests_mock
+
+    req = pandasdmx.Request("ECB")
+    args = dict(resource_id="EXR", key="D.NZD+RUB.EUR.SP00.A")
+    url = req.data(**args, dry_run=True).url
+
+    def value(v):
+        # Code or str from an AttributeValue
+        v = getattr(v, "value", v)
+        return getattr(v, "id", v)
+
+    for name, content_type in (
+        ("ts.json", "text/json"),
+        ("ng-ts.xml", "application/xml"),
+    ):
+        with specimen(name, opened=False) as path:
+            content = path.read_bytes()
+            expected = pandasdmx.to_pandas(pandasdmx.read_sdmx(path), attributes="os")
+
+        with requests_mock.Mocker() as m:
+            m.get(url, content=content, headers={"Content-Type": content_type})
+
+            # The options are passed to to_pandas(), not used in the query
+            result = req.data(**args, to="pandas", attributes="os")
+            assert m.last_request.url == url
+
+        assert_pd_equal(expected.applymap(value), result, check_like=True)
+
+    with pytest.raises(ValueError, match="to='foo'"):
+        req.data(**args, to="foo")
+
+
+def test_request_get_to_pandas_cache():
+    import requests_mock
+
+    req = pandasdmx.Request("ECB")
+    req.clear_cache()
+    args = dict(resource_id="EXR", key="D.NZD+RUB.EUR.SP00.A", use_cache=True)
+    url = req.data(**args, dry_run=True).url
+
+    with specimen("ng-ts.xml", opened=False) as path:
+        content = path.read_bytes()
+
+    with requests_mock.Mocker() as m:
+        m.get(url, content=content, headers={"Content-Type": "application/xml"})
+
+        result = req.data(**args, to="pandas")
+        assert isinstance(result, pd.Series)
+
+        # The message read for to="pandas" is not returned without `to`
+        msg = req.data(**args)
+        assert not isinstance(msg.data[0], ColumnarDataSet)
+        assert len(msg.data[0].obs) == 12
+        assert m.call_count == 2
+
+        # Both messages are cached
+        assert req.data(**args) is msg
+        assert_pd_equal(result, req.data(**args, to="pandas"))
+        assert m.call_count == 2
+
+    req.clear_cache()
+
+
 @pytest.mark.network
 def test_request_get_args():
     req = pandasdmx.Request("ESTAT")
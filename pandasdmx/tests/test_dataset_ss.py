@@ -1,5 +1,6 @@
 from collections.abc import Mapping
 
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -7,7 +8,7 @@ import pandasdmx
 from pandasdmx import message, model
 from pandasdmx.model import Key
 
-from . import MessageTest
+from . import MessageTest, assert_pd_equal
 
 
 class StructuredMessageTest(MessageTest):
@@ -228,3 +229,139 @@ class TestSeriesData_RateGroup_TS(StructuredMessageTest):
         g_attrib = s.group_attrib
         assert isinstance(g_attrib, Mapping)
         assert len(g_attrib) == 5
+
+
+class TestFlatData_SiblingGroup(StructuredMessageTest):
+    filename = "sg-ts-gf-flat-ss.xml"
+    dsd_filename = "sg-structure.xml"
+
+    def test_groups(self, msg):
+        data = msg.data[0]
+        assert len(data.group) == 4
+        assert len(data.series) == 0
+
+        # Each observation is associated with 1 group, and appears once in its list
+        assert all(len(obs.group_keys) == 1 for obs in data.obs)
+        for gk, observations in data.group.items():
+            assert len(observations) == len(set(map(id, observations))) == 3
+            assert all(gk in obs.group_keys for obs in observations)
+
+
+@pytest.mark.parametrize(
+    "filename, dsd_filename",
+    [
+        ("ng-flat-ss.xml", "ng-structure-full.xml"),
+        ("ng-ts-gf-ss.xml", "ng-structure-full.xml"),
+        ("ng-ts-ss.xml", "ng-structure-full.xml"),
+        ("ng-xs-ss.xml", "ng-structure-full.xml"),
+        ("rg-ts-ss.xml", "rg-structure.xml"),
+        ("sg-ts-gf-flat-ss.xml", "sg-structure.xml"),
+        ("sg-ts-gf-ss.xml", "sg-structure.xml"),
+        ("sg-ts-ss.xml", "sg-structure.xml"),
+        ("sg-xs-ss.xml", "sg-structure.xml"),
+    ],
+)
+def test_columnar(filename, dsd_filename):
+    path = StructuredMessageTest.path
+    dsd = pandasdmx.read_sdmx(path / dsd_filename).structure[0]
+
+    msg = pandasdmx.read_sdmx(path / filename, dsd=dsd)
+    msg_c = pandasdmx.read_sdmx(path / filename, dsd=dsd, engine="columnar")
+
+    ds = msg_c.data[0]
+    assert isinstance(ds, model.ColumnarDataSet)
+    assert ds.structured_by is dsd
+    assert len(ds) == len(ds.obs) == len(msg.data[0])
+
+    # Same series keys, with the same number of observations
+    expected = msg.data[0]
+    assert list(ds.series.keys()) == list(expected.series.keys())
+    assert list(map(len, ds.series.values())) == list(
+        map(len, expected.series.values())
+    )
+    # Observations are created on access, with the same keys and attributes
+    for obs, exp in zip(ds.obs, expected.obs):
+        assert obs.key == exp.key and obs.value == float(exp.value)
+        assert obs.series_key == exp.series_key
+        assert {k: v.value for k, v in obs.attrib.items()} == {
+            k: v.value for k, v in exp.attrib.items()
+        }
+    assert ds.obs[-1].key == expected.obs[-1].key
+
+    # Same values, without and with attributes
+    assert_pd_equal(
+        pandasdmx.to_pandas(msg, attributes=""),
+        pandasdmx.to_pandas(msg_c, attributes=""),
+    )
+    expected = pandasdmx.to_pandas(msg, attributes="osgd").applymap(
+        lambda v: getattr(v, "value", v)
+    )
+    # Order of columns for group attributes differs between runs
+    assert_pd_equal(
+        expected, pandasdmx.to_pandas(msg_c, attributes="osgd"), check_like=True
+    )
+
+
+def test_columnar_constraint():
+    path = StructuredMessageTest.path
+    dsd = pandasdmx.read_sdmx(path / "ng-structure-full.xml").structure[0]
+    msg = pandasdmx.read_sdmx(path / "ng-ts-ss.xml", dsd=dsd, engine="columnar")
+
+    cc = dsd.make_constraint({"CURRENCY": "JPY+USD"})
+    result = pandasdmx.to_pandas(msg, constraint=cc)
+    assert len(result) == 6
+    assert set(result.index.unique("CURRENCY")) == {"JPY", "USD"}
+
+
+def test_columnar_without_dsd():
+    path = StructuredMessageTest.path
+    msg = pandasdmx.read_sdmx(path / "ng-ts-ss.xml")
+    msg_c = pandasdmx.read_sdmx(path / "ng-ts-ss.xml", engine="columnar")
+
+    # As without engine, the DSD is extended and all XML attributes are dimensions
+    ds = msg_c.data[0]
+    assert set(ds.dimension_columns) == {
+        d.id for d in msg.data[0].structured_by.dimensions
+    }
+    assert not any(ds.attribute_columns.values())
+    assert len(ds) == len(msg.data[0])
+
+
+def test_columnar_structure_unchanged():
+    # A DSD with only one of the dimensions and none of the attributes
+    dsd = model.DataStructureDefinition()
+    dsd.dimensions.getdefault("FOO")
+    ds = model.ColumnarDataSet(
+        structured_by=dsd,
+        dimension_columns=dict(
+            FOO=model.CodedColumn(np.array([0, 1]), ["a", "b"]),
+            BAR=model.CodedColumn(np.array([0, 0]), ["c"]),
+        ),
+        attribute_columns=dict(o=dict(BAZ=model.CodedColumn(np.array([0, -1]), ["d"]))),
+        obs_value=np.array([1.0, 2.0]),
+    )
+
+    # Observations are created without extending the DSD
+    obs = ds.obs[0]
+    assert obs.key == Key(FOO="a", BAR="c")
+    assert obs.dimension.values["FOO"].value_for is dsd.dimensions.get("FOO")
+    assert obs.attrib["BAZ"].value == "d"
+    assert [d.id for d in dsd.dimensions] == ["FOO"] and len(dsd.attributes) == 0
+
+    # Without a DSD, none is set
+    ds = model.ColumnarDataSet(
+        dimension_columns=ds.dimension_columns, obs_value=ds.obs_value
+    )
+    assert [o.key for o in ds.obs] == [Key(FOO="a", BAR="c"), Key(FOO="b", BAR="c")]
+    assert ds.structured_by is None
+
+
+def test_columnar_invalid():
+    path = StructuredMessageTest.path
+    with pytest.raises(ValueError, match="engine='foo'"):
+        pandasdmx.read_sdmx(path / "ng-ts-ss.xml", engine="foo")
+
+    # The table used by Reader.iter_series() is not an engine
+    with pytest.raises(ValueError, match="engine='stream'") as exc_info:
+        pandasdmx.read_sdmx(path / "ng-ts-ss.xml", engine="stream")
+    assert "'stream'" not in str(exc_info.value).split(";")[1]
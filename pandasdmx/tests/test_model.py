@@ -1,5 +1,7 @@
 # TODO test str() and repr() implementations
+import pickle
 
+import pandas as pd
 import pydantic
 import pytest
 from pytest import raises
@@ -24,7 +26,9 @@ from pandasdmx.model import (
     Item,
     ItemScheme,
     Key,
+    KeyValue,
     Observation,
+    SeriesKey,
 )
 
 
@@ -39,6 +43,42 @@ def test_contentconstraint():
     cr.data_content_region = CubeRegion(included=True, member={})
 
 
+def test_contentconstraint_mask():
+    dsd = DataStructureDefinition()
+    for order, id in enumerate(["foo", "bar"]):
+        dsd.dimensions.append(Dimension(id=id, order=order))
+    keys = [Key(foo=f, bar=b) for f in "abc" for b in "xyz"]
+
+    cc = dsd.make_constraint({"foo": "a+b", "bar": "y+z"})
+    # An excluded MemberSelection, and a second, excluded CubeRegion
+    cc.data_content_region[0].member[dsd.dimensions.get("foo")].included = False
+    cc.data_content_region.append(
+        CubeRegion(
+            included=False,
+            member={
+                dsd.dimensions.get("bar"): model.MemberSelection(
+                    values_for=dsd.dimensions.get("bar"),
+                    values=[model.MemberValue(value="z")],
+                )
+            },
+        )
+    )
+
+    # Same result as the membership test, for keys and pandas objects
+    expected = [k in cc for k in keys]
+    assert expected == [False] * 7 + [True, False]  # foo=c, bar=y
+    assert cc.mask(keys).tolist() == expected
+    df = pd.DataFrame([k.get_values() for k in keys], columns=["foo", "bar"])
+    assert cc.mask(df).tolist() == expected
+    assert cc.mask(pd.MultiIndex.from_frame(df)).tolist() == expected
+    assert cc.data_content_region[1].mask(df).tolist() == [
+        k in cc.data_content_region[1] for k in keys
+    ]
+
+    with pytest.raises(NotImplementedError):
+        ContentConstraint(role=cc.role).mask(keys)
+
+
 def test_dataset():
     # Enumeration values can be used to initialize
     from pandasdmx.model import ActionType
@@ -47,6 +87,49 @@ def test_dataset():
     DataSet(action=ActionType["information"])
 
 
+def test_dataset_group_refs():
+    foo = [Dimension(id="foo"), Dimension(id="other")]
+    ds = DataSet(group={GroupKey(foo=1): [], GroupKey(foo=2): []})
+    sk = SeriesKey(foo=1, bar=1)
+    ds.add_obs([], sk)
+    assert sk.group_keys == {GroupKey(foo=1)}
+
+    # Replacing the groups, with the same number of keys
+    gk = GroupKey([KeyValue(id="foo", value=3, value_for=foo[0])])
+    ds.group = {gk: [], GroupKey(foo=4): []}
+
+    # Only group keys with the same value_for, or none, apply
+    for value_for, expected in (foo[0], {gk}), (foo[1], set()), (None, {gk}):
+        sk = SeriesKey([KeyValue(id="foo", value=3, value_for=value_for)])
+        ds.add_obs([], sk)
+        assert sk.group_keys == expected
+
+
+def test_dataset_attrib_columns():
+    def attrs(**values):
+        return {k: AttributeValue(value=v) for k, v in values.items()}
+
+    gk = GroupKey(foo=1, attrib=attrs(G="g"))
+    sk1 = SeriesKey(foo=1, bar=1, attrib=attrs(S="s1"))
+    sk2 = SeriesKey(foo=2, bar=1, attrib=attrs(S="s2", O="s2"))
+    observations = [
+        Observation(series_key=sk1, attached_attribute=attrs(O="o1"), group_keys={gk}),
+        Observation(series_key=sk2, attached_attribute=attrs(O="o2")),
+        Observation(series_key=sk1),
+        Observation(),
+    ]
+
+    columns = DataSet.attrib_columns(observations)
+
+    # Same values as Observation.attrib, including precedence of series attributes
+    assert set(columns) == {"G", "O", "S"}
+    for i, obs in enumerate(observations):
+        assert {k: c[i] for k, c in columns.items() if c[i] is not None} == dict(
+            obs.attrib
+        )
+    assert columns["O"] == ["o1", "s2", None, None]
+
+
 def test_datastructuredefinition():
     dsd = DataStructureDefinition()
 
@@ -81,6 +164,163 @@ def test_datastructuredefinition():
     DataStructureDefinition.from_keys([key1, key2])
 
 
+def test_datastructuredefinition_make_key():
+    dsd = DataStructureDefinition()
+    for order, id in enumerate(["foo", "bar"]):
+        dsd.dimensions.append(Dimension(id=id, order=order))
+    dsd.attributes.append(DataAttribute(id="qux"))
+
+    # Values are sorted by the order of dimensions, and attributes are separated
+    k1 = dsd.make_key(model.SeriesKey, dict(bar="b", foo="f", qux="q"))
+    assert isinstance(k1, model.SeriesKey) and k1.described_by is dsd.dimensions
+    assert list(k1.values) == ["foo", "bar"]
+    assert k1.values["foo"].value_for is dsd.dimensions.get("foo")
+    assert k1.attrib["qux"].value_for is dsd.attributes.get("qux")
+
+    # KeyValues and AttributeValues are shared between keys with the same values
+    k2 = dsd.make_key(Key, dict(foo="f", bar="b2", qux="q"))
+    assert k2.values["foo"] is k1.values["foo"]
+    assert k2.attrib["qux"] is k1.attrib["qux"]
+    assert k1 == Key(foo="f", bar="b") and k2 == Key(foo="f", bar="b2")
+
+    # Unknown dimensions raise KeyError…
+    with pytest.raises(KeyError):
+        dsd.make_key(Key, dict(foo="f", baz="z"))
+
+    # …or are added with extend=True, after the existing dimensions
+    k3 = dsd.make_key(Key, dict(baz="z", foo="f"), extend=True)
+    assert list(k3.values) == ["foo", "baz"]
+    assert k3.values["baz"].value_for is dsd.dimensions.get("baz")
+    k4, k5 = [dsd.make_key(Key, dict(baz="z")) for _ in range(2)]
+    assert k4.values["baz"] is k5.values["baz"]
+
+    # Shared values are frozen; copies can be modified
+    with pytest.raises(TypeError, match="frozen"):
+        k1.values["foo"].value = "g"
+    with pytest.raises(TypeError, match="frozen"):
+        k1.attrib["qux"].value = "r"
+    kv = k1.values["foo"].copy()
+    kv.value = "g"
+    assert k1.values["foo"].value == "f" and kv.value == "g"
+
+    # Components replaced in place are used for new keys
+    dsd.dimensions.components[:] = [
+        Dimension(id=id, order=order) for order, id in enumerate(["foo", "bar", "baz"])
+    ]
+    k6 = dsd.make_key(Key, dict(foo="f"))
+    assert k6.values["foo"].value_for is dsd.dimensions.get("foo")
+    assert k6.values["foo"] is not k1.values["foo"]
+
+
+def test_datastructuredefinition_iter_keys():
+    dsd = DataStructureDefinition()
+    for order, (id, n) in enumerate([("foo", 4), ("bar", 5), ("qux", 3)]):
+        cl = model.Codelist(id=f"CL_{id.upper()}")
+        for i in range(n):
+            cl.append(model.Code(id=f"{id[0]}{i}"))
+        dsd.dimensions.append(
+            Dimension(
+                id=id,
+                order=order,
+                local_representation=model.Representation(enumerated=cl),
+            )
+        )
+    all_keys = list(dsd.iter_keys())
+    assert len(all_keys) == dsd.count_keys() == 60
+
+    def member(**values):
+        return {
+            dsd.dimensions.get(id): model.MemberSelection(
+                values_for=dsd.dimensions.get(id),
+                values=[model.MemberValue(value=v) for v in ids.split("+")],
+            )
+            for id, ids in values.items()
+        }
+
+    # An included region, and two excluded regions for more than one dimension
+    cc = dsd.make_constraint({"foo": "f0+f1+f3"})
+    cc.data_content_region.extend(
+        [
+            CubeRegion(included=False, member=member(bar="b0+b1", qux="q1")),
+            CubeRegion(included=False, member=member(foo="f0", qux="q1+q2")),
+        ]
+    )
+    expected = [k for k in all_keys if k in cc]
+    assert len(expected) == 31
+    assert list(dsd.iter_keys(cc)) == expected
+    assert dsd.count_keys(cc) == 31
+
+    # Keys at positions outside the excluded regions are skipped
+    n = dsd.count_keys(cc, positions=True)
+    assert n == 3 * 5 * 3
+    chunks = [list(dsd.iter_keys(cc, start=i, stop=i + 7)) for i in range(0, n, 7)]
+    assert sum(chunks, []) == expected
+    assert list(dsd.iter_keys(cc, start=n)) == []
+    with pytest.raises(ValueError):
+        next(dsd.iter_keys(cc, start=-1))
+
+    # A DataKeySet, included or excluded
+    def key_value(**values):
+        return {
+            dsd.dimensions.get(id): model.ComponentValue(
+                value_for=dsd.dimensions.get(id), value=v
+            )
+            for id, v in values.items()
+        }
+
+    for included, count in (True, 4), (False, 27):
+        cc.data_content_keys = model.DataKeySet(
+            included=included,
+            keys=[
+                model.DataKey(included=True, key_value=key_value(foo="f0", bar="b2")),
+                model.DataKey(included=True, key_value=key_value(foo="f1", bar="b3")),
+            ],
+        )
+        expected = [
+            k
+            for k in all_keys
+            if all(k in cr for cr in cc.data_content_region)
+            and ((k.foo.value, k.bar.value) in {("f0", "b2"), ("f1", "b3")})
+            is included
+        ]
+        assert len(expected) == count
+        assert list(dsd.iter_keys(cc)) == expected
+        assert dsd.count_keys(cc) == count
+
+    # Keys for different sets of dimensions cannot be counted
+    cc.data_content_keys.keys.append(
+        model.DataKey(included=True, key_value=key_value(qux="q0"))
+    )
+    with pytest.raises(NotImplementedError):
+        dsd.count_keys(cc)
+
+
+def test_componentlist():
+    dd = DimensionDescriptor(components=[Dimension(id="foo")])
+    d = dd.getdefault("bar")
+    dd.append(Dimension(id="baz"))
+
+    # Components are found by ID, and membership tested by ID or component
+    assert dd.get("bar") is d and "baz" in dd and d in dd
+    assert "qux" not in dd and Dimension(id="qux") not in dd
+    with pytest.raises(KeyError):
+        dd.get("qux")
+
+    # The first of components with the same ID is returned
+    dd.components.append(Dimension(id="foo", order=9))
+    assert dd.get("foo") is dd[0]
+
+    # Lookups reflect changes to the list of components…
+    dd.components.pop(0)
+    assert dd.get("foo").order == 9
+    dd.components.remove(d)
+    assert "bar" not in dd
+
+    # …and assignment of a new list
+    dd.components = [Dimension(id="qux")]
+    assert "qux" in dd and "baz" not in dd
+
+
 def test_dimension():
     # Constructor
     Dimension(id="CURRENCY", order=0)
@@ -381,6 +621,32 @@ def test_key():
     assert k1.get_values() == (1, 2, 3)
 
 
+def test_key_hash():
+    k1 = Key(foo=1, bar=2)
+    d = {k1: "a"}
+
+    # Hash is the same for an equal key, also after pickling
+    assert d[Key(foo=1, bar=2)] == "a"
+    assert d[pickle.loads(pickle.dumps(k1))] == "a"
+
+    # Hash is updated when values are modified through the Key…
+    k1["bar"] = 3
+    assert hash(k1) == hash(Key(foo=1, bar=3))
+
+    # …or its values directly
+    d = {k1: "b"}
+    k1.values["bar"] = KeyValue(id="bar", value=2)
+    assert hash(k1) == hash(Key(foo=1, bar=2))
+    k1.values["bar"] = KeyValue(id="bar", value=3)
+    assert d[k1] == "b"
+
+    # …or a KeyValue
+    kv = KeyValue(id="bar", value=3)
+    h = hash(kv)
+    kv.value = 4
+    assert hash(kv) == hash(KeyValue(id="bar", value=4)) != h
+
+
 def test_observation():
     obs = Observation()
 
@@ -409,6 +675,40 @@ def test_observation():
     obs.attached_attribute[da.id] = av
     assert obs.attrib[da.id] == "baz"
 
+    # attrib is a read-only view: attributes of the series, then groups, take
+    # precedence; changes to the underlying attributes are visible
+    obs.series_key = SeriesKey(foo=1, attrib={"FOO": AttributeValue(value="series")})
+    obs.group_keys = {GroupKey(foo=1, attrib={"BAR": AttributeValue(value="group")})}
+    view = obs.attrib
+    assert (view.FOO, view.BAR, view.CURRENCY) == ("series", "group", "USD")
+    assert list(view) == ["TIME_PERIOD", "CURRENCY", "FOO", "BAR"]
+    obs.attached_attribute["QUX"] = "3"
+    assert len(view) == 5 and view["QUX"] == "3"
+    with raises(TypeError):
+        view["QUX"] = "4"
+    with raises(AttributeError):
+        view.BAZ
+
+    # Combined key is created once, and again after series_key or dimension change
+    obs.series_key = SeriesKey(foo=1)
+    obs.dimension = Key(bar=2)
+    k = obs.key
+    assert k == Key(foo=1, bar=2) and obs.key is k
+    obs.dimension = Key(bar=3)
+    assert obs.key == Key(foo=1, bar=3)
+
+    # …or after either is modified in place
+    obs.dimension["bar"] = 4
+    obs.series_key["foo"] = 5
+    assert obs.key == Key(foo=5, bar=4)
+    obs.dimension.values["bar"] = KeyValue(id="bar", value=6)
+    assert obs.key == Key(foo=5, bar=6)
+
+    # …and cannot be modified
+    with raises(TypeError, match="frozen"):
+        obs.key["bar"] = 4
+    assert obs.key.copy(bar=4) == Key(foo=5, bar=4)
+
 
 def test_get_class():
     with pytest.raises(ValueError, match="Package 'codelist' invalid for Category"):
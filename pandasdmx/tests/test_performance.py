@@ -1,5 +1,59 @@
-"""Speed and memory usage tests."""
-from pandasdmx.model import AttributeValue, DataAttribute, DataStructureDefinition
+"""Speed and memory usage tests.
+
+Tests marked "benchmark" are not run by default; use ``pytest -m benchmark``.
+"""
+import gc
+import itertools
+import operator
+import os
+import tracemalloc
+from datetime import datetime
+from io import BytesIO
+from time import perf_counter
+
+import pandas as pd
+import pytest
+
+import pandasdmx
+from pandasdmx.model import (
+    AttributeValue,
+    Component,
+    DataAttribute,
+    DataSet,
+    DataStructureDefinition,
+    Key,
+    Observation,
+    SeriesKey,
+)
+from pandasdmx.reader import sdmxjson, sdmxml
+from pandasdmx.reader.sdmxml import Reader, _Stacks, matching_class
+from pandasdmx.util import DictLike
+from pandasdmx.writer.pandas import parse_time_period
+
+from . import scaled_json, scaled_message
+from .data import BASE_PATH
+
+
+def timed(func, *args, **kwargs):
+    """Return the wall time for ``func(*args, **kwargs)``, and its result."""
+    start = perf_counter()
+    result = func(*args, **kwargs)
+    return perf_counter() - start, result
+
+
+def traced(func, *args, **kwargs):
+    """Return memory allocated by Python objects for ``func(*args, **kwargs)``.
+
+    Returns the memory still allocated when `func` returns, e.g. for its result; the
+    peak while it runs; and the result.
+    """
+    tracemalloc.start()
+    try:
+        result = func(*args, **kwargs)
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return current, peak, result
 
 
 def test_refcount():
@@ -28,3 +82,475 @@ def test_refcount():
     # Same, using a DSD
     av2 = AttributeValue(value="baz", value_for="foo", dsd=dsd)
     assert av2.value_for is da3
+
+
+@pytest.mark.benchmark
+def test_componentlist_get_speed():
+    # Large DSD, e.g. from ESTAT or IMF
+    dsd = DataStructureDefinition()
+    for i in range(20):
+        dsd.dimensions.getdefault(f"DIM{i}")
+    for i in range(50):
+        dsd.attributes.getdefault(f"ATTR{i}")
+    ids = [c.id for c in dsd.attributes] * 2000
+
+    def scan(cl):
+        # Previous implementation of ComponentList.get(): linear search
+        return [next(c for c in cl.components if c.id == id) for id in ids]
+
+    t_scan, expected = timed(scan, dsd.attributes)
+    t_get, result = timed(lambda cl: [cl.get(id) for id in ids], dsd.attributes)
+
+    assert result == expected
+    assert t_get * 5 < t_scan, f"Scan: {t_scan:.3f} s; get: {t_get:.3f} s"
+
+
+@pytest.mark.benchmark
+def test_key_cache_speed():
+    msg = pandasdmx.read_sdmx(scaled_message("ng-ts.xml", 500))  # 6000 observations
+    ds = msg.data[0]
+
+    # Observation.key is created on first access, then reused
+    t_first, keys = timed(lambda: [obs.key for obs in ds.obs])
+    t_again, keys_again = timed(lambda: [obs.key for obs in ds.obs])
+
+    assert all(map(operator.is_, keys, keys_again))
+    assert t_again * 20 < t_first, f"First {t_first:.3f} s; again {t_again:.4f} s"
+
+
+@pytest.mark.benchmark
+def test_attrib_columns_memory():
+    msg = pandasdmx.read_sdmx(scaled_message("ng-ts.xml", 1000))  # 12 000 obs
+    observations = msg.data[0].obs
+
+    def merged(obs):
+        # Previous implementation of Observation.attrib: one DictLike per observation
+        result = obs.attached_attribute.copy()
+        result.update(getattr(obs.series_key, "attrib", {}))
+        for gk in obs.group_keys:
+            result.update(gk.attrib)
+        return result
+
+    m_rows, _, rows = traced(lambda: [merged(obs) for obs in observations])
+    m_views, _, _ = traced(lambda: [obs.attrib for obs in observations])
+    m_cols, _, columns = traced(DataSet.attrib_columns, observations)
+
+    assert all(
+        columns[k][i] is v for i, row in enumerate(rows) for k, v in row.items()
+    )
+    assert m_views * 2 < m_rows and m_cols * 4 < m_rows, (
+        f"Per observation: copies {m_rows / 2**20:.2f} MiB; "
+        f"views {m_views / 2**20:.2f} MiB; columns {m_cols / 2**20:.2f} MiB"
+    )
+
+
+@pytest.mark.benchmark
+def test_constraint_mask_speed():
+    dsd = pandasdmx.read_sdmx(BASE_PATH / "ECB_EXR" / "ng-structure-full.xml").structure[
+        0
+    ]
+    cc = dsd.make_constraint({"CURRENCY": "JPY+USD", "EXR_VAR": "E"})
+    msg = pandasdmx.read_sdmx(scaled_message("ng-ts.xml", 1000))  # 12 000 obs
+    keys = [obs.key for obs in msg.data[0].obs]
+    index = pandasdmx.to_pandas(msg).index
+
+    def rows():
+        # Previous implementation in write_columnar_dataset(): one Key per row
+        return [Key(**dict(zip(index.names, v))) in cc for v in index]
+
+    t_in, expected = timed(lambda: [key in cc for key in keys])
+    t_keys, result = timed(cc.mask, keys)
+    t_rows, _ = timed(rows)
+    t_index, result_index = timed(cc.mask, index)
+
+    assert result.tolist() == result_index.tolist() == expected
+    assert t_keys * 2 < t_in and t_index * 100 < t_rows, (
+        f"Keys: one at a time {t_in:.3f} s; mask {t_keys:.3f} s. "
+        f"MultiIndex: one Key per row {t_rows:.3f} s; mask {t_index:.4f} s"
+    )
+
+
+@pytest.mark.benchmark
+def test_count_keys_speed():
+    msg = pandasdmx.read_sdmx(BASE_PATH / "ECB_EXR" / "1" / "structure-full.xml")
+    dsd = msg.structure["ECB_EXR1"]
+    cc = msg.constraint["EXR_CONSTRAINTS"]
+
+    t_count, n = timed(dsd.count_keys, cc)
+    t_iter, n_iter = timed(lambda: sum(1 for _ in dsd.iter_keys(cc)))
+    # Last 1000 keys: skipping the preceding keys, or generating them
+    t_chunk, chunk = timed(lambda: list(dsd.iter_keys(cc, start=n - 1000)))
+    t_skip, expected = timed(
+        lambda: list(itertools.islice(dsd.iter_keys(cc), n - 1000, None))
+    )
+
+    assert n == n_iter == 1231920 and chunk == expected
+    assert t_count * 100 < t_iter and t_chunk * 100 < t_skip, (
+        f"{n} keys: count {t_count:.3f} s; iterate {t_iter:.2f} s. "
+        f"Last 1000 keys: start= {t_chunk:.3f} s; islice {t_skip:.2f} s"
+    )
+
+
+@pytest.mark.benchmark
+def test_write_dataset_index_speed():
+    dsd = pandasdmx.read_sdmx(BASE_PATH / "ECB_EXR" / "ng-structure-full.xml").structure[
+        0
+    ]
+
+    # 1000 series × 1000 periods; OBS_STATUS on every other observation
+    periods = [dsd.make_key(Key, {"TIME_PERIOD": f"{i:06d}"}) for i in range(1000)]
+    obs_status = AttributeValue(value="A", value_for=dsd.attributes.get("OBS_STATUS"))
+    attached = [DictLike(OBS_STATUS=obs_status), DictLike()]
+    ds = DataSet(structured_by=dsd)
+    for i in range(1000):
+        sk = dsd.make_key(
+            SeriesKey,
+            dict(
+                FREQ="D",
+                CURRENCY=f"C{i:03d}",
+                CURRENCY_DENOM="EUR",
+                EXR_TYPE="SP00",
+                EXR_VAR="E",
+                DECIMALS="4",
+            ),
+        )
+        ds.obs.extend(
+            Observation.construct(
+                series_key=sk,
+                dimension=dim,
+                value=float(j),
+                attached_attribute=attached[j % 2],
+            )
+            for j, dim in enumerate(periods)
+        )
+    observations = ds.obs
+    [obs.key for obs in observations]  # Create and cache the keys
+
+    def from_tuples():
+        # Previous implementation in write_dataset(): one MultiIndex per column
+        keys = [tuple(map(str, obs.key.order().get_values())) for obs in observations]
+        names = observations[0].key.order().values.keys()
+        columns = {"value": [obs.value for obs in observations]}
+        columns.update(DataSet.attrib_columns(observations))
+        result = {}
+        for k, column in columns.items():
+            present = [i for i, v in enumerate(column) if v is not None]
+            idx = pd.MultiIndex.from_tuples([keys[i] for i in present], names=names)
+            result[k] = pd.Series([column[i] for i in present], idx, name=k)
+        return result
+
+    t_tuples, expected = timed(from_tuples)
+    t_codes, result = timed(pandasdmx.to_pandas, ds, attributes="os")
+
+    assert result["OBS_STATUS"].count() == len(expected["OBS_STATUS"])
+    assert result.index.sort_values().equals(expected["value"].index.sort_values())
+    assert (
+        t_codes * 3 < t_tuples
+    ), f"from_tuples {t_tuples:.2f} s; write_dataset {t_codes:.2f} s"
+
+
+@pytest.mark.benchmark
+def test_parse_time_period_speed():
+    # Long daily and weekly series: 20 × 40 years of days, 100 × 40 years of weeks
+    days = pd.date_range("1980-01-01", "2019-12-31", freq="D")
+    daily = list(days.strftime("%Y-%m-%d")) * 20
+    weeks = [f"{y}-W{w:02d}" for y in range(1980, 2020) for w in range(1, 53)]
+    weekly = weeks * 100
+
+    # Element-wise parsing, as needed for formats not understood by pd.to_datetime()
+    def elementwise(values, format):
+        return pd.DatetimeIndex([datetime.strptime(v, format) for v in values])
+
+    for label, values, parse in (
+        ("daily", daily, lambda v: elementwise(v, "%Y-%m-%d")),
+        ("weekly", weekly, lambda v: elementwise([f"{w}-1" for w in v], "%G-W%V-%u")),
+    ):
+        t_elementwise, expected = timed(parse, values)
+        t_vector, result = timed(parse_time_period, values)
+
+        assert result.equals(expected)
+        assert t_vector * 5 < t_elementwise, (
+            f"{len(values)} {label} periods: element-wise {t_elementwise:.2f} s; "
+            f"parse_time_period {t_vector:.2f} s"
+        )
+
+    # Daily periods: no slower than pd.to_datetime(), which handles only these
+    t_pandas = timed(pd.to_datetime, daily)[0]
+    t_vector = timed(parse_time_period, daily)[0]
+    assert (
+        t_vector < 2 * t_pandas
+    ), f"pd.to_datetime {t_pandas:.2f} s; parse_time_period {t_vector:.2f} s"
+
+
+@pytest.mark.benchmark
+def test_columnar_speed():
+    dsd = pandasdmx.read_sdmx(BASE_PATH / "ECB_EXR" / "ng-structure-full.xml").structure[
+        0
+    ]
+    factor = 5000  # 60 000 observations
+
+    t_obj, msg = timed(
+        pandasdmx.read_sdmx, scaled_message("ng-ts-ss.xml", factor), dsd=dsd
+    )
+    t_col, msg_c = timed(
+        pandasdmx.read_sdmx,
+        scaled_message("ng-ts-ss.xml", factor),
+        dsd=dsd,
+        engine="columnar",
+    )
+
+    assert len(msg_c.data[0]) == len(msg.data[0]) == 12 * factor
+    assert t_col * 5 < t_obj, f"Object: {t_obj:.2f} s; columnar: {t_col:.2f} s"
+
+
+@pytest.mark.benchmark
+def test_columnar_memory():
+    dsd = pandasdmx.read_sdmx(BASE_PATH / "ECB_EXR" / "ng-structure-full.xml").structure[
+        0
+    ]
+    factor = 1000  # 12 000 observations
+
+    def retained(**kwargs):
+        """Memory allocated by Python objects for the data set, after reading."""
+        source = scaled_message("ng-ts-ss.xml", factor)
+        result, _, msg = traced(pandasdmx.read_sdmx, source, dsd=dsd, **kwargs)
+        return result, msg
+
+    (m_obj, msg), (m_col, msg_c) = retained(), retained(engine="columnar")
+
+    # Same observations are available; created on access
+    assert len(msg_c.data[0].obs) == len(msg.data[0].obs) == 12 * factor
+    assert m_col * 10 < m_obj, (
+        f"Retained memory: object {m_obj / 2**20:.1f} MiB; "
+        f"columnar {m_col / 2**20:.2f} MiB"
+    )
+
+
+@pytest.mark.benchmark
+def test_columnar_json_speed():
+    factor = 10_000  # 40 000 observations
+
+    t_obj, msg = timed(pandasdmx.read_sdmx, scaled_json(factor), format="JSON")
+    t_col, msg_c = timed(
+        pandasdmx.read_sdmx, scaled_json(factor), format="JSON", engine="columnar"
+    )
+
+    assert len(msg_c.data[0]) == len(msg.data[0].obs) == 4 * factor
+    assert t_col * 5 < t_obj, f"Object: {t_obj:.2f} s; columnar: {t_col:.2f} s"
+
+
+@pytest.mark.benchmark
+def test_trusted_speed():
+    dsd = pandasdmx.read_sdmx(BASE_PATH / "ECB_EXR" / "ng-structure-full.xml").structure[
+        0
+    ]
+    factor = 2000
+
+    def read(source, **kwargs):
+        """Time reading from ``source()`` with validation, then with trusted=True.
+
+        As in :mod:`timeit`, garbage collection is disabled while timing.
+        """
+        gc.disable()
+        try:
+            t_val = timed(pandasdmx.read_sdmx, source(), **kwargs)[0]
+            t_trusted = timed(pandasdmx.read_sdmx, source(), trusted=True, **kwargs)[0]
+        finally:
+            gc.enable()
+        return t_val, t_trusted, f"validated {t_val:.2f} s; trusted {t_trusted:.2f} s"
+
+    t_val, t_trusted, info = read(
+        lambda: scaled_message("ng-ts-ss.xml", factor), dsd=dsd
+    )
+    assert t_trusted * 1.2 < t_val, f"XML: {info}"
+
+    t_val, t_trusted, info = read(lambda: scaled_json(factor), format="JSON")
+    assert t_trusted * 2 < t_val, f"JSON: {info}"
+
+
+@pytest.mark.benchmark
+@pytest.mark.skipif(len(sdmxjson.JSON_BACKENDS) < 2, reason="Needs orjson/simdjson")
+def test_json_backend_speed():
+    content = scaled_json(10_000).getvalue()  # 40 000 observations
+
+    times = {}
+    for name, loads in sdmxjson.JSON_BACKENDS.items():
+        times[name] = timed(loads, content)[0]
+        msg = pandasdmx.read_sdmx(BytesIO(content), format="JSON", json_backend=name)
+        assert len(msg.data[0]) == 40_000
+
+    # Every other backend decodes faster than the standard library
+    assert all(
+        t < times["json"] for name, t in times.items() if name != "json"
+    ), ", ".join(f"{name}: decode {t:.3f} s" for name, t in times.items())
+
+
+@pytest.mark.benchmark
+@pytest.mark.skipif(os.cpu_count() < 4, reason="Needs ≥ 4 CPUs")
+def test_workers_speed():
+    dsd = pandasdmx.read_sdmx(BASE_PATH / "ECB_EXR" / "ng-structure-full.xml").structure[
+        0
+    ]
+    factor = 2000
+    workers = min(os.cpu_count(), 8)
+
+    t_1, msg = timed(
+        pandasdmx.read_sdmx, scaled_message("ng-ts-ss.xml", factor), dsd=dsd
+    )
+    t_n, msg_n = timed(
+        pandasdmx.read_sdmx,
+        scaled_message("ng-ts-ss.xml", factor),
+        dsd=dsd,
+        workers=workers,
+    )
+
+    assert len(msg_n.data[0]) == len(msg.data[0])
+    assert t_n < t_1, f"1 process: {t_1:.2f} s; {workers} processes: {t_n:.2f} s"
+
+
+@pytest.mark.benchmark
+def test_group_scaling():
+    dsd = pandasdmx.read_sdmx(BASE_PATH / "ECB_EXR" / "sg-structure.xml").structure[0]
+
+    def read(factor):
+        """Read a message with 4 × `factor` groups, series, and 12 × `factor` obs."""
+        return timed(
+            pandasdmx.read_sdmx,
+            scaled_message("sg-ts-gf-ss.xml", factor, groups=True),
+            dsd=dsd,
+        )
+
+    (t_1, msg_1), (t_4, msg_4) = read(100), read(400)
+
+    ds = msg_4.data[0]
+    assert len(ds.group) == len(ds.series) == 1600
+    assert all(len(obs) == 3 for obs in ds.group.values())
+
+    # Time increases ~linearly with the number of groups and observations
+    assert t_4 < 8 * t_1, f"400 groups: {t_1:.2f} s; 1600 groups: {t_4:.2f} s"
+
+
+@pytest.mark.benchmark
+def test_iter_series_memory():
+    dsd = pandasdmx.read_sdmx(BASE_PATH / "ECB_EXR" / "ng-structure-full.xml").structure[
+        0
+    ]
+    factor = 1000
+
+    def iterate():
+        for _ in Reader().iter_series(scaled_message("ng-ts-ss.xml", factor), dsd):
+            pass
+
+    def read():
+        Reader().read_message(scaled_message("ng-ts-ss.xml", factor), dsd)
+
+    p_msg, p_iter = traced(read)[1], traced(iterate)[1]
+
+    # The scaled message itself is held in memory in both cases
+    assert p_iter * 4 < p_msg, (
+        f"Peak memory: read_message {p_msg / 2**20:.1f} MiB; "
+        f"iter_series {p_iter / 2**20:.1f} MiB"
+    )
+
+
+@pytest.mark.benchmark
+def test_iter_series_json_memory():
+    factor = 2000
+
+    def iterate():
+        for _ in sdmxjson.Reader().iter_series(scaled_json(factor)):
+            pass
+
+    def read():
+        sdmxjson.Reader().read_message(scaled_json(factor))
+
+    p_msg, p_iter = traced(read)[1], traced(iterate)[1]
+
+    # The scaled message itself is held in memory in both cases
+    assert p_iter * 4 < p_msg, (
+        f"Peak memory: read_message {p_msg / 2**20:.1f} MiB; "
+        f"iter_series {p_iter / 2**20:.1f} MiB"
+    )
+
+
+@pytest.mark.benchmark
+def test_stack_lookup():
+    def lookups(n_stacks):
+        """Time subclass lookups among `n_stacks` unrelated stacks."""
+        reader = Reader()
+        reader.stack = _Stacks()
+        for i in range(n_stacks):
+            reader.push(f"stack {i}", i)
+        reader.push(DataAttribute(id="foo"))
+
+        t, _ = timed(
+            lambda: [
+                reader.get_single(Component, subclass=True) for _ in range(10_000)
+            ]
+        )
+        return t
+
+    t_few, t_many = lookups(10), lookups(1000)
+
+    # Lookup time is independent of the number of unrelated stacks
+    assert (
+        t_many < 3 * t_few
+    ), f"10 stacks: {t_few * 1e3:.1f} ms; 1000 stacks: {t_many * 1e3:.1f} ms"
+
+
+@pytest.mark.benchmark
+def test_stack_lookup_structure(monkeypatch):
+    class ScanStacks(_Stacks):
+        """Check every stack on each lookup, as before the index was added."""
+
+        def matching(self, cls):
+            return [k for k in filter(matching_class(cls), self.keys()) if self.get(k)]
+
+    def parse(stacks_cls, path):
+        """Time parsing `path`, and the stack lookups while parsing."""
+        t_lookup = []
+
+        class TimedStacks(stacks_cls):
+            def matching(self, cls):
+                t, result = timed(super().matching, cls)
+                t_lookup.append(t)
+                return result
+
+        monkeypatch.setattr(sdmxml, "_Stacks", TimedStacks)
+        t_parse, _ = timed(pandasdmx.read_sdmx, path)
+        return t_parse, sum(t_lookup)
+
+    names = (
+        "ESTAT/apro_mk_cola-structure.xml",
+        "INSEE/CNA-2010-CONSO-SI-A17-structure.xml",
+        "INSEE/IPI-2010-A21-structure.xml",
+    )
+    # Best (parse, lookup) times for each implementation and file
+    result = {
+        (cls.__name__, name): min(parse(cls, BASE_PATH / name) for _ in range(5))
+        for cls in (_Stacks, ScanStacks)
+        for name in names
+    }
+
+    def total(cls):
+        return sum(result[cls.__name__, name][1] for name in names)
+
+    assert total(_Stacks) < total(ScanStacks), "; ".join(
+        f"{key[0]} {key[1]}: parse {t[0] * 1e3:.1f} ms, lookup {t[1] * 1e3:.2f} ms"
+        for key, t in result.items()
+    )
+
+
+@pytest.mark.benchmark
+def test_lazy_structure():
+    path = BASE_PATH / "INSEE" / "CNA-2010-CONSO-SI-A17-structure.xml"
+
+    def one_codelist(**kwargs):
+        return pandasdmx.read_sdmx(path, **kwargs).codelist["CL_SECT_INST"]
+
+    t_full = min(timed(one_codelist)[0] for _ in range(5))
+    t_lazy = min(timed(one_codelist, lazy=True)[0] for _ in range(5))
+
+    assert (
+        t_lazy * 3 < t_full
+    ), f"Full {t_full * 1e3:.1f} ms; lazy {t_lazy * 1e3:.1f} ms"
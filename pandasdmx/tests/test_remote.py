@@ -1,8 +1,16 @@
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+from time import sleep
+
 import pytest
+import requests
 
-from pandasdmx.remote import Session
+import pandasdmx
+from pandasdmx.reader.sdmxml import Reader
+from pandasdmx.remote import ResponseIO, Session
+from pandasdmx.source import add_source, sources
 
-from . import has_requests_cache
+from . import has_requests_cache, scaled_message
 
 
 @pytest.mark.skipif(has_requests_cache, reason="test without requests_cache")
@@ -24,3 +32,79 @@ def test_session_init_cache(tmp_path):
 
     # Test for existence of cache file
     assert cache_name.with_suffix(".sqlite").exists()
+
+
+@pytest.fixture(scope="module")
+def slow_server():
+    """Local HTTP server that sends an SDMX-ML message in 20 chunks over ~1 second."""
+    body = scaled_message("ng-ts.xml", 500).getvalue()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header("Content-Type", "application/xml")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+
+            step = len(body) // 20 + 1
+            for i in range(0, len(body), step):
+                self.wfile.write(body[i : i + step])
+                self.wfile.flush()
+                sleep(0.05)
+
+        def log_message(self, *args):
+            pass  # Silence
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    Thread(target=server.serve_forever, daemon=True).start()
+
+    yield f"http://127.0.0.1:{server.server_port}/", body
+
+    server.shutdown()
+
+
+@pytest.fixture
+def local_source(slow_server):
+    """Data source "LOCAL" for :func:`slow_server`, removed after the test."""
+    url, body = slow_server
+    add_source(dict(id="LOCAL", name="Local test server", url=url), override=True)
+    yield "LOCAL", body
+    sources.pop("LOCAL")
+
+
+class CountingResponseIO(ResponseIO):
+    """ResponseIO that counts the bytes received so far."""
+
+    received = 0
+
+    def _next_chunk(self):
+        chunk = super()._next_chunk()
+        self.received += len(chunk)
+        return chunk
+
+
+def test_responseio_stream(slow_server):
+    url, body = slow_server
+
+    content = CountingResponseIO(requests.get(url, stream=True))
+    series = Reader().iter_series(content)
+
+    # The first series is parsed before most of the message is received
+    next(series)
+    assert content.received < len(body) // 2
+
+    assert sum(1 for _ in series) == 500 * 4 - 1
+    assert content.received == len(body)
+
+
+def test_request_get_tofile(local_source, tmp_path):
+    source_id, body = local_source
+    path = tmp_path / "data.xml"
+
+    msg = pandasdmx.Request(source_id).get("data", "EXR", tofile=path)
+
+    # Message is parsed completely
+    assert len(msg.data[0].obs) == 500 * 12
+
+    # Content is written to file as received
+    assert path.read_bytes() == body
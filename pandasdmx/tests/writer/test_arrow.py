@@ -0,0 +1,91 @@
+"""Tests for pandasdmx/writer/arrow.py."""
+import pytest
+
+import pandasdmx
+from pandasdmx.tests import assert_pd_equal
+from pandasdmx.tests.data import BASE_PATH, specimen
+
+pa = pytest.importorskip("pyarrow")
+
+
+@pytest.fixture(scope="module")
+def dsd():
+    msg = pandasdmx.read_sdmx(BASE_PATH / "ECB_EXR" / "ng-structure-full.xml")
+    return msg.structure[0]
+
+
+def test_write_dataset(dsd):
+    path = BASE_PATH / "ECB_EXR" / "ng-ts-ss.xml"
+    msg = pandasdmx.read_sdmx(path, dsd=dsd)
+
+    result = pandasdmx.to_arrow(msg)
+    assert isinstance(result, pa.Table)
+    assert result.num_rows == len(msg.data[0])
+
+    # Dimensions are dictionary-encoded, with the DSD codelist as dictionary
+    assert result.column_names[:6] == [
+        "FREQ",
+        "CURRENCY",
+        "CURRENCY_DENOM",
+        "EXR_TYPE",
+        "EXR_VAR",
+        "TIME_PERIOD",
+    ]
+    currency = result.column("CURRENCY").combine_chunks()
+    assert pa.types.is_dictionary(currency.type)
+    cl = dsd.dimensions.get("CURRENCY").local_representation.enumerated
+    assert currency.dictionary.to_pylist()[: len(cl)] == list(cl.items.keys())
+    assert set(currency.to_pylist()) == {"CHF", "GBP", "JPY", "USD"}
+
+    field = result.schema.field("CURRENCY")
+    assert field.metadata == {
+        b"sdmx.role": b"dimension",
+        b"sdmx.codelist": b"CL_CURRENCY",
+    }
+
+    # Values and attributes
+    assert result.schema.field("value").type == pa.float64()
+    assert "OBS_STATUS" in result.column_names
+    assert result.schema.field("OBS_STATUS").metadata[b"sdmx.role"] == b"attribute"
+
+    # Identifiers of the DSD
+    assert result.schema.metadata[b"sdmx.structure"] == dsd.id.encode()
+
+    # Same values as to_pandas()
+    expected = pandasdmx.to_pandas(msg)
+    df = result.to_pandas().set_index(list(expected.index.names))["value"]
+    assert df.sort_index().tolist() == expected.sort_index().tolist()
+
+
+def test_write_columnar_dataset(dsd):
+    path = BASE_PATH / "ECB_EXR" / "ng-ts-gf-ss.xml"
+    msg = pandasdmx.read_sdmx(path, dsd=dsd)
+    msg_c = pandasdmx.read_sdmx(path, dsd=dsd, engine="columnar")
+
+    # Same table from Observations, or directly from the columns
+    expected = pandasdmx.to_arrow(msg)
+    result = pandasdmx.to_arrow(msg_c)
+    result = result.select(expected.column_names)
+    assert result.schema.equals(expected.schema, check_metadata=True)
+
+    def frame(table):
+        dims = ["CURRENCY", "TIME_PERIOD"]
+        df = table.to_pandas().astype(object)
+        return df.sort_values(dims).reset_index(drop=True)
+
+    assert_pd_equal(frame(expected), frame(result))
+
+
+def test_write_generic():
+    with specimen("ts.json") as f:
+        msg = pandasdmx.read_sdmx(f)
+
+    # Without codelists, the dictionary contains the values in the data
+    result = pandasdmx.to_arrow(msg, attributes="")
+    assert result.num_rows == len(msg.data[0].obs)
+    column = result.column("CURRENCY").combine_chunks()
+    assert column.dictionary.to_pylist() == sorted(set(column.to_pylist()))
+    assert [f.metadata[b"sdmx.role"] for f in result.schema][-1] == b"measure"
+
+    with pytest.raises(ValueError, match="attributes must be in 'osgd'"):
+        pandasdmx.to_arrow(msg, attributes="x")
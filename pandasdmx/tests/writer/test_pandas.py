@@ -1,13 +1,17 @@
 """Tests for pandasdmx/writer.py."""
+import re
+
 import pandas as pd
 import pytest
 from pytest import raises
 
 import pandasdmx
+from pandasdmx import model
 from pandasdmx.model import TimeDimension
 from pandasdmx.tests import assert_pd_equal
-from pandasdmx.tests.data import expected_data, specimen
+from pandasdmx.tests.data import BASE_PATH, expected_data, specimen
 from pandasdmx.tests.data import test_files as _test_files
+from pandasdmx.writer.pandas import parse_time_period
 
 # file name → (exception raised, exception message, comment/reason)
 ssds = (
@@ -289,6 +293,10 @@ def test_write_dataset_datetime():
     df = pandasdmx.to_pandas(msg, datetime=dict(dim=TIME_PERIOD, freq="FREQ"))
     expected(df, cls=pd.PeriodIndex)
 
+    # Frequency inferred from the format of the time periods, e.g. "2019-01"
+    df = pandasdmx.to_pandas(ds, datetime=dict(dim=TIME_PERIOD, freq=True))
+    assert isinstance(df.index, pd.PeriodIndex) and df.index.freqstr == "M"
+
     # Invalid arguments
     with pytest.raises(ValueError, match="X"):
         pandasdmx.to_pandas(msg, datetime=dict(dim=TIME_PERIOD, freq="X"))
@@ -298,6 +306,49 @@ def test_write_dataset_datetime():
         pandasdmx.to_pandas(ds, datetime=43)
 
 
+@pytest.mark.parametrize(
+    "value, expected, freq",
+    [
+        ("2020", "2020-01-01", "A"),
+        ("2020-A1", "2020-01-01", "A"),
+        ("2020-S2", "2020-07-01", "6M"),
+        ("2020-T3", "2020-09-01", "4M"),
+        ("2020-Q4", "2020-10-01", "Q"),
+        ("2020-02", "2020-02-01", "M"),
+        ("2020-M02", "2020-02-01", "M"),
+        ("2020-W05", "2020-01-27", "W"),
+        ("2021-W01", "2021-01-04", "W"),
+        ("2020-D060", "2020-02-29", "D"),
+        ("2020-02-29", "2020-02-29", "D"),
+    ],
+)
+def test_parse_time_period(value, expected, freq):
+    result = parse_time_period([value, value])
+    assert isinstance(result, pd.DatetimeIndex)
+    assert result.tolist() == [pd.Timestamp(expected)] * 2
+
+    result = parse_time_period([value], freq=True)
+    assert result[0] == pd.Period(expected, freq=freq)
+
+
+def test_parse_time_period_mixed():
+    values = pd.Index(
+        ["2020-Q1", "2020", "2020-W05", "2020-01-01T12:00:00", "2020-Q1"],
+        name="TIME_PERIOD",
+    )
+    result = parse_time_period(values)
+    assert result.name == "TIME_PERIOD"
+    assert result[0] == result[1] == result[4] == pd.Timestamp("2020-01-01")
+    assert result[2] == pd.Timestamp("2020-01-27")
+    assert result[3] == pd.Timestamp("2020-01-01 12:00")
+
+    # A PeriodIndex has only one frequency
+    with pytest.raises(ValueError, match=r"non-unique freq=\['A', 'Q', 'W'\]"):
+        parse_time_period(values, freq=True)
+    with pytest.raises(ValueError):
+        parse_time_period(["2020-Q5"])
+
+
 @pytest.mark.parametrize("path", **_test_files(kind="structure"))
 def test_writer_structure(path):
     msg = pandasdmx.read_sdmx(path)
@@ -338,3 +389,84 @@ def test_write_constraint():
     s2 = pandasdmx.to_pandas(msg, constraint=cc)
     assert len(s2) == 6
     assert set(s2.index.to_frame()["CURRENCY"]) == {"JPY", "USD"}
+
+
+def test_write_constraint_local():
+    dsd = pandasdmx.read_sdmx(BASE_PATH / "ECB_EXR" / "ng-structure-full.xml").structure[
+        0
+    ]
+    cc = dsd.make_constraint({"CURRENCY": "JPY+USD", "EXR_VAR": "E"})
+    with specimen("ng-ts.xml") as f:
+        msg = pandasdmx.read_sdmx(f)
+
+    # Same observations as selected one by one
+    expected = [obs.key for obs in msg.data[0].obs if obs.key in cc]
+    result = pandasdmx.to_pandas(msg, constraint=cc, attributes="os")
+    assert len(result) == len(expected) == 6
+    assert set(result.index.unique("CURRENCY")) == {"JPY", "USD"}
+
+
+def test_write_dataset_index():
+    with specimen("ng-ts-gf.xml") as f:
+        msg = pandasdmx.read_sdmx(f)
+    observations = msg.data[0].obs
+
+    result = pandasdmx.to_pandas(msg, attributes="osgd")
+
+    # Same index as from the stringified keys of each observation
+    expected = pd.MultiIndex.from_tuples(
+        [tuple(map(str, obs.key.order().get_values())) for obs in observations],
+        names=result.index.names,
+    )
+    assert result.index.sort_values().equals(expected.sort_values())
+    assert sorted(result["value"]) == sorted(float(obs.value) for obs in observations)
+
+
+@pytest.mark.parametrize("path", **_test_files(kind="data"))
+def test_read_to_pandas(path):
+    msg = pandasdmx.read_sdmx(path)
+    if any(
+        isinstance(
+            ds,
+            (model.StructureSpecificDataSet, model.StructureSpecificTimeSeriesDataSet),
+        )
+        for ds in msg.data
+    ):
+        pytest.skip("Structure-specific message without DSD")
+
+    def value(v):
+        # Code or str from an AttributeValue
+        v = getattr(v, "value", v)
+        return getattr(v, "id", v)
+
+    for kwargs in dict(), dict(attributes="osgd"), dict(rtype="compat"):
+        # Same as converting the message, without creating Observations
+        try:
+            expected = pandasdmx.to_pandas(msg, **kwargs)
+        except ValueError as e:
+            # E.g. rtype="compat" cannot reshape a cross-section with duplicate
+            # entries; the same error is raised
+            with raises(ValueError, match=re.escape(str(e))):
+                pandasdmx.read_sdmx(path, to="pandas", **kwargs)
+            continue
+        result = pandasdmx.read_sdmx(path, to="pandas", **kwargs)
+        if not isinstance(expected, list):
+            expected, result = [expected], [result]
+        for e, r in zip(expected, result):
+            if kwargs.get("attributes"):
+                e = e.applymap(value)
+            assert_pd_equal(e, r, check_like=True)
+
+
+def test_read_to_pandas_dsd():
+    dsd = pandasdmx.read_sdmx(BASE_PATH / "ECB_EXR" / "ng-structure-full.xml").structure[
+        0
+    ]
+    path = BASE_PATH / "ECB_EXR" / "ng-ts-ss.xml"
+    msg = pandasdmx.read_sdmx(path, dsd=dsd)
+
+    result = pandasdmx.read_sdmx(path, dsd=dsd, to="pandas", datetime="TIME_PERIOD")
+    assert_pd_equal(pandasdmx.to_pandas(msg, datetime="TIME_PERIOD"), result)
+
+    with raises(ValueError, match="to='pandas' with engine='foo'"):
+        pandasdmx.read_sdmx(path, dsd=dsd, to="pandas", engine="foo")
@@ -0,0 +1,82 @@
+"""Tests for pandasdmx/writer/parquet.py."""
+import pytest
+
+import pandasdmx
+from pandasdmx.tests.data import BASE_PATH, specimen
+from pandasdmx.writer.parquet import read_structure
+
+pa = pytest.importorskip("pyarrow")
+ds = pytest.importorskip("pyarrow.dataset")
+pq = pytest.importorskip("pyarrow.parquet")
+
+
+@pytest.fixture(scope="module")
+def msg():
+    dsd = pandasdmx.read_sdmx(
+        BASE_PATH / "ECB_EXR" / "ng-structure-full.xml"
+    ).structure[0]
+    return pandasdmx.read_sdmx(BASE_PATH / "ECB_EXR" / "ng-ts-ss.xml", dsd=dsd)
+
+
+def test_to_parquet(tmp_path, msg):
+    paths = pandasdmx.to_parquet(msg, tmp_path, ["FREQ", "CURRENCY"])
+
+    # One directory per partition
+    assert {p.name for p in (tmp_path / "FREQ=M").iterdir()} == {
+        f"CURRENCY={c}" for c in ("CHF", "GBP", "JPY", "USD")
+    }
+    assert len(paths) == 4
+
+    # Filtering on a partition column reads only the matching files
+    data = ds.dataset(tmp_path, format="parquet", partitioning="hive")
+    assert len(data.files) == 4
+    fragments = list(data.get_fragments(filter=ds.field("CURRENCY") == "JPY"))
+    assert len(fragments) == 1
+
+    table = data.to_table(filter=ds.field("CURRENCY") == "JPY")
+    expected = pandasdmx.to_pandas(msg).xs("JPY", level="CURRENCY")
+    assert table.num_rows == len(expected)
+
+    # Other dimensions are dictionary-encoded, as from to_arrow()
+    assert pa.types.is_dictionary(table.schema.field("EXR_TYPE").type)
+
+    # The DSD and its codelists are embedded
+    for source in (tmp_path, paths[0]):
+        structures = read_structure(source)
+        assert msg.data[0].structured_by.id in structures.structure
+        assert "CL_CURRENCY" in structures.codelist
+
+
+def test_to_parquet_stream(tmp_path, msg):
+    # An iterable of messages, e.g. from repeated Request.get()
+    paths = pandasdmx.to_parquet(
+        (msg for _ in range(3)), tmp_path, ["CURRENCY"], row_group_size=5
+    )
+    assert len(paths) == 12
+
+    data = ds.dataset(tmp_path, format="parquet", partitioning="hive")
+    assert data.count_rows() == 3 * len(msg.data[0])
+
+    # Row groups have at most `row_group_size` rows
+    metadata = pq.ParquetFile(paths[0]).metadata
+    assert all(
+        metadata.row_group(i).num_rows <= 5 for i in range(metadata.num_row_groups)
+    )
+
+
+def test_to_parquet_errors(tmp_path, msg):
+    with pytest.raises(ValueError, match=r"cannot partition by \['REF_AREA'\]"):
+        pandasdmx.to_parquet(msg, tmp_path, ["REF_AREA"])
+
+    with pytest.raises(TypeError, match="cannot write int to Parquet"):
+        pandasdmx.to_parquet(1, tmp_path)
+
+
+def test_to_parquet_without_structure(tmp_path):
+    with specimen("ts.json") as f:
+        msg = pandasdmx.read_sdmx(f)
+
+    # Data sets without a complete DSD are written all the same
+    pandasdmx.to_parquet(msg, tmp_path, ["CURRENCY"], attributes="")
+    data = ds.dataset(tmp_path, format="parquet", partitioning="hive")
+    assert data.count_rows() == len(msg.data[0].obs)
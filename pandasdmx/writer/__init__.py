@@ -1,7 +1,11 @@
+from .arrow import to_arrow
 from .pandas import to_pandas
+from .parquet import to_parquet
 from .xml import to_xml
 
 __all__ = [
+    "to_arrow",
     "to_pandas",
+    "to_parquet",
     "to_xml",
 ]
@@ -0,0 +1,319 @@
+"""Convert SDMX data to :mod:`pyarrow` tables.
+
+Requires `pyarrow <https://arrow.apache.org/docs/python/>`_.
+"""
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from pandasdmx import message, model, urn
+from pandasdmx.model import DataSet, FacetValueType as FVT
+from pandasdmx.writer.base import BaseWriter
+from pandasdmx.writer.pandas import _key_index
+
+try:
+    import pyarrow as pa
+except ImportError:  # pragma: no cover
+    HAS_PYARROW = False
+else:
+    HAS_PYARROW = True
+
+writer = BaseWriter("arrow")
+
+#: Arrow types for the values of a :class:`.PrimaryMeasure`, by the
+#: :class:`.FacetValueType` of its representation. Others are stored as
+#: :func:`pyarrow.float64`, or as :func:`pyarrow.string` if any is not a number.
+FVT_MAP = {
+    FVT.string: "string",
+    FVT.alpha: "string",
+    FVT.alphaNumeric: "string",
+    FVT.uri: "string",
+    FVT.bigInteger: "int64",
+    FVT.integer: "int32",
+    FVT.long: "int64",
+    FVT.short: "int16",
+    FVT.count: "int64",
+    FVT.incremental: "int64",
+    FVT.decimal: "float64",
+    FVT.float: "float32",
+    FVT.double: "float64",
+    FVT.numeric: "float64",
+}
+
+
+def to_arrow(obj, *args, **kwargs):
+    """Convert an SDMX *obj* to a :class:`pyarrow.Table`.
+
+    See :func:`write_dataset` and :func:`write_datamessage`.
+    """
+    if not HAS_PYARROW:  # pragma: no cover
+        raise ImportError("to_arrow() requires pyarrow")
+    return writer.recurse(obj, *args, **kwargs)
+
+
+@writer
+def write_datamessage(obj: message.DataMessage, *args, **kwargs):
+    """Convert :class:`.DataMessage`.
+
+    Parameters
+    ----------
+    kwargs :
+        Passed to :func:`write_dataset` for each data set.
+
+    Returns
+    -------
+    :class:`pyarrow.Table`
+        if `obj` has only one data set.
+    list of :class:`pyarrow.Table`
+        if `obj` has more than one data set.
+    """
+    kwargs.setdefault("dsd", obj.structure)
+    kwargs.setdefault("dataflow", obj.dataflow)
+
+    result = [writer.recurse(ds, *args, **kwargs) for ds in obj.data]
+    return result[0] if len(result) == 1 else result
+
+
+@writer
+def write_dataset(
+    obj: DataSet,
+    attributes="osgd",
+    dsd: Optional[model.DataStructureDefinition] = None,
+    dataflow: Optional[model.DataflowDefinition] = None,
+):
+    """Convert :class:`.DataSet` or :class:`.ColumnarDataSet`.
+
+    The table has one row per observation, and columns for:
+
+    - each dimension, in the order of the DSD. Each is a
+      :class:`pyarrow.DictionaryArray`. If the dimension is represented by a
+      :class:`.Codelist`, the dictionary contains the IDs of all its codes, in order,
+      followed by any other values that appear in the data; otherwise, the distinct
+      values in the data, sorted.
+    - ``value``, the observation values. The type is given by the
+      :class:`.FacetValueType` of the :class:`.PrimaryMeasure`; see :data:`FVT_MAP`.
+    - each attribute, if `attributes` is given. Attributes represented by a
+      :class:`.Codelist` are dictionary-encoded like dimensions; others are strings.
+
+    Each field has the metadata ``sdmx.role``: "dimension", "measure", or "attribute".
+    The schema metadata include the ID and URN of the DSD and dataflow, if known, as
+    ``sdmx.structure``, ``sdmx.structure.urn``, ``sdmx.dataflow``, and
+    ``sdmx.dataflow.urn``.
+
+    Parameters
+    ----------
+    attributes : str
+        Types of attributes to include, as for :func:`.to_pandas`: zero or more of
+        "o", "s", "g", and "d". Unlike :func:`.to_pandas`, the default is to include
+        all attributes.
+    dsd : .DataStructureDefinition, optional
+        Default: :attr:`.DataSet.structured_by`.
+    dataflow : .DataflowDefinition, optional
+        Default: :attr:`.DataSet.described_by`.
+    """
+    attributes = (attributes or "").lower()
+    if set(attributes) - {"o", "s", "g", "d"}:
+        raise ValueError(f"attributes must be in 'osgd'; got {attributes}")
+
+    if obj.structured_by is not None:
+        dsd = obj.structured_by
+    elif dsd is None:
+        dsd = model.DataStructureDefinition()
+    if obj.described_by is not None:
+        dataflow = obj.described_by
+
+    if isinstance(obj, model.ColumnarDataSet):
+        dims, values, attrs = _columnar_columns(obj, attributes)
+    else:
+        dims, values, attrs = _object_columns(obj, attributes)
+    n = len(values)
+
+    if "d" in attributes:
+        # One value for all observations
+        for id, av in obj.attrib.items():
+            attrs[id] = (np.zeros(n, dtype=np.intp), [_str(av.value)])
+
+    fields, arrays = [], []
+
+    def _add(id, array, role, cl=None):
+        metadata = {"sdmx.role": role}
+        if cl is not None:
+            metadata["sdmx.codelist"] = cl.id
+        fields.append(pa.field(id, array.type, metadata=metadata))
+        arrays.append(array)
+
+    for id, (codes, levels) in dims.items():
+        cl = _codelist(dsd.dimensions.get(id) if id in dsd.dimensions else None)
+        _add(id, _dictionary_array(codes, levels, cl), "dimension", cl)
+
+    measure = dsd.measures[0] if len(dsd.measures) else None
+    _add("value", _value_array(values, measure), "measure")
+
+    for id, (codes, levels) in attrs.items():
+        cl = _codelist(dsd.attributes.get(id) if id in dsd.attributes else None)
+        if cl is None:
+            array = pa.array(
+                np.array(levels + [None], dtype=object)[codes], type=pa.string()
+            )
+        else:
+            array = _dictionary_array(codes, levels, cl)
+        _add(id, array, "attribute", cl)
+
+    metadata = {}
+    for name, artefact in (("structure", dsd), ("dataflow", dataflow)):
+        if getattr(artefact, "id", None) is None:
+            continue
+        metadata[f"sdmx.{name}"] = artefact.id
+        try:
+            metadata[f"sdmx.{name}.urn"] = artefact.urn or urn.make(artefact)
+        except (KeyError, ValueError):
+            pass  # No maintainer
+
+    return pa.Table.from_arrays(arrays, schema=pa.schema(fields, metadata=metadata))
+
+
+# Type of columns for write_dataset(): integer codes for each observation, and the
+# values they refer to
+_Codes = Tuple[np.ndarray, List[str]]
+
+
+def _object_columns(
+    obj: DataSet, attributes: str
+) -> Tuple[Dict[str, _Codes], list, Dict[str, _Codes]]:
+    """Helper for :func:`write_dataset` to collect the columns of a :class:`.DataSet`.
+
+    Returns codes and levels for dimensions and attributes, and a list of values.
+    """
+    observations = list(obj.obs)
+
+    dims: Dict[str, _Codes] = {}
+    if observations:
+        # Same codes as for to_pandas(); the levels are sorted
+        index = _key_index(observations)
+        for name, level, codes in zip(index.names, index.levels, index.codes):
+            dims[name] = (np.asarray(codes, dtype=np.intp), list(level))
+
+    attrs: Dict[str, _Codes] = {}
+    if observations and attributes and attributes != "d":
+        for id, column in DataSet.attrib_columns(observations).items():
+            codes, levels = pd.factorize(
+                np.array(
+                    [None if av is None else _str(av.value) for av in column],
+                    dtype=object,
+                ),
+                sort=True,
+            )
+            attrs[id] = (codes, list(levels))
+
+    return dims, [obs.value for obs in observations], attrs
+
+
+def _columnar_columns(
+    obj: model.ColumnarDataSet, attributes: str
+) -> Tuple[Dict[str, _Codes], np.ndarray, Dict[str, _Codes]]:
+    """Helper for :func:`write_dataset` to collect the columns of a
+    :class:`.ColumnarDataSet`, without creating any :class:`.Observation`.
+    """
+    dims = {
+        id: (column.codes, list(column.levels))
+        for id, column in obj.dimension_columns.items()
+    }
+
+    attrs: Dict[str, _Codes] = {}
+    if attributes and attributes != "d":
+        # As in to_pandas(), attributes attached to groups take precedence over those
+        # attached to series, which take precedence over those attached to observations
+        for level in "osg":
+            for id, column in obj.attribute_columns.get(level, {}).items():
+                if id not in attrs:
+                    attrs[id] = (column.codes, list(column.levels))
+                    continue
+                # Combine the levels, then the codes
+                codes, levels = attrs[id]
+                merged = sorted(set(levels) | set(column.levels))
+                position = {value: i for i, value in enumerate(merged)}
+                old = np.array([position[v] for v in levels] + [-1])[codes]
+                new = np.array([position[v] for v in column.levels] + [-1])[
+                    column.codes
+                ]
+                attrs[id] = (np.where(column.codes >= 0, new, old), merged)
+
+    return dims, obj.obs_value, attrs
+
+
+def _str(value) -> str:
+    """Return the ID of a :class:`.Code`, or `value` as :class:`str`."""
+    return getattr(value, "id", None) or str(value)
+
+
+def _codelist(component: Optional[model.Component]) -> Optional[model.Codelist]:
+    """Return the :class:`.Codelist` that represents `component`, if any."""
+    concept = getattr(component, "concept_identity", None)
+    for representation in (
+        getattr(component, "local_representation", None),
+        getattr(concept, "core_representation", None),
+    ):
+        enum = getattr(representation, "enumerated", None)
+        if isinstance(enum, model.Codelist):
+            return enum
+    return None
+
+
+def _dictionary_array(codes, levels: List[str], cl: Optional[model.Codelist]):
+    """Return a :class:`pyarrow.DictionaryArray` for `codes`, which index `levels`.
+
+    If `cl` is given, the dictionary contains the IDs of its codes, then any of
+    `levels` that are not among them. Codes -1 are null.
+    """
+    dictionary = list(levels) if cl is None else list(cl.items.keys())
+    if cl is not None:
+        position = {id: i for i, id in enumerate(dictionary)}
+        for value in levels:
+            if value not in position:
+                # Not in the codelist; keep, rather than lose the value
+                position[value] = len(dictionary)
+                dictionary.append(value)
+        # The last element maps -1 to itself
+        remap = np.array([position[v] for v in levels] + [-1], dtype=np.int32)
+        codes = remap[codes]
+
+    codes = np.asarray(codes, dtype=np.int32)
+    indices = pa.array(codes, type=pa.int32(), mask=codes < 0)
+    return pa.DictionaryArray.from_arrays(
+        indices, pa.array(dictionary, type=pa.string())
+    )
+
+
+def _value_array(values, measure: Optional[model.PrimaryMeasure]):
+    """Return an array of observation `values`, typed from `measure`."""
+    cl = _codelist(measure)
+    if cl is not None:
+        codes, levels = pd.factorize(
+            np.array([None if v is None else _str(v) for v in values], dtype=object),
+            sort=True,
+        )
+        return _dictionary_array(codes, list(levels), cl)
+
+    try:
+        fvt = measure.local_representation.non_enumerated[0].value_type
+    except (AttributeError, IndexError):
+        fvt = None
+    type = FVT_MAP.get(fvt, "float64")
+
+    if type == "string":
+        return pa.array(
+            [None if v is None else _str(v) for v in values], type=pa.string()
+        )
+
+    if isinstance(values, np.ndarray) and values.dtype.kind == "f":
+        # From a ColumnarDataSet
+        numbers = values
+    else:
+        numbers = pd.to_numeric(pd.Series(values, dtype=object), errors="coerce")
+        if type == "float64" and numbers.isna().sum() > sum(v is None for v in values):
+            # Some values are not numbers, and the measure does not say they should be
+            return pa.array(
+                [None if v is None else _str(v) for v in values], type=pa.string()
+            )
+    return pa.array(numbers, from_pandas=True).cast(getattr(pa, type)())
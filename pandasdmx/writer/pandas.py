@@ -1,5 +1,5 @@
 from collections import defaultdict
-from itertools import chain
+from itertools import chain, compress, repeat
 from typing import Set, Union
 
 import numpy as np
@@ -269,7 +269,8 @@ def write_dataset(
     datetime : bool or str  or .Dimension or dict, optional
         If given, return a DataFrame with a :class:`~pandas.DatetimeIndex`
         or :class:`~pandas.PeriodIndex` as the index and all other dimensions
-        as columns. Valid `datetime` values include:
+        as columns. The time periods are parsed with :func:`parse_time_period`.
+        Valid `datetime` values include:
 
         - :class:`bool`: if :obj:`True`, determine the time dimension
           automatically by detecting a :class:`~.TimeDimension`.
@@ -282,9 +283,11 @@ def write_dataset(
           - **axis** (`{0 or 'index', 1 or 'columns'}`): axis on which to place
             the time dimension (default: 0).
           - **freq** (:obj:`True` or :class:`str` or :class:`~.Dimension`):
-            produce :class:`pandas.PeriodIndex`. If :class:`str`, the ID of a
-            Dimension containing a frequency specification. If a Dimension, the
-            specified dimension is used for the frequency specification.
+            produce :class:`pandas.PeriodIndex`. If :obj:`True`, the frequency is
+            given by the format of the time periods, e.g. "2020-Q1". If
+            :class:`str`, the ID of a Dimension containing a frequency
+            specification. If a Dimension, the specified dimension is used for the
+            frequency specification.
 
             Any Dimension used for the frequency specification  does not
             appear in the returned DataFrame.
@@ -301,6 +304,128 @@ def write_dataset(
     :class:`pandas.Series` with :class:`pandas.MultiIndex`
         Otherwise.
     """
+    attributes = _validate_attributes(attributes, kwargs)
+
+    observations = list(getattr(obj, "obs", obj))
+    if constraint and observations:
+        # Select Observations within the constraint, all at once
+        mask = constraint.mask([obs.key for obs in observations])
+        observations = list(compress(observations, mask))
+
+    # One index for all columns, in the order of the DSD
+    index = _key_index(observations) if observations else None
+
+    # Add value and attributes
+    data, indices = defaultdict(list), {}
+    if observations and dtype:
+        data["value"] = [obs.value for obs in observations]
+        indices["value"] = index
+    if observations and attributes and attributes != "d":
+        # attributes at levels obs, series and group, without creating a mapping for
+        # each observation
+        for k, column in DataSet.attrib_columns(observations).items():
+            present = [i for i, v in enumerate(column) if v is not None]
+            if len(present) == len(column):
+                data[k], indices[k] = column, index
+            else:
+                # Subset of the same index, without hashing the keys again
+                data[k], indices[k] = [column[i] for i in present], index[present]
+    if observations and isinstance(obj, DataSet) and attributes and "d" in attributes:
+        # attributes at dataset level
+        for k, v in obj.attrib.items():
+            data[k] = [v] * len(index)
+            indices[k] = index
+
+    # Check for a DSD
+    dsd = _check_dsd(dtypes_from_dsd, kwargs)
+    for col_name in data:
+        dt = _column_dtype(col_name, dtype, dtypes_from_dsd, dsd)
+        # For dtype category, we stringify the data
+        if dt == "category":
+            data[col_name] = map(str, data[col_name])
+        # Replace raw list with pd.Series
+        data[col_name] = pd.Series(
+            data[col_name], indices[col_name], dtype=dt, name=col_name
+        )
+
+    return _dataset_result(data, attributes, datetime, obj, kwargs)
+
+
+@writer
+def write_columnar_dataset(
+    obj: model.ColumnarDataSet,
+    attributes="",
+    dtype=np.float64,
+    constraint=None,
+    datetime=False,
+    dtypes_from_dsd=False,
+    **kwargs,
+):
+    """Convert :class:`~.ColumnarDataSet`.
+
+    The arguments and return values are the same as for :func:`write_dataset`, except:
+
+    - the index levels are the dimensions in :attr:`.ColumnarDataSet.dimension_columns`.
+    - if `attributes` contains any of 'o', 's', or 'g', attributes attached at all
+      three levels are returned; this is also the behaviour of :func:`write_dataset`.
+    """
+    attributes = _validate_attributes(attributes, kwargs)
+    dsd = _check_dsd(dtypes_from_dsd, kwargs)
+
+    # One index for all columns
+    columns = obj.dimension_columns
+    index = pd.MultiIndex(
+        levels=[c.levels for c in columns.values()],
+        codes=[c.codes for c in columns.values()],
+        names=list(columns.keys()),
+        verify_integrity=False,
+    )
+
+    # Observations to include
+    if constraint:
+        selected = constraint.mask(index)
+    else:
+        selected = np.ones(len(index), dtype=bool)
+
+    # Mapping from column name to (values, mask of observations with values)
+    data = {}
+    if dtype:
+        data["value"] = (obj.obs_value, np.ones(len(index), dtype=bool))
+
+    if attributes and attributes != "d":
+        # Attributes attached to groups take precedence over those attached to series,
+        # which take precedence over those attached to observations
+        for level in "osg":
+            for id, column in obj.attribute_columns.get(level, {}).items():
+                values, mask = data.setdefault(
+                    id,
+                    (np.full(len(index), None, dtype=object), np.zeros_like(selected)),
+                )
+                present = column.codes >= 0
+                values[present] = np.array(column.levels, dtype=object)[
+                    column.codes[present]
+                ]
+                mask |= present
+
+    if "d" in attributes:
+        # attributes at dataset level
+        for id, av in obj.attrib.items():
+            data[id] = (np.full(len(index), av, dtype=object), np.ones_like(selected))
+
+    for col_name, (values, mask) in list(data.items()):
+        dt = _column_dtype(col_name, dtype, dtypes_from_dsd, dsd)
+        mask = mask & selected
+        values = values[mask]
+        # For dtype category, we stringify the data
+        if dt == "category":
+            values = list(map(str, values))
+        data[col_name] = pd.Series(values, index[mask], dtype=dt, name=col_name)
+
+    return _dataset_result(data, attributes, datetime, obj, kwargs)
+
+
+def _validate_attributes(attributes, kwargs):
+    """Helper for :meth:`.write_dataset` to validate the `attributes` argument."""
     # If called directly on a DataSet (rather than a parent DataMessage),
     # cannot determine the "dimension at observation level"
     rtype = kwargs.setdefault("_rtype", "rows")
@@ -318,54 +443,72 @@ def write_dataset(
     elif set(attributes) - {"o", "s", "g", "d"}:
         raise ValueError(f"attributes must be in 'osgd'; got {attributes}")
 
-    # Iterate on observations
-    data, indices = defaultdict(list), defaultdict(list)
-    for observation in getattr(obj, "obs", obj):
-        # Check that the Observation is within the constraint, if any
-        key = observation.key.order()
-        if (not constraint) or key in constraint:
-            key = tuple(map(str, key.get_values()))
-            # Add value and attributes
-            if dtype:
-                data["value"].append(observation.value)
-                indices['value'].append(key)
-            if attributes and attributes != "d":
-                # attributes at levels obs, series and group
-                for k, v in             observation.attrib.items():
-                    data[k].append(v)
-                    indices[k].append(key)
-            if isinstance(obj, DataSet) and attributes and "d" in attributes:
-                # attributes at dataset level 
-                for k, v in             obj.attrib.items():
-                    data[k].append(v)
-                    indices[k].append(key)
+    return attributes
 
-    # Check for a DSD
+
+def _check_dsd(dtypes_from_dsd, kwargs):
+    """Helper for :meth:`.write_dataset` to retrieve the `dsd` argument."""
     dsd = kwargs.get("dsd")
     if dtypes_from_dsd and not isinstance(dsd, DataStructureDefinition):
         raise TypeError(f"If `dtypes_from_dsd` is True, \
         `dsd` must be a DataStructureDefinition object.\
         Got {type(dsd)}.")
-    for col_name in data:
-        if col_name == "value":
-            if dtypes_from_dsd:
-                dt = get_component_type(dsd.measures.get("OBS_VALUE")) 
-            else:
-                dt = dtype
-        else: # column for an attribute
-            if dtypes_from_dsd:
-                dt = get_component_type(dsd.attributes.get(col_name))
-            else:
-                dt = "object"
-        # Extract raw index tuples and values for this column
-        # For dtype category, we stringify the data
-        if dt == "category":
-            data[col_name] = map(str, data[col_name])
-        # Make pd index adding names
-        idx = pd.MultiIndex.from_tuples(
-            indices[col_name], names=observation.key.order().values.keys())
-        # Replace raw list with pd.Series
-        data[col_name] = pd.Series(data[col_name], idx, dtype=dt, name=col_name)
+    return dsd
+
+
+def _key_index(observations):
+    """Helper for :meth:`.write_dataset` to index `observations` by their keys.
+
+    Each dimension is factorized once into integer codes: first by identity of the
+    :class:`.KeyValue` objects, which are mostly shared between observations, and then
+    by the :class:`str` of their values. Missing values have code -1.
+    """
+    names = list(observations[0].key.order().values.keys())
+    key_values = [obs.key.values for obs in observations]
+    n = len(key_values)
+
+    levels, codes = [], []
+    for name in names:
+        try:
+            column = list(map(dict.__getitem__, key_values, repeat(name, n)))
+        except KeyError:
+            column = [kv.get(name) for kv in key_values]
+
+        # Codes for distinct objects, and one occurrence of each
+        obj_codes, uniques = pd.factorize(np.fromiter(map(id, column), np.intp, n))
+        first = np.empty(len(uniques), dtype=np.intp)
+        first[obj_codes] = np.arange(n)
+
+        # Codes for distinct values
+        values = [column[i] for i in first]
+        value_codes, level = pd.factorize(
+            np.array([None if v is None else str(v.value) for v in values], object),
+            sort=True,
+        )
+        levels.append(level)
+        codes.append(value_codes[obj_codes])
+
+    return pd.MultiIndex(
+        levels=levels, codes=codes, names=names, verify_integrity=False
+    )
+
+
+def _column_dtype(col_name, dtype, dtypes_from_dsd, dsd):
+    """Helper for :meth:`.write_dataset` to determine the dtype of a column."""
+    if col_name == "value":
+        if dtypes_from_dsd:
+            return get_component_type(dsd.measures.get("OBS_VALUE"))
+        else:
+            return dtype
+    else:  # column for an attribute
+        if dtypes_from_dsd:
+            return get_component_type(dsd.attributes.get(col_name))
+        else:
+            return "object"
+
+
+def _dataset_result(data, attributes, datetime, obj, kwargs):
+    """Helper for :meth:`.write_dataset` to assemble and reshape the result."""
     # Convert to pd.DataFrame if needed
     if attributes:
         result = pd.DataFrame.from_dict(data)
@@ -485,9 +628,10 @@ def _maybe_convert_datetime(df, arg, obj, dsd=None):
     # Unstack all but the time dimension and convert
     other_dims = list(filter(lambda d: d != param["dim"], df.index.names))
     df = df.unstack(other_dims)
-    df.index = pd.to_datetime(df.index)
+    # With freq=True, infer the frequency from the format of the time periods
+    df.index = parse_time_period(df.index, freq=param["freq"] is True)
 
-    if param["freq"]:
+    if param["freq"] and param["freq"] is not True:
         # Determine frequency string, Dimension, or Attribute
         try:
             # pandas version prior to 1.1.0
@@ -523,8 +667,9 @@ def _maybe_convert_datetime(df, arg, obj, dsd=None):
                     "cannot convert to PeriodIndex with " f"non-unique freq={values}"
                 )
 
-            # Store the unique value
+            # Store the unique value, e.g. "S" (semester) as a pandas frequency
             freq = values.pop()
+            freq = PERIOD_FREQ.get(freq, freq)
 
             # Remove the index level
             df.columns = df.columns.droplevel(i)
@@ -540,6 +685,148 @@ def _maybe_convert_datetime(df, arg, obj, dsd=None):
     return df
 
 
+#: Reporting periods in SDMX 2.1 (SDMX-ML Schema, ``ReportingTimePeriodType``), e.g.
+#: "2020-Q1": year, period type, and number of the period in the year.
+_REPORTING_PERIOD = r"^(\d{4})-([ASTQMWD])(\d{1,3})$"
+
+#: Gregorian time periods, by length: format, and type of period as in
+#: :data:`PERIOD_FREQ`.
+_GREGORIAN_PERIOD = {4: ("%Y", "A"), 7: ("%Y-%m", "M"), 10: ("%Y-%m-%d", "D")}
+
+#: Number of months in each type of reporting period that is measured in months.
+_PERIOD_MONTHS = {"A": 12, "S": 6, "T": 4, "Q": 3, "M": 1}
+
+#: :mod:`pandas` frequency for each type of reporting period. Also used for the
+#: Gregorian periods: year ("A"), year-month ("M") and date ("D").
+PERIOD_FREQ = {
+    "A": "A",
+    "S": "6M",
+    "T": "4M",
+    "Q": "Q",
+    "M": "M",
+    "W": "W",
+    "D": "D",
+}
+
+
+def parse_time_period(values, freq=False) -> Union[pd.DatetimeIndex, pd.PeriodIndex]:
+    """Parse SDMX time periods.
+
+    Each distinct value in `values` is parsed once; the results are mapped back to
+    `values` using integer codes. Values can be in any of the SDMX formats, mixed:
+
+    - Gregorian periods: "2020", "2020-01", or "2020-01-31".
+    - Reporting periods: "2020-A1", "2020-S2" (semester), "2020-T3" (trimester),
+      "2020-Q4", "2020-M12", "2020-W53" (ISO 8601 week), or "2020-D366".
+    - Anything else understood by :func:`pandas.to_datetime`, e.g. date-times.
+
+    Parameters
+    ----------
+    values : array-like of str
+    freq : bool or str, optional
+        If :obj:`True`, return a :class:`pandas.PeriodIndex` with the frequency given
+        by the format of `values`; see :data:`PERIOD_FREQ`. If a :mod:`pandas`
+        frequency string, return a PeriodIndex with that frequency.
+
+    Returns
+    -------
+    pandas.DatetimeIndex
+        with the start of each period, if `freq` is :obj:`False`.
+    pandas.PeriodIndex
+        otherwise.
+
+    Raises
+    ------
+    ValueError
+        If `freq` is :obj:`True`, and `values` have different or unknown frequencies.
+    """
+    name = getattr(values, "name", None)
+    codes, uniques = pd.factorize(np.asarray(values, dtype=object))
+    if pd.api.types.infer_dtype(uniques, skipna=True) != "string":
+        # E.g. already datetime
+        starts, freqs = pd.DatetimeIndex(pd.to_datetime(uniques)), pd.Series([None])
+    else:
+        starts, freqs = _parse_time_period(pd.Series(uniques, dtype=object))
+
+    result = starts.take(codes, allow_fill=True, fill_value=pd.NaT).rename(name)
+
+    if freq is True:
+        found = sorted(set(freqs.dropna()))
+        if len(found) != 1 or freqs.isna().any():
+            raise ValueError(
+                f"cannot convert to PeriodIndex with non-unique freq={found}"
+            )
+        freq = PERIOD_FREQ[found[0]]
+
+    return result.to_period(freq=freq) if freq else result
+
+
+def _parse_time_period(values: pd.Series):
+    """Helper for :func:`parse_time_period`.
+
+    Returns a :class:`pandas.DatetimeIndex` with the start of each period in `values`,
+    and a :class:`pandas.Series` with the type of each period; see :data:`PERIOD_FREQ`.
+    """
+    parts = []
+    freqs = pd.Series(None, index=values.index, dtype=object)
+
+    # Reporting periods
+    match = values.str.extract(_REPORTING_PERIOD)
+    rp = match[0].notna()
+    if rp.any():
+        year, kind = match.loc[rp, 0].astype(int), match.loc[rp, 1]
+        n = match.loc[rp, 2].astype(int)
+        freqs[rp] = kind
+
+        # Periods measured in months
+        months = kind.map(_PERIOD_MONTHS)
+        m = months.notna()
+        if m.any():
+            # Raises ValueError for e.g. "2020-Q5"
+            parts.append(
+                pd.to_datetime(
+                    pd.DataFrame(
+                        dict(
+                            year=year[m],
+                            month=((n[m] - 1) * months[m] + 1).astype(int),
+                            day=1,
+                        )
+                    )
+                )
+            )
+
+        # Weeks: from the Monday of the week containing 4 January
+        w = kind == "W"
+        if w.any():
+            jan4 = pd.to_datetime(pd.DataFrame(dict(year=year[w], month=1, day=4)))
+            parts.append(
+                jan4 - pd.to_timedelta(jan4.dt.weekday - 7 * (n[w] - 1), unit="D")
+            )
+
+        # Days
+        d = kind == "D"
+        if d.any():
+            jan1 = pd.to_datetime(pd.DataFrame(dict(year=year[d], month=1, day=1)))
+            parts.append(jan1 + pd.to_timedelta(n[d] - 1, unit="D"))
+
+    # Gregorian periods, by length
+    other = values[~rp]
+    lengths = other.str.len()
+    gregorian = other.str.match(r"^\d{4}(-\d{2}(-\d{2})?)?$")
+    for length, (format, kind) in _GREGORIAN_PERIOD.items():
+        g = gregorian & (lengths == length)
+        if g.any():
+            parts.append(pd.to_datetime(other[g], format=format))
+            freqs[g[g].index] = kind
+
+    # Anything else
+    if (~gregorian).any():
+        parts.append(pd.to_datetime(other[~gregorian]))
+
+    result = pd.concat(parts).reindex(values.index) if parts else values
+    return pd.DatetimeIndex(result), freqs
+
+
 @writer
 def _dd(obj: model.DimensionDescriptor):
     """Convert :class:`.DimensionDescriptor`."""
@@ -0,0 +1,258 @@
+"""Write SDMX data to partitioned Parquet data sets.
+
+Requires `pyarrow <https://arrow.apache.org/docs/python/>`_.
+"""
+import logging
+from io import BytesIO
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from pandasdmx import message, model
+from pandasdmx.util import BaseModel
+from pandasdmx.writer.arrow import HAS_PYARROW, _codelist, to_arrow
+from pandasdmx.writer.xml import to_xml
+
+if HAS_PYARROW:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+
+log = logging.getLogger(__name__)
+
+#: Key in the schema metadata of each Parquet file for the SDMX-ML structure message
+#: containing the DSD, its codelists and concept schemes, and the dataflow.
+STRUCTURE_KEY = "sdmx.structure.xml"
+
+
+def to_parquet(
+    obj,
+    base_dir,
+    partition_by: Sequence[str] = (),
+    *,
+    attributes="osgd",
+    dsd: Optional[model.DataStructureDefinition] = None,
+    dataflow: Optional[model.DataflowDefinition] = None,
+    row_group_size: Optional[int] = None,
+    existing_data_behavior: str = "overwrite_or_ignore",
+    basename_template: str = "part-{n}-{i}.parquet",
+    **kwargs,
+) -> List[str]:
+    """Write SDMX data in `obj` to a Hive-partitioned Parquet data set in `base_dir`.
+
+    Each data set is converted with :func:`.to_arrow`, and written with
+    :func:`pyarrow.dataset.write_dataset` to one directory per distinct combination of
+    the dimensions in `partition_by`, e.g. :file:`base_dir/FREQ=A/REF_AREA=FR/`.
+    Queries that filter on these dimensions read only the matching directories::
+
+        >>> to_parquet(msg, "exr", ["FREQ", "CURRENCY"])
+        >>> pyarrow.dataset.dataset("exr", partitioning="hive").to_table(
+        ...     filter=pyarrow.dataset.field("CURRENCY") == "JPY")
+
+    The DSD, the codelists and concept schemes it uses, and the dataflow are written
+    as an SDMX-ML structure message to the schema metadata of every file, with the
+    key :data:`STRUCTURE_KEY`, and to :file:`base_dir/_common_metadata`. Recover them
+    with :func:`read_structure`.
+
+    Parameters
+    ----------
+    obj : .DataMessage or .DataSet or iterable
+        Data to write. An iterable, e.g. a generator of the results of repeated calls
+        to :meth:`.Request.get`, may contain any number of data messages and data sets;
+        each is written in turn, without holding all of them in memory.
+    base_dir : str or path-like
+        Root directory of the Parquet data set.
+    partition_by : sequence of str
+        IDs of dimensions to partition by. Dimensions not in `partition_by` are
+        columns in the files.
+    attributes, dsd, dataflow :
+        Passed to :func:`.to_arrow`.
+    row_group_size : int, optional
+        Number of rows in each Parquet row group. By default, the same as for
+        :func:`pyarrow.dataset.write_dataset`.
+    existing_data_behavior : str
+        What to do with files already in `base_dir`, for the first data set in `obj`.
+        See :func:`pyarrow.dataset.write_dataset`. Subsequent data sets in `obj` never
+        delete data written from earlier ones.
+    basename_template : str
+        Name of each file. "{n}" is replaced with the position of the data set in
+        `obj`, and "{i}" with a number given by :mod:`pyarrow`.
+    kwargs :
+        Passed to :func:`pyarrow.dataset.write_dataset`, e.g. `filesystem` or
+        `max_rows_per_file`.
+
+    Returns
+    -------
+    list of str
+        Paths of the Parquet files written.
+
+    Raises
+    ------
+    ValueError
+        If any of `partition_by` is not a dimension of the data.
+    """
+    if not HAS_PYARROW:  # pragma: no cover
+        raise ImportError("to_parquet() requires pyarrow")
+
+    if row_group_size is not None:
+        kwargs.update(
+            max_rows_per_group=row_group_size, min_rows_per_group=row_group_size
+        )
+
+    paths: List[str] = []
+    schema = None
+    structures: dict = {}
+
+    for n, (table, structure) in enumerate(
+        _tables(obj, attributes=attributes, dsd=dsd, dataflow=dataflow)
+    ):
+        missing = set(partition_by) - set(table.column_names)
+        if missing:
+            raise ValueError(f"cannot partition by {sorted(missing)}; not in the data")
+
+        # Embed the structures, converting each only once. Keep references to them,
+        # so that their id() is not reused by other objects.
+        key = tuple(map(id, structure))
+        if key not in structures:
+            structures[key] = (structure, _structure_xml(*structure))
+        xml = structures[key][1]
+        if xml is not None:
+            table = table.replace_schema_metadata(
+                {**(table.schema.metadata or {}), STRUCTURE_KEY.encode(): xml}
+            )
+
+        # Partition directories are named by value: store plain strings in the
+        # partitioning schema, rather than dictionaries that differ between data sets
+        partitioning_fields = []
+        for id_ in partition_by:
+            i = table.schema.get_field_index(id_)
+            field = table.schema.field(i)
+            table = table.set_column(
+                i, field.with_type(pa.string()), table.column(i).cast(pa.string())
+            )
+            partitioning_fields.append(table.schema.field(i))
+
+        ds.write_dataset(
+            table,
+            base_dir,
+            format="parquet",
+            partitioning=ds.partitioning(pa.schema(partitioning_fields), flavor="hive")
+            if partitioning_fields
+            else None,
+            basename_template=basename_template.replace("{n}", str(n)),
+            existing_data_behavior=existing_data_behavior
+            if n == 0
+            else "overwrite_or_ignore",
+            file_visitor=lambda written: paths.append(written.path),
+            **kwargs,
+        )
+        schema = schema or table.schema
+
+    if schema is not None:
+        _write_common_metadata(schema, base_dir, kwargs.get("filesystem"))
+
+    return paths
+
+
+def read_structure(source) -> Optional[message.StructureMessage]:
+    """Read the structures embedded by :func:`to_parquet`.
+
+    Parameters
+    ----------
+    source : str or path-like
+        A Parquet file, or the `base_dir` of a data set written by
+        :func:`to_parquet`.
+
+    Returns
+    -------
+    .StructureMessage
+        or :obj:`None`, if `source` has no embedded structures.
+    """
+    # Not at the top of the module: pandasdmx.reader imports pandasdmx.writer
+    from pandasdmx.reader import read_sdmx
+
+    path = Path(source)
+    if path.is_dir():
+        path = path / "_common_metadata"
+    metadata = pq.read_schema(path).metadata or {}
+    xml = metadata.get(STRUCTURE_KEY.encode())
+    return None if xml is None else read_sdmx(BytesIO(xml), format="XML")
+
+
+# Structures written with each table: the DSD and dataflow, if any
+_Structure = Tuple[
+    Optional[model.DataStructureDefinition], Optional[model.DataflowDefinition]
+]
+
+
+def _tables(obj, **kwargs) -> Iterator[Tuple["pa.Table", _Structure]]:
+    """Yield a :class:`pyarrow.Table` for each data set in `obj`."""
+    if isinstance(obj, message.DataMessage):
+        kwargs = dict(kwargs)
+        if kwargs["dsd"] is None:
+            kwargs["dsd"] = obj.structure
+        if kwargs["dataflow"] is None:
+            kwargs["dataflow"] = obj.dataflow
+        for ds_ in obj.data:
+            yield from _tables(ds_, **kwargs)
+    elif isinstance(obj, model.DataSet):
+        structure = (
+            kwargs["dsd"] if obj.structured_by is None else obj.structured_by,
+            kwargs["dataflow"] if obj.described_by is None else obj.described_by,
+        )
+        yield to_arrow(obj, **kwargs), structure
+    elif isinstance(obj, Iterable) and not isinstance(obj, (str, BaseModel)):
+        for item in obj:
+            yield from _tables(item, **kwargs)
+    else:
+        raise TypeError(f"cannot write {type(obj).__name__} to Parquet")
+
+
+def _structure_xml(
+    dsd: Optional[model.DataStructureDefinition],
+    dataflow: Optional[model.DataflowDefinition],
+) -> Optional[bytes]:
+    """Return SDMX-ML for `dsd` and related structures, or :obj:`None` if it cannot
+    be written.
+    """
+    if not _identified(dsd):
+        return None
+
+    msg = message.StructureMessage()
+    msg.add(dsd)
+    if _identified(dataflow):
+        msg.add(dataflow)
+    for component in list(dsd.dimensions) + list(dsd.attributes) + list(dsd.measures):
+        # Codelists and concept schemes referenced, but not described, by a message
+        # have no ID; leave these out
+        cl = _codelist(component)
+        if _identified(cl) and cl.id not in msg.codelist:
+            msg.add(cl)
+        cs = getattr(component.concept_identity, "parent", None)
+        if (
+            isinstance(cs, model.ConceptScheme)
+            and _identified(cs)
+            and cs.id not in msg.concept_scheme
+        ):
+            msg.add(cs)
+
+    try:
+        return to_xml(msg)
+    except (AttributeError, KeyError, NotImplementedError, ValueError) as e:
+        # E.g. a DSD without a maintainer, from a structure-specific message read
+        # without a DSD
+        log.info(f"Structures not embedded in Parquet metadata: {e!r}")
+        return None
+
+
+def _identified(obj) -> bool:
+    """Return :obj:`True` if `obj` is an :class:`.IdentifiableArtefact` with an ID."""
+    id = getattr(obj, "id", None)
+    return id is not None and id != model.MissingID
+
+
+def _write_common_metadata(schema, base_dir, filesystem=None):
+    """Write `schema` to :file:`base_dir/_common_metadata`, for readers of the whole
+    data set.
+    """
+    kwargs = {} if filesystem is None else dict(filesystem=filesystem)
+    pq.write_metadata(schema, f"{base_dir}/_common_metadata", **kwargs)